@@ -217,7 +217,8 @@ class LocalCache:
             logger.warning(f"local cache get failed for '{url}': {type(error).__name__} - {error}")
             return None
 
-    def put(self, url: str, content, directive: Optional[CacheDirective] = None) -> bool:
+    def put(self, url: str, content, directive: Optional[CacheDirective] = None,
+            file_type: str = "remote-content") -> bool:
         """Store or refresh cached content for ``url``, resetting its last-fetch time.
 
         A ``CACHE_NEVER`` directive stores nothing (the content is used but not cached).
@@ -227,6 +228,9 @@ class LocalCache:
             content (str | bytes, required): The fetched content to cache.
             directive (CacheDirective | None, optional): Caching directive; defaults
                 to :meth:`CacheDirective.default`.
+            file_type (str, optional): The ``filecache`` file type recorded for the
+                entry. Defaults to "remote-content"; derived content stored under a
+                synthetic key (e.g. a resolved profile) names its own type.
 
         Returns:
             bool: True when stored, False when skipped or on error.
@@ -243,7 +247,7 @@ class LocalCache:
             attributes = {
                 "filename": os.path.basename(url.split("?")[0]) or "remote-content",
                 "original_location": url,
-                "file_type": "remote-content",
+                "file_type": file_type,
                 "acquired": time.time(),
             }
             db.cache_file(content, cache_uuid, attributes)
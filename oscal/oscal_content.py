@@ -29,7 +29,7 @@ from contextlib         import contextmanager
 import yaml
 import uuid
 import logging
-from typing             import Optional, Any, Literal, Protocol, runtime_checkable
+from typing             import Optional, Any, Iterator, Literal, Protocol, runtime_checkable
 from datetime           import datetime
 from functools          import wraps
 from enum               import Enum, IntEnum
@@ -48,7 +48,7 @@ from .oscal_registry    import get_registry
 from .oscal_cache       import get_local_cache, CacheDirective, CACHE_NEVER
 from .oscal_converter   import (
     oscal_markdown_to_html, OSCALConverter, _html_to_et, _markup_to_md,
-    OSCALPath, native_path,
+    IdIndex, OSCALPath, PropIndex, native_path,
 )
 
 logger = logging.getLogger(__name__)
@@ -149,28 +149,57 @@ def _check_datatype(value: str, datatype: str, location: str, field: str) -> dic
     when the value is acceptable (including when no applicable pattern is defined).
     Patterns that fail to compile are silently skipped.
     """
-    type_info = OSCAL_DATATYPES.get(datatype)
-    if not type_info:
-        return None
-    pattern = type_info.get("json-pattern", "")
-    if not pattern:
+    check = _datatype_check(datatype)
+    if check is None or check.regex.fullmatch(value) is not None:
         return None
+    return check.error(value, location, field)
+
+
+@dataclass(frozen=True)
+class _DatatypeCheck:
+    """A datatype's ``json-pattern``, compiled once and reused for every value check."""
+    datatype: str
+    pattern: str
+    regex: re.Pattern
+    description: str
+
+    def error(self, value: str, location: str, field: str) -> dict:
+        """Return the structured ``invalid-type`` error for *value*."""
+        return {
+            "error-type": "invalid-type",
+            "location":   location,
+            "field":      field,
+            "value":      value,
+            "expected": {
+                "type":        self.datatype,
+                "pattern":     self.pattern,
+                "description": self.description,
+            },
+        }
+
+
+# Compiled datatype patterns. Key: datatype name  Value: _DatatypeCheck, or None when
+# the datatype has no usable pattern (unknown, empty, or failing to compile).
+_datatype_check_cache: dict[str, Optional[_DatatypeCheck]] = {}
+
+
+def _datatype_check(datatype: str) -> Optional[_DatatypeCheck]:
+    """Return the compiled pattern check for *datatype*, or None when there is none."""
     try:
-        if re.fullmatch(pattern, value) is None:
-            return {
-                "error-type": "invalid-type",
-                "location":   location,
-                "field":      field,
-                "value":      value,
-                "expected": {
-                    "type":        datatype,
-                    "pattern":     pattern,
-                    "description": type_info.get("documentation", ""),
-                },
-            }
-    except re.error:
+        return _datatype_check_cache[datatype]
+    except KeyError:
         pass
-    return None
+    check = None
+    type_info = OSCAL_DATATYPES.get(datatype)
+    pattern = type_info.get("json-pattern", "") if type_info else ""
+    if pattern:
+        try:
+            check = _DatatypeCheck(datatype, pattern, re.compile(pattern),
+                                   type_info.get("documentation", ""))
+        except re.error:
+            check = None
+    _datatype_check_cache[datatype] = check
+    return check
 
 
 _OSCAL_NS = "http://csrc.nist.gov/ns/oscal" # OSCAL default namespace for props, parts and any other `ns` qualified elements.
@@ -202,6 +231,260 @@ def _constraint_conditions_met(constraint: dict, instance: dict) -> bool:
     return True
 
 
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Compiled validation plans
+#
+# ``OSCAL._walk_instance`` runs against a per-node plan compiled from the metaschema
+# index instead of the raw index dicts: flags and children are pre-partitioned by
+# structure-type, allowed-value sets are frozen, datatype patterns are compiled and
+# choice members are pre-flattened. Node plans are compiled lazily on first visit and
+# held in one ValidationPlan per (version, model), rebuilt when the index is refreshed.
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+class _AllowedValuesCheck:
+    """One enforced (``allow-other`` false) allowed-values constraint on a flag."""
+    __slots__ = ("constraint", "has_conditions", "values", "one_of")
+
+    def __init__(self, constraint: dict):
+        values = constraint.get("values", [])
+        self.constraint = constraint
+        self.has_conditions = bool(constraint.get("conditions"))
+        self.values = frozenset(v["value"] for v in values)
+        self.one_of = tuple(
+            (v["value"], v.get("description", ""))
+            for v in sorted(values, key=lambda x: x["value"])
+        )
+
+    def expected(self) -> dict:
+        """Return a fresh ``expected`` payload for an ``allowed-values`` error."""
+        return {"one-of": [{"enum": value, "description": desc} for value, desc in self.one_of]}
+
+
+class _NodePlan:
+    """Validation tables for one metaschema index node.
+
+    Attributes:
+        flags (tuple): ``(name, required, datatype_check, allowed_values_checks)`` per flag.
+        children (tuple): ``(name, json_key, required, min, max, datatype_check, node)``
+            per field/assembly child; only fields carry a datatype check, and ``node`` is
+            the child's index node.
+        choices (tuple): ``(keys, required)`` per choice, nested choices flattened.
+    """
+    __slots__ = ("node", "flags", "children", "choices")
+
+    def __init__(self, node: dict):
+        self.node = node
+        flags: list[tuple] = []
+        children: list[tuple] = []
+        choices: list[tuple] = []
+        for child in node.get("children", []):
+            stype = child.get("structure-type")
+            if stype == "flag":
+                name = child.get("use-name") or child.get("name")
+                if not name:
+                    continue
+                datatype = child.get("datatype")
+                checks = tuple(
+                    _AllowedValuesCheck(c) for c in child.get("constraints", [])
+                    if c.get("type") == "allowed-values" and not c.get("allow-other", False)
+                )
+                flags.append((name, child.get("min-occurs") == "1",
+                              _datatype_check(datatype) if datatype else None, checks))
+            elif stype == "choice":
+                choices.append(_compile_choice(child))
+            elif stype not in ("any", "recursive"):
+                name = child.get("use-name") or child.get("name")
+                if not name:
+                    continue
+                min_occurs = child.get("min-occurs", "0")
+                max_occurs = child.get("max-occurs", "unbounded")
+                datatype = child.get("datatype") if stype == "field" else None
+                children.append((
+                    name,
+                    child.get("group-as") or name,
+                    min_occurs == "1",
+                    int(min_occurs),
+                    None if max_occurs == "unbounded" else int(max_occurs),
+                    _datatype_check(datatype) if datatype else None,
+                    child,
+                ))
+        self.flags = tuple(flags)
+        self.children = tuple(children)
+        self.choices = tuple(c for c in choices if c is not None)
+
+
+def _compile_choice(choice_node: dict) -> Optional[tuple]:
+    """Return ``(keys, required)`` for a choice node, or None when it has no members.
+
+    Nested choices are flattened into the same mutually-exclusive group.
+    """
+    members: list[dict] = []
+
+    def _collect(node: dict) -> None:
+        for m in node.get("children", []):
+            if m.get("structure-type") == "choice":
+                _collect(m)  # flatten nested choices into one group
+            else:
+                members.append(m)
+
+    _collect(choice_node)
+    if not members:
+        return None
+    keys = tuple((m.get("group-as") or m.get("use-name") or m.get("name")) for m in members)
+    required = all((m.get("min-occurs") or "0") == "1" for m in members)
+    return keys, required
+
+
+class ValidationPlan:
+    """Compiled validator for one metaschema index (one OSCAL version and model).
+
+    Node plans are compiled on first use and memoized by node identity; the plan
+    holds a reference to every compiled node so identities stay stable.
+    """
+
+    def __init__(self, index: Optional[dict] = None):
+        self.index = index
+        self._plans: dict[int, _NodePlan] = {}
+
+    def node_plan(self, node: dict) -> _NodePlan:
+        """Return the compiled plan for index *node*, compiling it on first use."""
+        plan = self._plans.get(id(node))
+        if plan is None or plan.node is not node:
+            plan = _NodePlan(node)
+            self._plans[id(node)] = plan
+        return plan
+
+
+# Module-level cache of compiled validation plans.
+# Key: (version, model)  Value: ValidationPlan (rebuilt when its index object changes)
+_validation_plan_cache: dict[tuple, ValidationPlan] = {}
+
+
+def get_validation_plan(version: str, model: str, index: Optional[dict]) -> ValidationPlan:
+    """Return the cached ValidationPlan for *version*/*model*, built from *index*.
+
+    The plan is reused for as long as ``get_metaschema_index()`` keeps returning the
+    same index object, and rebuilt when the index is refreshed. Without an index
+    (``None``) an uncached plan is returned.
+
+    Args:
+        version (str, required): OSCAL version string, e.g. ``"v1.1.3"``.
+        model (str, required): OSCAL model name, e.g. ``"catalog"``.
+        index (dict, optional): The model's metaschema index, as returned by
+            ``OSCALSupport.get_metaschema_index()``.
+
+    Returns:
+        ValidationPlan: The compiled plan.
+    """
+    if index is None:
+        return ValidationPlan()
+    key = (version, model)
+    plan = _validation_plan_cache.get(key)
+    if plan is None or plan.index is not index:
+        plan = ValidationPlan(index)
+        _validation_plan_cache[key] = plan
+    return plan
+
+
+def _walk_plan(instance: dict, node_plan: _NodePlan, plan: ValidationPlan,
+               errors: list[dict], location: str) -> None:
+    """Walk *instance* against a compiled node plan; see ``OSCAL._walk_instance``."""
+    # Flags: structure → data-type → allowed-values
+    for flag_name, required, dt_check, av_checks in node_plan.flags:
+        if flag_name not in instance:
+            if required:
+                errors.append({
+                    "error-type": "missing-required",
+                    "location":   location,
+                    "field":      f"@{flag_name}",
+                    "value":      None,
+                    "expected":   {},
+                })
+            continue
+
+        flag_val = instance[flag_name]
+        if dt_check is not None and isinstance(flag_val, str) and flag_val \
+                and dt_check.regex.fullmatch(flag_val) is None:
+            errors.append(dt_check.error(flag_val, location, f"@{flag_name}"))
+
+        for av in av_checks:
+            if av.has_conditions and not _constraint_conditions_met(av.constraint, instance):
+                continue
+            if flag_val not in av.values:
+                errors.append({
+                    "error-type": "allowed-values",
+                    "location":   location,
+                    "field":      f"@{flag_name}",
+                    "value":      flag_val,
+                    "expected":   av.expected(),
+                })
+
+    # Non-flag children: structure → data-type (fields) → recurse
+    for child_name, json_key, required, min_int, max_int, dt_check, child_node in node_plan.children:
+        child_val = instance.get(json_key)
+        if child_val is None:
+            if required:
+                errors.append({
+                    "error-type": "missing-required",
+                    "location":   location,
+                    "field":      child_name,
+                    "value":      None,
+                    "expected":   {},
+                })
+            continue
+
+        child_loc = f"{location}/{json_key}"
+
+        if dt_check is not None and isinstance(child_val, str) and child_val \
+                and dt_check.regex.fullmatch(child_val) is None:
+            errors.append(dt_check.error(child_val, location, child_name))
+
+        if isinstance(child_val, list):
+            actual = len(child_val)
+            if actual < min_int or (max_int is not None and actual > max_int):
+                errors.append({
+                    "error-type": "cardinality",
+                    "location":   location,
+                    "field":      child_name,
+                    "value":      actual,
+                    "min":        min_int,
+                    "max":        max_int,
+                })
+            child_plan = plan.node_plan(child_node)
+            for i, item in enumerate(child_val):
+                if isinstance(item, dict):
+                    _walk_plan(item, child_plan, plan, errors, f"{child_loc}[{i}]")
+        elif isinstance(child_val, dict):
+            _walk_plan(child_val, plan.node_plan(child_node), plan, errors, child_loc)
+
+    # Choice groups: mutually exclusive members (at most one), and a member
+    # required when every member is min-occurs="1"
+    for choice in node_plan.choices:
+        _check_compiled_choice(instance, choice, errors, location)
+
+
+def _check_compiled_choice(instance: dict, choice: tuple, errors: list[dict], location: str) -> None:
+    """Apply a compiled ``(keys, required)`` choice to *instance*; see ``OSCAL._check_choice``."""
+    keys, required = choice
+    present = [k for k in keys if k and k in instance]
+    if required and len(present) == 0:
+        errors.append({
+            "error-type": "choice",
+            "location":   location,
+            "field":      list(keys),
+            "value":      0,
+            "expected":   {"select-one-of": list(keys)},
+        })
+    elif len(present) > 1:
+        errors.append({
+            "error-type": "choice",
+            "location":   location,
+            "field":      present,
+            "value":      len(present),
+            "expected":   {"mutually-exclusive": list(keys)},
+        })
+
+
 # Progressive content validation states. Each level implies all prior levels passed.
 class ContentState(IntEnum):
     """Progressive content-processing state; each level implies all prior levels passed.
@@ -294,7 +577,8 @@ def if_update_successful(fn):
     """Decorator marking content dirty after a successful mutation.
 
     Wraps a mutation method; when it returns a non-None result, sets
-    ``self.is_unsaved = True`` and updates ``self.last_modified``.
+    ``self.is_unsaved = True``, updates ``self.last_modified`` and bumps the
+    content version.
 
     Args:
         fn (Callable, required): The mutation method to wrap.
@@ -308,6 +592,7 @@ def if_update_successful(fn):
         if result is not None:
             self.is_unsaved = True
             self.last_modified = oscal_date_time_with_timezone()
+            self._content_changed()
             self._on_content_mutated()
         return result
     return wrapper
@@ -415,6 +700,11 @@ class OSCAL:
             is_editable: True if the content can be modified, False otherwise
 
     """
+
+    # Bumped whenever any document's import list or root UUID changes. Import-object
+    # directories (see _import_directory) record the value they were built under, so
+    # a change anywhere in a shared import graph invalidates every directory over it.
+    _import_generation: int = 0
     def __init_common__(self, ttl: int = 0, support_db_conn: str = "", support_db_type: str = ""):
 
         logger.debug("Initializing common OSCAL class properties...")
@@ -453,9 +743,19 @@ class OSCAL:
         # Processing Objects
         self.import_list: list = []    # Flat list of direct imports (one level)
         self._import_tree: dict | None = None  # Cached recursive import tree (None = not yet built)
+        self._import_objects: tuple | None = None  # Cached (objects, uuid → object) directory
+        self._import_objects_generation: int = -1  # _import_generation it was built under
         self._dict: dict | None = None # JSON/YAML constructs
         self._tree = None              # XML constructs
+        # Content version: bumped by every mutation of _dict (see _content_changed).
+        # Derived representations are cached against it and rebuilt only when it moves.
+        self._content_version: int = 0
+        self._tree_version: int = -1   # content version _tree was built from
+        self._serialized: dict[tuple, tuple[int, str]] = {}  # (format, pretty_print) → (version, text)
         self._oscal_path: OSCALPath | None = None  # Lazily built metaschema-aware path engine
+        self._id_index: IdIndex | None = None      # Lazily built id/uuid index of _dict (see _document_id_index)
+        self._prop_index: PropIndex | None = None  # Opt-in prop index of _dict (see enable_prop_index)
+        self._indexes_version: int = -1            # content version the id/prop indexes were patched for
         # Object registry (identity map) — composite content-identity key captured at load,
         # shared instance used to dedup imports across the tree. Default is the process-global.
         self._identity: tuple | None = None
@@ -815,6 +1115,11 @@ class OSCAL:
             return False
 
         logger.debug(f"Writing content as {filename} in OSCAL {format.upper()} format.")
+        if format.lower() == "xml" and self._dict is not None:
+            cached = self._serialized.get(("xml", pretty_print))
+            if cached is None or cached[0] != self._content_version:
+                return self._dump_xml_stream(filename)
+
         content = self.dumps(format=format, pretty_print=pretty_print)
 
         if not content:
@@ -830,6 +1135,33 @@ class OSCAL:
 
         return status
 
+    # -------------------------------------------------------------------------
+    def _dump_xml_stream(self, filename: str) -> bool:
+        """Write ``_dict`` to *filename* as XML through the streaming converter writer.
+
+        The document is emitted element by element straight to the file, so no XML
+        tree or full-size XML string is built. The output matches :meth:`dumps`
+        (XML output is always indented).
+
+        Args:
+            filename (str, required): Path to write to; its directory must exist.
+
+        Returns:
+            bool: True if the write succeeded, False otherwise.
+        """
+        converter = OSCALConverter.from_support(self.model, self.oscal_version, self._support)
+        if converter is None:
+            logger.error(f"No metaschema converter for {self.model} {self.oscal_version}; cannot write XML.")
+            return False
+        try:
+            with open(filename, mode="w", encoding="utf-8") as fh:
+                converter.write_xml(self._dict, fh, pretty_print=True)
+        except (OSError, ValueError) as error:
+            logger.error(f"{type(error).__name__} saving {filename}: {error}")
+            return False
+        logger.info(f"Content successfully written to {filename}.")
+        return True
+
     # -------------------------------------------------------------------------
     def __repr__(self):
         """A concise string representation showing key metadata and validation status."""
@@ -1020,6 +1352,7 @@ class OSCAL:
             )
             target_entry.setdefault("href_list", []).append(retry_item)
             self._import_tree = None
+            self._imports_changed()
             self._refresh_content_state()
             return False
 
@@ -1062,6 +1395,7 @@ class OSCAL:
             )
         target_entry.setdefault("href_list", []).append(retry_item)
         self._import_tree = None
+        self._imports_changed()
         self._refresh_content_state()
         return target_entry["status"] == ImportState.READY
 
@@ -1134,6 +1468,7 @@ class OSCAL:
                 tree_imports[idx]["status"]  = ImportState.IGNORED
                 tree_imports[idx]["failure"] = None
 
+        self._imports_changed()
         self._refresh_content_state()
         logger.info(f"ignore_import: '{href}' marked as IGNORED.")
         return True
@@ -1193,9 +1528,11 @@ class OSCAL:
                 tree_imports.pop(idx)
 
         self.import_list.remove(target)
+        self._imports_changed()
 
         if dict_removed:
             self.is_unsaved = True
+            self._content_changed()
 
         self._refresh_content_state()
         logger.info(f"remove_import: '{target.get('href_original')}' removed.")
@@ -1236,8 +1573,10 @@ class OSCAL:
         """
         if isinstance(self._dict, dict) and isinstance(self._dict.get(self.model), dict):
             self._dict[self.model]["uuid"] = new_uuid_value
+            self._content_changed()
         self.uuid = new_uuid_value
         self._identity = (new_uuid_value, self.last_modified, self.published) if new_uuid_value else None
+        self._imports_changed()   # directories over this document key it by uuid
 
     # -------------------------------------------------------------------------
     def _acquire_shared(self, resolved: str, cache_directive: "CacheDirective | None" = None) -> "OSCAL":
@@ -1368,6 +1707,7 @@ class OSCAL:
         """Core of :meth:`resolve_imports`, wrapped for cycle-stack management."""
         self.import_list = []
         self._import_tree = None  # invalidate cached tree whenever imports are re-resolved
+        self._imports_changed()
 
         # --- resolve base directory for relative hrefs ---
         if not base_path:
@@ -1582,6 +1922,8 @@ class OSCAL:
         if self.content_state >= ContentState.VALID and failed == 0:
             self.content_state = ContentState.IMPORTS_RESOLVED
 
+        self._imports_changed()
+        self._import_directory()   # the import tree is complete; build its object directory
         return self.import_list
 
     # -------------------------------------------------------------------------
@@ -1869,6 +2211,7 @@ class OSCAL:
 
             if self.original_format == "xml":
                 self._tree = safe_load_xml(content)
+                self._tree_version = self._content_version
                 if self._tree is not None:
                     status = True
                     # Only the model (root element) and OSCAL version are read from XML here —
@@ -1922,10 +2265,13 @@ class OSCAL:
         if status and self.original_format == "xml":
             converter = OSCALConverter.from_support(self.model, self.oscal_version, self._support)
             if converter is not None:
-                xml_string = self._xml_serializer()
-                json_string = converter.xml_to_json(xml_string)
-                if json_string is not None:
-                    self._dict = json.loads(json_string)
+                # Convert the parsed tree in place rather than serializing and re-parsing
+                # it. Markup conversion is whitespace-sensitive, so apply the same
+                # indentation the serializer round trip used to introduce.
+                ElementTree.indent(self._tree, space=" " * INDENT)
+                converted = converter.xml_to_dict(self._tree)
+                if converted is not None:
+                    self._dict = converted
                     logger.debug("XML source converted to dict.")
                 else:
                     logger.warning("XML→dict conversion failed; dict-based manipulation unavailable.")
@@ -2060,7 +2406,8 @@ class OSCAL:
 
         logger.debug("Validating content against metaschema index (all phases)...")
         errors: list[dict] = []
-        self._walk_instance(model_instance, model_nodes, errors, f"/{self.model}")
+        plan = get_validation_plan(self.oscal_version, self.model, index)
+        self._walk_instance(model_instance, model_nodes, errors, f"/{self.model}", plan)
 
         struct_errors      = [e for e in errors if e["error-type"] == "missing-required"]
         dtype_errors       = [e for e in errors if e["error-type"] == "invalid-type"]
@@ -2103,6 +2450,7 @@ class OSCAL:
         node: dict,
         errors: list[dict],
         location: str,
+        plan: Optional[ValidationPlan] = None,
     ) -> None:
         """Recursively walk *instance* against metaschema *node*, collecting structured errors.
 
@@ -2114,136 +2462,27 @@ class OSCAL:
           ``choice``            – a choice has more than one member present (mutually exclusive), or none where one is required
 
         All error types are collected in a single pass so that ``validate()`` can
-        partition them by phase after the walk completes.
+        partition them by phase after the walk completes. The walk runs against the
+        compiled :class:`ValidationPlan` for this document's version and model.
 
         Args:
             instance: The JSON dict being validated at the current tree level.
             node:     The metaschema index node describing the expected structure.
             errors:   Accumulator list — errors are appended in-place.
             location: JSON path to *instance* used for error reporting (e.g. "/catalog/metadata").
+            plan:     The compiled plan to use; looked up from the metaschema index when omitted.
         """
         if not isinstance(instance, dict) or not isinstance(node, dict):
             return
+        if plan is None:
+            plan = self._validation_plan()
+        _walk_plan(instance, plan.node_plan(node), plan, errors, location)
 
-        children = node.get("children", [])
-
-        # ------------------------------------------------------------------
-        # Flags: structure → data-type → allowed-values
-        # ------------------------------------------------------------------
-        for flag_node in (c for c in children if c.get("structure-type") == "flag"):
-            flag_name = flag_node.get("use-name") or flag_node.get("name")
-            if not flag_name:
-                continue
-
-            if flag_node.get("min-occurs") == "1" and flag_name not in instance:
-                errors.append({
-                    "error-type": "missing-required",
-                    "location":   location,
-                    "field":      f"@{flag_name}",
-                    "value":      None,
-                    "expected":   {},
-                })
-                continue
-
-            if flag_name not in instance:
-                continue
-
-            flag_val = instance[flag_name]
-
-            # Data type check
-            datatype = flag_node.get("datatype")
-            if datatype and isinstance(flag_val, str) and flag_val:
-                err = _check_datatype(flag_val, datatype, location, f"@{flag_name}")
-                if err:
-                    errors.append(err)
-
-            # Allowed-values check
-            for constraint in flag_node.get("constraints", []):
-                if constraint.get("type") != "allowed-values":
-                    continue
-                if constraint.get("allow-other", False):
-                    continue
-                if not _constraint_conditions_met(constraint, instance):
-                    continue
-                values = constraint.get("values", [])
-                if flag_val not in {v["value"] for v in values}:
-                    errors.append({
-                        "error-type": "allowed-values",
-                        "location":   location,
-                        "field":      f"@{flag_name}",
-                        "value":      flag_val,
-                        "expected": {
-                            "one-of": [
-                                {"enum": v["value"], "description": v.get("description", "")}
-                                for v in sorted(values, key=lambda x: x["value"])
-                            ],
-                        },
-                    })
-
-        # ------------------------------------------------------------------
-        # Non-flag children: structure → data-type (fields) → recurse
-        # ------------------------------------------------------------------
-        for child_node in children:
-            stype = child_node.get("structure-type")
-            if stype in ("flag", "choice", "any", "recursive"):
-                continue
-            child_name = child_node.get("use-name") or child_node.get("name")
-            if not child_name:
-                continue
-
-            json_key   = child_node.get("group-as") or child_name
-            child_val  = instance.get(json_key)
-            min_occurs = child_node.get("min-occurs", "0")
-            max_occurs = child_node.get("max-occurs", "unbounded")
-            required   = min_occurs == "1"
-
-            if child_val is None:
-                if required:
-                    errors.append({
-                        "error-type": "missing-required",
-                        "location":   location,
-                        "field":      child_name,
-                        "value":      None,
-                        "expected":   {},
-                    })
-                continue
-
-            child_loc = f"{location}/{json_key}"
-
-            # Data type check for scalar fields
-            if stype == "field" and isinstance(child_val, str) and child_val:
-                datatype = child_node.get("datatype")
-                if datatype:
-                    err = _check_datatype(child_val, datatype, location, child_name)
-                    if err:
-                        errors.append(err)
-
-            # Recurse into assemblies and grouped fields
-            if isinstance(child_val, list):
-                min_int = int(min_occurs)
-                max_int = None if max_occurs == "unbounded" else int(max_occurs)
-                actual  = len(child_val)
-                if actual < min_int or (max_int is not None and actual > max_int):
-                    errors.append({
-                        "error-type": "cardinality",
-                        "location":   location,
-                        "field":      child_name,
-                        "value":      actual,
-                        "min":        min_int,
-                        "max":        max_int,
-                    })
-                for i, item in enumerate(child_val):
-                    if isinstance(item, dict):
-                        self._walk_instance(item, child_node, errors, f"{child_loc}[{i}]")
-            elif isinstance(child_val, dict):
-                self._walk_instance(child_val, child_node, errors, child_loc)
-
-        # ------------------------------------------------------------------
-        # Choice groups: mutually exclusive members (at most one), and a member
-        # required when every member is min-occurs="1"
-        # ------------------------------------------------------------------
-        for choice_node in (c for c in children if c.get("structure-type") == "choice"):
-            self._check_choice(instance, choice_node, errors, location)
+    # -------------------------------------------------------------------------
+    def _validation_plan(self) -> ValidationPlan:
+        """Return the compiled validation plan for this document's version and model."""
+        index = self._support.get_metaschema_index(self.oscal_version, self.model)
+        return get_validation_plan(self.oscal_version, self.model, index)
 
     # -------------------------------------------------------------------------
     def _check_choice(self, instance: dict, choice_node: dict,
@@ -2273,43 +2512,17 @@ class OSCAL:
             errors (list, required): Accumulator for ``"choice"`` errors.
             location (str, required): JSON path to ``instance`` for error reporting.
         """
-        members: list[dict] = []
-
-        def _collect(node: dict) -> None:
-            for m in node.get("children", []):
-                if m.get("structure-type") == "choice":
-                    _collect(m)  # flatten nested choices into one group
-                else:
-                    members.append(m)
-
-        _collect(choice_node)
-        if not members:
-            return
-
-        keys = [(m.get("group-as") or m.get("use-name") or m.get("name")) for m in members]
-        required = all((m.get("min-occurs") or "0") == "1" for m in members)
-        present = [k for k in keys if k and k in instance]
-
-        if required and len(present) == 0:
-            errors.append({
-                "error-type": "choice",
-                "location":   location,
-                "field":      keys,
-                "value":      0,
-                "expected":   {"select-one-of": keys},
-            })
-        elif len(present) > 1:
-            errors.append({
-                "error-type": "choice",
-                "location":   location,
-                "field":      present,
-                "value":      len(present),
-                "expected":   {"mutually-exclusive": keys},
-            })
+        choice = _compile_choice(choice_node)
+        if choice is not None:
+            _check_compiled_choice(instance, choice, errors, location)
 
     # -------------------------------------------------------------------------
     def _build_tree(self) -> bool:
-        """Build `_tree` from `_dict` using the metaschema-based JSON-to-XML converter."""
+        """Build `_tree` from `_dict` using the metaschema-based JSON-to-XML converter.
+
+        The tree is tagged with the current :attr:`content_version`; it is reused
+        until the next mutation (see :meth:`_current_tree`).
+        """
         if self._dict is None:
             logger.error("No dict available to build XML tree from.")
             return False
@@ -2323,6 +2536,7 @@ class OSCAL:
             logger.error("JSON-to-XML conversion produced no output.")
             return False
         self._tree = ElementTree.ElementTree(ElementTree.fromstring(xml_string.encode("utf-8")))
+        self._tree_version = self._content_version
         logger.debug("XML tree built from dict.")
         return True
 
@@ -2330,11 +2544,7 @@ class OSCAL:
     @property
     def xml(self) -> str:
         """Return the content as an XML string, converting from dict if necessary."""
-        if self._tree is None:
-            if not self._build_tree():
-                logger.error("Failed to build XML tree for serialization.")
-                return ""
-        return self._xml_serializer()
+        return self.dumps(format="xml")
 
     # -------------------------------------------------------------------------
     @property
@@ -2343,7 +2553,7 @@ class OSCAL:
         if self._dict is None:
             logger.error("No content available for JSON serialization.")
             return ""
-        return json.dumps(self._dict, indent=INDENT)
+        return self._cached_serialization(("json", "property"), lambda: json.dumps(self._dict, indent=INDENT))
 
     # -------------------------------------------------------------------------
     @property
@@ -2352,7 +2562,9 @@ class OSCAL:
         if self._dict is None:
             logger.error("No content available for YAML serialization.")
             return ""
-        return yaml.dump(self._dict, sort_keys=False, indent=INDENT)
+        return self._cached_serialization(
+            ("yaml", "property"), lambda: yaml.dump(self._dict, sort_keys=False, indent=INDENT)
+        )
 
     # -------------------------------------------------------------------------
     def _can_mutate(self, operation: str = "") -> bool:
@@ -2443,7 +2655,7 @@ class OSCAL:
         if data is None:
             logger.error("query: no JSON content available.")
             return []
-        return engine.query(path, data)
+        return engine.query(path, data, self._document_id_index(), self._document_prop_index())
 
     def query(self, path: str, context: dict | None = None) -> list:
         """
@@ -2471,9 +2683,42 @@ class OSCAL:
         """
         return copy.deepcopy(self._query(path, context))
 
+    def _iter_query(self, path: str, context: dict | None = None) -> Iterator:
+        """Live-reference, lazy implementation of :meth:`iter_query` (nodes inside ``self._dict``)."""
+        engine = self._path_engine
+        if engine is None:
+            logger.error("query: OSCALPath engine unavailable — metaschema index may not be loaded.")
+            return iter(())
+        data = context if context is not None else self._dict
+        if data is None:
+            logger.error("query: no JSON content available.")
+            return iter(())
+        return engine.iter_query(path, data, self._document_id_index(), self._document_prop_index())
+
+    def iter_query(self, path: str, context: dict | None = None) -> Iterator:
+        """Yield the results of :meth:`query` lazily, one safe copy at a time.
+
+        Matches are found as the iterator advances, so stopping early — ``next()``, a
+        ``break``, or ``itertools.islice`` for a page of results — skips the rest of the
+        search. Each match is copied individually. The document must not be mutated
+        while the iterator is in use.
+
+        Args:
+            path (str, required): Path expression using OSCAL XML element names.
+            context (dict | None, optional): Sub-dict to query within. Defaults to the
+                full document dict.
+
+        Yields:
+            Any: A safe copy of each matching JSON value, in document order.
+        """
+        for match in self._iter_query(path, context):
+            yield copy.deepcopy(match)
+
     def query_one(self, path: str, context: dict | None = None, default=None):
         """Return the first result of :meth:`query` as a safe copy, or ``default``.
 
+        The search stops at the first match.
+
         Args:
             path (str, required): Path expression using OSCAL XML element names.
             context (dict | None, optional): Sub-dict to query within. Defaults to the
@@ -2484,8 +2729,42 @@ class OSCAL:
         Returns:
             Any: A safe copy of the first matching JSON value, or ``default``.
         """
-        results = self._query(path, context)
-        return copy.deepcopy(results[0]) if results else default
+        for match in self._iter_query(path, context):
+            return copy.deepcopy(match)
+        return default
+
+    def _query_many(self, paths: dict[str, str], context: dict | None = None) -> dict[str, list]:
+        """Live-reference implementation of :meth:`query_many` (nodes inside ``self._dict``)."""
+        engine = self._path_engine
+        if engine is None:
+            logger.error("query: OSCALPath engine unavailable — metaschema index may not be loaded.")
+            return {name: [] for name in paths}
+        data = context if context is not None else self._dict
+        if data is None:
+            logger.error("query: no JSON content available.")
+            return {name: [] for name in paths}
+        return engine.query_many(paths, data, self._document_id_index(), self._document_prop_index())
+
+    def query_many(self, paths: dict[str, str], context: dict | None = None) -> dict[str, list]:
+        """Run several :meth:`query` paths together, returning ``{name: results}``.
+
+        Every path that starts with ``//`` is answered from one shared walk of the
+        document rather than one walk per path, so a dashboard or report that needs many
+        element sets pays for roughly one traversal. Each result list equals what
+        :meth:`query` returns for that path.
+
+        Args:
+            paths (dict[str, str], required): Names mapped to path expressions using OSCAL
+                XML element names, e.g. ``{"controls": "//control", "params": "//param"}``.
+            context (dict | None, optional): Sub-dict to query within. Defaults to the
+                full document dict.
+
+        Returns:
+            dict[str, list]: Safe copies of the matches for each name, in document order.
+                A single deep copy of the whole result preserves identity between
+                overlapping matches.
+        """
+        return copy.deepcopy(self._query_many(paths, context))
 
     def _json_query(self, path: str, context: dict | None = None) -> list:
         """Live-reference implementation of :meth:`json_query` (nodes inside ``self._dict``).
@@ -2497,7 +2776,74 @@ class OSCAL:
         if data is None:
             logger.error("json_query: no JSON content available.")
             return []
-        return native_path.query(path, data)
+        return native_path.query(path, data, self._document_id_index(), self._document_prop_index())
+
+    def _document_id_index(self) -> IdIndex | None:
+        """Return the id/uuid index of ``_dict`` for the current content version.
+
+        Lets ``//name[@id='v']`` / ``//name[@uuid='v']`` queries over the whole
+        document use a point lookup instead of a tree walk. The index is built on the
+        first such lookup. :meth:`put` and the catalog mutation methods patch it in
+        place (see :meth:`_patch_document_indexes`); any other change drops it in
+        :meth:`_content_changed`. The engines ignore it for queries against a sub-dict
+        ``context``.
+
+        Returns:
+            IdIndex | None: The index, or None when there is no JSON content.
+        """
+        if self._dict is None:
+            return None
+        if self._id_index is None or self._id_index.root is not self._dict:
+            self._id_index = IdIndex(self._dict)
+        return self._id_index
+
+    def _document_prop_index(self) -> PropIndex | None:
+        """Return the prop index of ``_dict`` when enabled (see :meth:`enable_prop_index`), else None."""
+        if self._prop_index is None or self._dict is None:
+            return None
+        if self._prop_index.root is not self._dict:
+            self._prop_index = PropIndex(self._dict)
+        return self._prop_index
+
+    def enable_prop_index(self) -> None:
+        """Keep a secondary index of this document's props by ``(ns, name)``.
+
+        Once enabled, :meth:`find_props`, prop-label lookups and queries whose first
+        step is ``//name[prop[@name='v']]`` (or ``//name[prop/@name='v']``) read the
+        index instead of walking the document. The index is built on first use and
+        patched in place by :meth:`put` and the catalog mutation methods; other
+        mutations rebuild it on the next use. Costs memory proportional to the number
+        of props.
+        """
+        if self._prop_index is None:
+            self._prop_index = PropIndex(self._dict)
+
+    def disable_prop_index(self) -> None:
+        """Drop the prop index enabled by :meth:`enable_prop_index`."""
+        self._prop_index = None
+
+    def find_props(self, name: str, ns: str = _OSCAL_NS, class_: str | None = None) -> list[tuple[dict, dict]]:
+        """Return every prop named ``name`` in the document, with the object that holds it.
+
+        An absent ``ns`` on a prop is the OSCAL namespace, as in :func:`get_props`.
+        Uses the prop index when enabled (see :meth:`enable_prop_index`); otherwise
+        walks the document once.
+
+        Args:
+            name (str, required): Prop ``name`` to match.
+            ns (str, optional): Namespace to match; defaults to the OSCAL namespace.
+            class_ (str | None, optional): Prop ``class`` to match. Defaults to None
+                (any class).
+
+        Returns:
+            list[tuple[dict, dict]]: Safe copies of ``(owner, prop)`` pairs in document
+                order, where ``owner`` is the control, part, component, etc. carrying the
+                prop. Empty when nothing matches or there is no JSON content.
+        """
+        if self._dict is None:
+            return []
+        index = self._document_prop_index() or PropIndex(self._dict)
+        return copy.deepcopy([(entry.owner, entry.prop) for entry in index.lookup(name, ns, class_)])
 
     def json_query(self, path: str, context: dict | None = None) -> list:
         """
@@ -2524,9 +2870,35 @@ class OSCAL:
         """
         return copy.deepcopy(self._json_query(path, context))
 
+    def _iter_json_query(self, path: str, context: dict | None = None) -> Iterator:
+        """Live-reference, lazy implementation of :meth:`iter_json_query` (nodes inside ``self._dict``)."""
+        data = context if context is not None else self._dict
+        if data is None:
+            logger.error("json_query: no JSON content available.")
+            return iter(())
+        return native_path.iter_query(path, data, self._document_id_index(), self._document_prop_index())
+
+    def iter_json_query(self, path: str, context: dict | None = None) -> Iterator:
+        """Yield the results of :meth:`json_query` lazily, one safe copy at a time.
+
+        See :meth:`iter_query` for the streaming and early-termination behavior.
+
+        Args:
+            path (str, required): Path expression using JSON key names.
+            context (dict | None, optional): Sub-dict to query within. Defaults to the
+                full document dict.
+
+        Yields:
+            Any: A safe copy of each matching JSON value, in document order.
+        """
+        for match in self._iter_json_query(path, context):
+            yield copy.deepcopy(match)
+
     def json_query_one(self, path: str, context: dict | None = None, default=None):
         """Return the first result of :meth:`json_query` as a safe copy, or ``default``.
 
+        The search stops at the first match.
+
         Args:
             path (str, required): Path expression using JSON key names.
             context (dict | None, optional): Sub-dict to query within. Defaults to the
@@ -2537,8 +2909,33 @@ class OSCAL:
         Returns:
             Any: A safe copy of the first matching JSON value, or ``default``.
         """
-        results = self._json_query(path, context)
-        return copy.deepcopy(results[0]) if results else default
+        for match in self._iter_json_query(path, context):
+            return copy.deepcopy(match)
+        return default
+
+    def _json_query_many(self, paths: dict[str, str], context: dict | None = None) -> dict[str, list]:
+        """Live-reference implementation of :meth:`json_query_many` (nodes inside ``self._dict``)."""
+        data = context if context is not None else self._dict
+        if data is None:
+            logger.error("json_query: no JSON content available.")
+            return {name: [] for name in paths}
+        return native_path.query_many(paths, data, self._document_id_index(), self._document_prop_index())
+
+    def json_query_many(self, paths: dict[str, str], context: dict | None = None) -> dict[str, list]:
+        """Run several :meth:`json_query` paths together, returning ``{name: results}``.
+
+        See :meth:`query_many` for the shared traversal.
+
+        Args:
+            paths (dict[str, str], required): Names mapped to path expressions using JSON
+                key names.
+            context (dict | None, optional): Sub-dict to query within. Defaults to the
+                full document dict.
+
+        Returns:
+            dict[str, list]: Safe copies of the matches for each name, in document order.
+        """
+        return copy.deepcopy(self._json_query_many(paths, context))
 
     # -------------------------------------------------------------------------
     @staticmethod
@@ -2580,6 +2977,104 @@ class OSCAL:
             return None
         return target
 
+    # -------------------------------------------------------------------------
+    @property
+    def content_version(self) -> int:
+        """int: Counter bumped by every content mutation.
+
+        Cached derived representations (the XML tree and serialized strings per
+        format and ``pretty_print``) are keyed by this version and rebuilt only when
+        it changes. Mutations made through :meth:`put`, the
+        :func:`if_update_successful` mutators and the model-specific edit methods
+        all bump it; editing ``_dict`` directly bypasses it.
+        """
+        return self._content_version
+
+    # -------------------------------------------------------------------------
+    def _content_changed(self) -> None:
+        """Record a change to ``_dict``: bump the content version and drop derived caches.
+
+        The id and prop indexes survive when the mutation patched them (see
+        :meth:`_patch_document_indexes`); otherwise they are reset.
+        """
+        self._content_version += 1
+        self._serialized.clear()
+        if self._indexes_version != self._content_version:
+            self._reset_document_indexes()
+        if self._dict is not None:
+            self._tree = None
+
+    # -------------------------------------------------------------------------
+    def _reset_document_indexes(self) -> None:
+        """Drop the id index and empty an enabled prop index; both rebuild from ``_dict`` on next use."""
+        self._id_index = None
+        if self._prop_index is not None:
+            self._prop_index = PropIndex(self._dict)
+
+    # -------------------------------------------------------------------------
+    def _patch_document_indexes(self, trail: tuple, old, new) -> None:
+        """Patch the id and prop indexes for one write to ``_dict``.
+
+        Called by a mutation method after the dict or list ``trail[-1]`` had its value
+        ``old`` replaced by ``new`` (either None for an insert or delete); see
+        :meth:`PropIndex.update`. The content-version bump that follows then keeps
+        both indexes.
+
+        Args:
+            trail (tuple, required): The nodes from the document root down to the dict
+                or list that was written to.
+            old (Any, required): The value that was replaced, or None.
+            new (Any, required): The value written, or None.
+        """
+        for index in (self._id_index, self._prop_index):
+            if index is not None and index.root is self._dict:
+                index.update(trail, old, new)
+        self._document_indexes_patched()
+
+    # -------------------------------------------------------------------------
+    def _discard_from_document_indexes(self, subtree) -> None:
+        """Drop a subtree just removed from ``_dict`` from the id and prop indexes."""
+        for index in (self._id_index, self._prop_index):
+            if index is not None and index.root is self._dict:
+                index.discard(subtree)
+        self._document_indexes_patched()
+
+    # -------------------------------------------------------------------------
+    def _document_indexes_patched(self) -> None:
+        """Keep the id and prop indexes across the content-version bump of the current mutation.
+
+        For mutations that patched both indexes, or whose change cannot affect them
+        (e.g. a new title).
+        """
+        self._indexes_version = self._content_version + 1
+
+    # -------------------------------------------------------------------------
+    def _current_tree(self) -> bool:
+        """Ensure ``_tree`` reflects the current content version, building it if needed."""
+        if self._tree is not None and self._tree_version == self._content_version:
+            return True
+        return self._build_tree()
+
+    # -------------------------------------------------------------------------
+    def _cached_serialization(self, key: tuple, build) -> str:
+        """Return the serialization cached under *key* for the current content version.
+
+        Args:
+            key (tuple, required): Cache key, e.g. ``("xml", False)``.
+            build (Callable[[], str], required): Produces the string on a miss. Empty
+                results (failures) are not cached.
+
+        Returns:
+            str: The serialized content, or "" when *build* fails.
+        """
+        cached = self._serialized.get(key)
+        if cached is not None and cached[0] == self._content_version:
+            return cached[1]
+        out = build()
+        if out:
+            self._serialized[key] = (self._content_version, out)
+        return out
+
     # -------------------------------------------------------------------------
     def _on_content_mutated(self) -> None:
         """Hook invoked after a successful content mutation.
@@ -2624,8 +3119,9 @@ class OSCAL:
                 and allowed-value checks before writing (see :meth:`_validate_write`).
                 Currently a permissive extension point. Defaults to False.
             check_refs (bool, optional): When True, run referential-integrity checks
-                before writing (see :meth:`_check_referential_integrity`). Currently a
-                permissive extension point. Defaults to False.
+                before writing (see :meth:`_check_referential_integrity`). A catalog
+                refuses writes that would leave ``#id`` references dangling; elsewhere
+                a permissive extension point. Defaults to False.
 
         Returns:
             bool: True on success, False on any failure (guard, bad path/index,
@@ -2650,6 +3146,7 @@ class OSCAL:
 
         # Walk to the parent of the leaf, auto-creating missing intermediate dicts.
         obj = self._dict.setdefault(self.model, {})
+        trail = [self._dict, obj]   # nodes from the document root, for the id and prop indexes
         for depth, part in enumerate(parts[:-1]):
             if isinstance(obj, list):
                 idx = self._as_index(part)
@@ -2657,6 +3154,7 @@ class OSCAL:
                     logger.error(f"put: invalid list index '{part}' in path '{path}'.")
                     return False
                 obj = obj[idx]
+                trail.append(obj)
             elif isinstance(obj, dict):
                 if part not in obj:
                     # Auto-vivify a dict. A following numeric segment would require a
@@ -2668,6 +3166,7 @@ class OSCAL:
                         return False
                     obj[part] = {}
                 obj = obj[part]
+                trail.append(obj)
             else:
                 logger.error(f"put: cannot traverse into {type(obj).__name__} at '{part}' in path '{path}'.")
                 return False
@@ -2686,22 +3185,29 @@ class OSCAL:
                 logger.error(f"put: '{leaf}' at '{path}' is not a list; cannot insert.")
                 return False
             target.append(value)
+            trail.append(target)
+            old = None
         else:  # replace
             if isinstance(obj, dict):
+                old = obj.get(leaf)
                 obj[leaf] = value
             elif isinstance(obj, list):
                 idx = self._as_index(leaf)
                 if idx is None or idx >= len(obj):
                     logger.error(f"put: invalid list index '{leaf}' in path '{path}'.")
                     return False
+                old = obj[idx]
                 obj[idx] = value
             else:
                 logger.error(f"put: cannot set value on {type(obj).__name__} at path '{path}'.")
                 return False
 
+        self._patch_document_indexes(tuple(trail), old, value)
+
         # Dirty-state bookkeeping (done inline so a False return never marks unsaved).
         self.is_unsaved = True
         self.last_modified = oscal_date_time_with_timezone()
+        self._content_changed()
         self._on_content_mutated()
         logger.debug(f"put[{mode}]: '{path}' = {value!r}")
         return True
@@ -2920,41 +3426,82 @@ class OSCAL:
                 obj.walk_imports(visitor_fn, depth + 1, _seen, scope=scope)
 
     # -------------------------------------------------------------------------
-    def get_oscal_object(self, uuid, _seen=None):
+    def get_oscal_object(self, uuid):
         """Return the LIVE imported OSCAL document whose root UUID matches ``uuid``.
 
         Searches this document and its resolved imports depth-first, de-duplicating
         objects shared across multiple import paths (the same large catalog reached
         two ways is visited once). This underpins the import mechanism's object reuse
         and is the companion to :attr:`import_tree`: the tree carries each node's
-        ``object_uuid``; pass one here to obtain the corresponding live instance.
+        ``object_uuid``; pass one here to obtain the corresponding live instance. The
+        search is a lookup in the import-object directory (see
+        :meth:`_import_directory`).
 
         Unlike the model getters, this returns the LIVE object (not a copy) — it is a
         document handle meant for working with that instance through its own methods.
 
         Args:
             uuid (str, required): The root UUID of the document to locate.
-            _seen (set | None, optional): Object ids already visited; used internally
-                for cycle-safety. Defaults to None.
 
         Returns:
             OSCAL | None: The matching live document, or None if not found.
         """
-        if _seen is None:
-            _seen = set()
-        if id(self) in _seen:
-            return None
-        _seen.add(id(self))
-        if self.uuid == uuid:
-            return self
-        for entry in self.import_list:
-            obj = entry.get("object")
-            if obj is None:
-                continue
-            result = obj.get_oscal_object(uuid, _seen)
-            if result is not None:
-                return result
-        return None
+        return self._import_directory()[1].get(uuid)
+
+    # -------------------------------------------------------------------------
+    def _import_directory(self) -> tuple:
+        """Return the directory of live documents in this document's import tree.
+
+        The directory is ``(objects, by_uuid)``: ``objects`` lists this document and
+        every document reachable through its imports in depth-first order, each once
+        (documents shared across import paths are de-duplicated by identity);
+        ``by_uuid`` maps each root UUID to the first document carrying it. Built when
+        :meth:`resolve_imports` completes and on demand thereafter; any change to an
+        import list or root UUID in the graph (:meth:`retry_import`,
+        :meth:`remove_import`, :meth:`ignore_import`, re-resolution) invalidates it.
+
+        Returns:
+            tuple: ``(list[OSCAL], dict[str, OSCAL])``.
+        """
+        if (self._import_objects is None
+                or self._import_objects_generation != OSCAL._import_generation):
+            objects: list = []
+            seen: set[int] = set()
+            stack = [self]
+            while stack:
+                obj = stack.pop()
+                if id(obj) in seen:
+                    continue
+                seen.add(id(obj))
+                objects.append(obj)
+                children = [e.get("object") for e in obj.import_list]
+                stack.extend(child for child in reversed(children) if child is not None)
+            by_uuid: dict = {}
+            for obj in objects:
+                by_uuid.setdefault(obj.uuid, obj)
+            self._import_objects = (objects, by_uuid)
+            self._import_objects_generation = OSCAL._import_generation
+        return self._import_objects
+
+    # -------------------------------------------------------------------------
+    def _warm_read_caches(self) -> None:
+        """Build this document's lazily built lookup structures now.
+
+        Called before the document is read from several threads at once (see
+        :meth:`Profile.resolve`), so concurrent readers find the structures built
+        rather than each building them. Subclasses extend it with their own.
+        """
+        self._import_directory()
+
+    # -------------------------------------------------------------------------
+    def _imports_changed(self) -> None:
+        """Record a change to this document's imports (or root UUID).
+
+        Invalidates the import-object directory of this document and of every
+        document whose import tree includes it.
+        """
+        self._import_objects = None
+        OSCAL._import_generation += 1
 
     # -------------------------------------------------------------------------
     # Kinds of element the import-tree resolver can locate, mapped to how they are
@@ -3014,6 +3561,13 @@ class OSCAL:
         found = self.find_in_import_tree(param_id, kinds=["param"])
         return found["element"] if found is not None else None
 
+    # -------------------------------------------------------------------------
+    def _local_ids(self) -> set:
+        """Return every ``id``/``uuid`` value in this document (imports excluded)."""
+        ids: set[str] = set()
+        _collect_ids(self._dict, ids)
+        return ids
+
     # -------------------------------------------------------------------------
     def reachable_ids(self, _seen=None) -> set:
         """Return every ``id``/``uuid`` value in this document and its import tree.
@@ -3026,14 +3580,60 @@ class OSCAL:
         if id(self) in _seen:
             return set()
         _seen.add(id(self))
-        ids: set[str] = set()
-        _collect_ids(self._dict, ids)
+        ids = self._local_ids()
         for entry in self.import_list:
             obj = entry.get("object")
             if obj is not None:
                 ids |= obj.reachable_ids(_seen)
         return ids
 
+    # -------------------------------------------------------------------------
+    def _documents_in_scope(self, _seen=None) -> list:
+        """Return this document followed by every READY import reachable from it.
+
+        Order and de-duplication follow :meth:`walk_imports`: depth-first, each live
+        object once even when reached through several import paths. ``_seen`` is an
+        internal cycle-guard shared across calls (e.g. by a :class:`Workspace`).
+        """
+        if _seen is None:
+            _seen = set()
+        if id(self) in _seen:
+            return []
+        _seen.add(id(self))
+        docs = [self]
+
+        def visit(entry, depth):
+            obj = entry.get("object")
+            if obj is not None:
+                docs.append(obj)
+
+        self.walk_imports(visit, _seen=_seen)
+        return docs
+
+    def federated_query(self, path: str, _seen=None) -> list[dict]:
+        """Run :meth:`query` across this document and its READY imports.
+
+        Each document is queried with its own model's engine and its own id/uuid
+        index, so ``//name[@id='v']`` lookups cost a point lookup per document rather
+        than a walk of the whole import tree. Documents are visited in
+        :meth:`walk_imports` order, each once.
+
+        Args:
+            path (str, required): Path expression using OSCAL XML element names.
+            _seen (set | None, optional): Internal cycle-guard.
+
+        Returns:
+            list[dict]: ``{"element", "object_uuid", "href"}`` for every match — a safe
+                copy of the match, plus the owning document's root uuid and resolved
+                href — in document order within each document.
+        """
+        hits = []
+        for doc in self._documents_in_scope(_seen):
+            href = doc.href or doc.href_original or ""
+            for element in copy.deepcopy(doc._query(path)):
+                hits.append({"element": element, "object_uuid": doc.uuid, "href": href})
+        return hits
+
     # -------------------------------------------------------------------------
     def _find_local_element(self, fragment_id: str, kinds=None) -> Optional[dict]:
         """Find an element identified by ``fragment_id`` in THIS document only (no imports)."""
@@ -3073,6 +3673,9 @@ class OSCAL:
 
         Returns:
         - str: The serialized content as a string.
+
+        Results are cached per (format, pretty_print) against :attr:`content_version`,
+        so repeated calls between mutations return the same string without re-converting.
         """
         if format == "":
             format = self.original_format
@@ -3083,20 +3686,20 @@ class OSCAL:
             return ""
 
         if format == "xml":
-            if self._tree is None and not self._build_tree():
+            if not self._current_tree():
                 logger.error("Failed to build XML tree for serialization.")
                 return ""
-            return self._xml_serializer(pretty_print=pretty_print)
+            return self._cached_serialization(("xml", pretty_print), lambda: self._xml_serializer(pretty_print=pretty_print))
         elif format == "json":
             if self._dict is None:
                 logger.error("No content available for JSON serialization.")
                 return ""
-            return self._json_serializer(pretty_print=pretty_print)
+            return self._cached_serialization(("json", pretty_print), lambda: self._json_serializer(pretty_print=pretty_print))
         elif format in ("yaml", "yml"):
             if self._dict is None:
                 logger.error("No content available for YAML serialization.")
                 return ""
-            return self._yaml_serializer(pretty_print=pretty_print)
+            return self._cached_serialization(("yaml", pretty_print), lambda: self._yaml_serializer(pretty_print=pretty_print))
         else:
             logger.error(f"Unsupported format for serialization: {format}")
             return ""
@@ -4008,7 +4611,7 @@ def append_prop(parent_obj: dict, prop: dict) -> dict:
 # -------------------------------------------------------------------------
 def get_props(parent_obj: dict, name: str | None = None, uuid: str | None = None,
               ns: str = _OSCAL_NS, class_: str | None = None,
-              group: str | None = None) -> list:
+              group: str | None = None, index: PropIndex | None = None) -> list:
     """
     Retrieve matching prop dicts from ``parent_obj["props"]``.
 
@@ -4044,6 +4647,10 @@ def get_props(parent_obj: dict, name: str | None = None, uuid: str | None = None
         class_ (str, optional): Prop ``class`` to match. Maps to the ``"class"``
             key (``class`` is a reserved word in Python).
         group (str, optional): Prop ``group`` to match.
+        index (PropIndex, optional): Prop index of the document holding
+            ``parent_obj`` (see :meth:`OSCAL.enable_prop_index`). When given, name
+            mode reads the props already grouped by ``(ns, name)`` instead of
+            scanning the list.
 
     Returns:
         list: Matching prop dicts (possibly empty), ordered best match first.
@@ -4082,9 +4689,11 @@ def get_props(parent_obj: dict, name: str | None = None, uuid: str | None = None
         return matches
 
     # -- name mode: match on name + effective ns (+ class/group if given) -----
-    results = [p for p in props
-               if p.get("name") == name and _eff_ns(p) == ns
-               and (class_ is None or p.get("class") == class_)
+    named = index.owned(parent_obj, name, ns) if index is not None else None
+    if named is None:
+        named = [p for p in props if p.get("name") == name and _eff_ns(p) == ns]
+    results = [p for p in named
+               if (class_ is None or p.get("class") == class_)
                and (group is None or p.get("group") == group)]
 
     # Order best match first: props carrying fewer of the un-queried
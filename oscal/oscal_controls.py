@@ -17,18 +17,23 @@ Module constants:
 import os
 import re
 import copy
+import json
+import hashlib
 import fnmatch
 from urllib.parse import urlparse
 from dataclasses import dataclass
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import Any, Optional, cast
+from typing import Any, NamedTuple, Optional, cast
 from enum import Enum
 
 from .oscal_content import (
     OSCAL, requires, if_update_successful, append_props, append_links, new_uuid,
-    register_model, get_props, prune_tree_copy, ImportState, _collect_ids, _OSCAL_NS,
+    register_model, get_props, prune_tree_copy, ImportState, _OSCAL_NS,
 )
+from .oscal_cache import CacheDirective, get_local_cache
 from .oscal_datatypes import oscal_date_time_with_timezone
 
 logger = logging.getLogger(__name__)
@@ -165,6 +170,221 @@ def _find_part(container: dict, part_id: str) -> Optional[dict]:
     return None
 
 
+# Child lists a catalog node index descends into, with the kind recorded for each.
+# Params and parts come before nested controls and groups so that, for each kind,
+# the first node indexed under an id is the one the recursive finders above return.
+_NODE_LISTS = (("params", "param"), ("parts", "part"), ("controls", "control"), ("groups", "group"))
+_NODE_KINDS = ("group", "control", "param", "part")
+_NODE_LIST_KEYS = {kind: key for key, kind in _NODE_LISTS}
+
+
+class _NodeRef(NamedTuple):
+    """An indexed catalog node: the node dict, the dict holding it, and its kind."""
+    node: dict
+    parent: dict
+    kind: str
+
+
+class _NodeIndex:
+    """Id index over a catalog's groups, controls, params, and parts.
+
+    Maps each kind to ``{id: _NodeRef}``. Where an id repeats within a kind the
+    first node in document order wins (matching :func:`_find_group`,
+    :func:`_find_control`, and :func:`_find_part`) and ``duplicates`` is set; such
+    an index cannot be patched incrementally and is rebuilt instead.
+
+    Args:
+        root (dict, required): The catalog root dict to index.
+    """
+
+    def __init__(self, root: dict):
+        self.root = root
+        self.duplicates = False
+        self._by_kind: dict[str, dict[str, _NodeRef]] = {kind: {} for kind in _NODE_KINDS}
+        self.add_children(root)
+
+    def get(self, node_id: str, *kinds: str) -> Optional[_NodeRef]:
+        """Return the entry for ``node_id`` under the first of ``kinds`` that has one."""
+        for kind in kinds:
+            ref = self._by_kind[kind].get(node_id)
+            if ref is not None:
+                return ref
+        return None
+
+    def add(self, node: dict, parent: dict, kind: str) -> None:
+        """Index ``node`` (held by ``parent``) and everything nested beneath it."""
+        node_id = node.get("id")
+        if isinstance(node_id, str):
+            existing = self._by_kind[kind].setdefault(node_id, _NodeRef(node, parent, kind))
+            if existing.node is not node:
+                self.duplicates = True
+        self.add_children(node)
+
+    def add_children(self, container: dict) -> None:
+        """Index every group, control, param, and part nested under ``container``."""
+        for key, kind in _NODE_LISTS:
+            for child in container.get(key, []):
+                if isinstance(child, dict):
+                    self.add(child, container, kind)
+
+    def discard(self, node: dict, kind: str) -> None:
+        """Drop ``node`` and everything nested beneath it from the index."""
+        node_id = node.get("id")
+        ref = self._by_kind[kind].get(node_id) if isinstance(node_id, str) else None
+        if ref is not None and ref.node is node:
+            del self._by_kind[kind][node_id]
+        for key, child_kind in _NODE_LISTS:
+            for child in node.get(key, []):
+                if isinstance(child, dict):
+                    self.discard(child, child_kind)
+
+
+class _RefSite(NamedTuple):
+    """One reference to a fragment id: ``container[key]`` is the referring string."""
+    container: Any   # dict or list holding the string
+    key: Any         # dict key or list index
+    kind: str        # "href", "markdown", or "insert"
+    owner: dict      # nearest enclosing catalog root, group, control, or part
+    link: bool       # True for the href of a link held directly by ``owner``
+
+
+# Lists whose dict members own their own references (nested groups, controls, parts).
+_OWNER_LISTS = ("groups", "controls", "parts")
+
+
+def _ref_strings(items, container, owner: dict, direct: bool = False, link: bool = False):
+    """Yield ``(container, key, text, owner, link)`` for every string under ``items``.
+
+    ``items`` are the ``(key, value)`` pairs of ``container`` to walk. ``owner`` is
+    the nearest enclosing root/group/control/part; ``direct`` is True when
+    ``container`` is that owner itself, and ``link`` when it is one of the owner's
+    ``links``.
+    """
+    for key, val in items:
+        if isinstance(val, str):
+            yield container, key, val, owner, link and key == "href"
+        elif isinstance(val, dict):
+            yield from _ref_strings(val.items(), val, owner)
+        elif isinstance(val, list):
+            owns = direct and key in _OWNER_LISTS
+            links = direct and key == "links"
+            for i, item in enumerate(val):
+                if isinstance(item, str):
+                    yield val, i, item, owner, False
+                elif isinstance(item, dict) and owns:
+                    yield from _ref_strings(item.items(), item, item, direct=True)
+                elif isinstance(item, dict):
+                    yield from _ref_strings(item.items(), item, owner, link=links)
+                elif isinstance(item, list):
+                    yield from _ref_strings(enumerate(item), item, owner)
+
+
+class _RefIndex:
+    """Reverse index of fragment references within a catalog.
+
+    Maps each referenced id to the places that reference it — ``#id`` hrefs, markdown
+    ``](#id)`` links in prose, and ``{{ insert: param, id }}`` inserts — and counts
+    the ``id``/``uuid`` values the catalog defines. An ``href`` counts when it is a
+    ``#id``; markdown links count in any other string field (not in string arrays);
+    inserts count in every string, as :func:`_cited_param_ids` finds them; ids count
+    as ``_collect_ids`` finds them.
+
+    Args:
+        root (dict, required): The catalog root dict to index.
+    """
+
+    def __init__(self, root: dict):
+        self.root = root
+        self.defined: dict[str, int] = {}
+        self._sites: dict[str, dict[tuple, _RefSite]] = {}
+        self.add(root)
+
+    def referrers(self, target: str, kinds: tuple = ("href", "markdown", "insert")) -> list:
+        """Return the :class:`_RefSite` entries referencing ``target`` with one of ``kinds``."""
+        return [site for site in self._sites.get(target, {}).values() if site.kind in kinds]
+
+    def targets(self, kinds: tuple = ("href", "markdown", "insert")) -> set:
+        """Return every id referenced with one of ``kinds``."""
+        return {target for target, sites in self._sites.items()
+                if any(site.kind in kinds for site in sites.values())}
+
+    def add(self, owner: dict) -> None:
+        """Index ``owner`` (the root, a group, control, or part) and everything beneath it."""
+        self._apply(_ref_strings(owner.items(), owner, owner, direct=True), 1)
+
+    def discard(self, owner: dict) -> None:
+        """Drop ``owner`` and everything beneath it from the index."""
+        self._apply(_ref_strings(owner.items(), owner, owner, direct=True), -1)
+
+    def add_field(self, owner: dict, key: str) -> None:
+        """Index the value ``owner[key]`` after it has been set."""
+        if key in owner:
+            self._apply(_ref_strings([(key, owner[key])], owner, owner, direct=True), 1)
+
+    def discard_field(self, owner: dict, key: str) -> None:
+        """Drop the value ``owner[key]`` from the index before it is changed."""
+        if key in owner:
+            self._apply(_ref_strings([(key, owner[key])], owner, owner, direct=True), -1)
+
+    def rewrite(self, base_for: dict) -> None:
+        """Rewrite ``#id`` hrefs and markdown links to ``<base>#id`` for ids in ``base_for``.
+
+        Only the indexed href and markdown sites are touched. The rewritten sites no
+        longer reference their id and are dropped, so the index stays current; the
+        caller must still record the content change.
+        """
+        done: set = set()
+        for target in base_for:
+            for site in list(self._sites.get(target, {}).values()):
+                where = (id(site.container), site.key)
+                if site.kind == "insert":
+                    continue
+                self._site(target, site, -1)
+                if where in done:
+                    continue
+                done.add(where)
+                if site.kind == "href":
+                    site.container[site.key] = f"{base_for[target]}#{target}"
+                else:
+                    site.container[site.key] = _MD_LINK_RE.sub(
+                        lambda m: (f"]({base_for[m.group(1)]}#{m.group(1)})"
+                                   if m.group(1) in base_for else m.group(0)),
+                        site.container[site.key],
+                    )
+
+    def _apply(self, strings, sign: int) -> None:
+        """Add (``sign`` 1) or remove (``sign`` -1) the references and ids in ``strings``."""
+        for container, key, text, owner, link in strings:
+            if isinstance(key, str):
+                if key in ("id", "uuid"):
+                    count = self.defined.get(text, 0) + sign
+                    if count > 0:
+                        self.defined[text] = count
+                    else:
+                        self.defined.pop(text, None)
+                if key == "href" and text.startswith("#"):
+                    self._site(text[1:], _RefSite(container, key, "href", owner, link), sign)
+                elif "](#" in text:
+                    for match in _MD_LINK_RE.finditer(text):
+                        self._site(match.group(1),
+                                   _RefSite(container, key, "markdown", owner, False), sign)
+            if "insert" in text:
+                for match in _PARAM_INSERT_RE.finditer(text):
+                    self._site(match.group(2), _RefSite(container, key, "insert", owner, False), sign)
+
+    def _site(self, target: str, site: _RefSite, sign: int) -> None:
+        """Record or forget one reference site."""
+        where = (id(site.container), site.key, site.kind)
+        if sign > 0:
+            self._sites.setdefault(target, {})[where] = site
+            return
+        sites = self._sites.get(target)
+        if sites is not None:
+            sites.pop(where, None)
+            if not sites:
+                del self._sites[target]
+
+
 # Part names that may not contain child parts, per higher-level metaschema rules
 # not yet covered by the metaschema index. Enforced as a stopgap; relax (or drive
 # from the index) once those constraints are handled.
@@ -367,30 +587,6 @@ def _node_source_id(node: dict) -> Optional[str]:
     return (node.get("origin") or {}).get("source_id")
 
 
-def _find_control_node_with_ancestors(nodes: list, control_id: str,
-                                      ancestors: tuple = ()) -> tuple:
-    """Find a control node by (profile-scope) id, returning it with its control-ancestor
-    chain of *source* ids.
-
-    Group ancestors are skipped (they carry no alters); only enclosing control nodes
-    (enhancement parents) contribute source ids, since alters/adds from an ancestor
-    control can reach into a nested control.
-
-    Returns:
-        tuple: ``(node, ancestor_source_ids)``, or ``(None, ())`` when not found.
-    """
-    for n in nodes:
-        is_group = bool(n.get("group"))
-        if not is_group and n.get("id") == control_id:
-            return n, ancestors
-        child_ancestors = ancestors if is_group else ancestors + (_node_source_id(n),)
-        found, anc = _find_control_node_with_ancestors(
-            n.get("children", []), control_id, child_ancestors)
-        if found is not None:
-            return found, anc
-    return None, ()
-
-
 def _all_control_nodes_with_ancestors(nodes: list, ancestors: tuple = ()) -> list:
     """Yield ``(control_node, ancestor_source_ids)`` for every control node, all depths."""
     out: list = []
@@ -787,7 +983,8 @@ def _cited_param_ids(content: dict) -> set:
 # After resolution, a control may still reference (by ``#id``) a control/part that was
 # not selected into the baseline. Matching the official resolver, such out-of-scope
 # references are rewritten to absolute URIs pointing at the import that still resolves
-# them, both in ``href`` values and in prose markdown links.
+# them, both in ``href`` values and in prose markdown links. The references are found
+# through the resolved catalog's reference index (see ``_RefIndex``).
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 
 # A markdown link into a document fragment, e.g. "[AC-1](#ac-1)".
@@ -805,40 +1002,107 @@ def _as_file_uri(href: str) -> str:
     return href
 
 
-def _collect_fragment_refs(node, out: set) -> None:
-    """Collect every ``#fragment`` referenced by an ``href`` or a prose markdown link."""
-    if isinstance(node, dict):
-        for key, val in node.items():
-            if key == "href" and isinstance(val, str) and val.startswith("#"):
-                out.add(val[1:])
-            elif isinstance(val, str):
-                for match in _MD_LINK_RE.finditer(val):
-                    out.add(match.group(1))
-            else:
-                _collect_fragment_refs(val, out)
-    elif isinstance(node, list):
-        for item in node:
-            _collect_fragment_refs(item, out)
+class _Materialized(NamedTuple):
+    """A controls_tree node materialized by :meth:`Profile.resolve`, ready for placement."""
+    group: bool      # True for a group, False for a control
+    node_id: str     # the controls_tree node id (the placed id)
+    content: dict    # the group's intrinsic content, or the full control
+    children: list   # materialized child nodes of a group (None entries are skipped)
 
 
-def _apply_ref_rewrite(node, base_for: dict) -> None:
-    """Rewrite ``#id`` refs to ``<base>#id`` in place for ids present in ``base_for``."""
-    if isinstance(node, dict):
-        for key, val in node.items():
-            if key == "href" and isinstance(val, str) and val.startswith("#") \
-                    and val[1:] in base_for:
-                node[key] = f"{base_for[val[1:]]}#{val[1:]}"
-            elif isinstance(val, str):
-                node[key] = _MD_LINK_RE.sub(
-                    lambda m: (f"]({base_for[m.group(1)]}#{m.group(1)})"
-                               if m.group(1) in base_for else m.group(0)),
-                    val,
-                )
-            else:
-                _apply_ref_rewrite(val, base_for)
-    elif isinstance(node, list):
-        for item in node:
-            _apply_ref_rewrite(item, base_for)
+class _ControlDeps(NamedTuple):
+    """The modify directives one resolved control depends on (see :meth:`Profile.resolve`)."""
+    node: dict              # the controls_tree control node
+    ancestors: tuple        # source ids of enclosing control nodes
+    alters: frozenset       # control-ids whose alters apply (own source id + ancestors)
+    params: frozenset       # param-ids whose set-parameters apply (defined + cited)
+    shared: tuple           # cited parameters hoisted to the catalog root, in order
+
+
+def _directive_changes(old: dict, new: dict) -> Optional[tuple]:
+    """Compare two ``modify`` directives by the ids they target.
+
+    Returns ``(control_ids, param_ids)``: the alter control-ids whose alters changed
+    and the param-ids whose set-parameters changed. Returns None when alters for
+    unchanged control-ids were reordered relative to one another, which can change
+    how an ancestor's alters combine with a nested control's.
+    """
+    def grouped(items, key: str) -> tuple:
+        by_id: dict = {}
+        for item in items:
+            if isinstance(item, dict):
+                by_id.setdefault(item.get(key), []).append(item)
+        return by_id, [item.get(key) for item in items if isinstance(item, dict)]
+
+    old_alters, old_order = grouped(old.get("alters", []), "control-id")
+    new_alters, new_order = grouped(new.get("alters", []), "control-id")
+    control_ids = {cid for cid in old_alters.keys() | new_alters.keys()
+                   if old_alters.get(cid) != new_alters.get(cid)}
+    if ([cid for cid in old_order if cid not in control_ids]
+            != [cid for cid in new_order if cid not in control_ids]):
+        return None
+    old_params = grouped(old.get("set-parameters", []), "param-id")[0]
+    new_params = grouped(new.get("set-parameters", []), "param-id")[0]
+    param_ids = {pid for pid in old_params.keys() | new_params.keys()
+                 if old_params.get(pid) != new_params.get(pid)}
+    return control_ids, param_ids
+
+
+def _json_copy(value):
+    """Return a detached copy of JSON-shaped data (dicts, lists, and scalars).
+
+    A cheaper stand-in for :func:`copy.deepcopy` on parsed OSCAL content, which holds
+    no shared or cyclic references.
+    """
+    if isinstance(value, dict):
+        return {key: _json_copy(val) for key, val in value.items()}
+    if isinstance(value, list):
+        return [_json_copy(item) for item in value]
+    return value
+
+
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# Profile resolution — persistent cache of resolved catalogs
+#
+# A resolved catalog is a pure function of the profile's content, the content of the
+# documents in its import tree, and where those documents were loaded from (out-of-scope
+# references are rewritten to their source URIs). Resolve results are stored in the
+# local cache database under a key fingerprinting all three, so a later process
+# resolving the same inputs rehydrates the catalog instead of re-materializing it.
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+# Bump when a change to resolve() alters its output, so stale cache entries miss.
+_RESOLUTION_CACHE_FORMAT = 1
+_RESOLUTION_CACHE_PREFIX = "oscal-resolved-profile:"
+
+
+def _resolution_cache_key(profile_dict: dict, documents: list) -> str:
+    """Return the local-cache key for resolving ``profile_dict`` over ``documents``.
+
+    Args:
+        profile_dict (dict, required): The profile's content.
+        documents (list, required): Every document in the profile's import tree.
+
+    Returns:
+        str: The key.
+    """
+    sources = [[_content_digest(obj), obj.href or obj.href_original or ""] for obj in documents]
+    payload = json.dumps([_RESOLUTION_CACHE_FORMAT, profile_dict, sources],
+                         sort_keys=True, separators=(",", ":"), default=str)
+    return _RESOLUTION_CACHE_PREFIX + hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _content_digest(obj: OSCAL) -> str:
+    """Return a SHA-256 digest of ``obj``'s JSON content, cached for its content version.
+
+    Hashing the content rather than the identity key means a source edited in place
+    (in this process, or on disk without a new ``last-modified``) yields a new key.
+    """
+    def digest() -> str:
+        payload = json.dumps(obj._dict, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    return obj._cached_serialization(("sha256",), digest)
 
 
 def _apply_one_set_parameter(param: dict, setp: dict) -> list:
@@ -913,6 +1177,15 @@ class Catalog(OSCAL):
         """
         super()._init_common()
         self.controls_tree: list[dict[str, Any]] = []
+        self._nodes: Optional[_NodeIndex] = None  # Lazily built node index (see _node_index)
+        self._nodes_version: int = -1             # content version _nodes reflects
+        self._refs: Optional[_RefIndex] = None    # Lazily built reference index (see _ref_index)
+        self._refs_version: int = -1              # content version _refs reflects
+        self._bulk_depth: int = 0                 # open bulk() blocks (see bulk)
+        self._tree_stale: bool = False            # controls_tree rebuild deferred by bulk()
+        self._tree_nodes: dict[int, tuple] = {}   # id(group/control) → (dict, controls_tree node)
+        self._tree_root: Optional[dict] = None    # catalog root controls_tree was built from
+        self._controls_tree_version: int = -1     # content version controls_tree reflects
         if self.is_valid:
             self._build_controls_tree()
 
@@ -937,6 +1210,8 @@ class Catalog(OSCAL):
             self._build_controls_tree()
         else:
             self.controls_tree = []
+            self._tree_stale = False
+            self._tree_root = None
         return result
 
     # -------------------------------------------------------------------------
@@ -947,6 +1222,274 @@ class Catalog(OSCAL):
         catalog = self._dict.get("catalog")
         return catalog if isinstance(catalog, dict) else {}
 
+    # -------------------------------------------------------------------------
+    def _node_index(self) -> _NodeIndex:
+        """Return the id index of the catalog's groups, controls, params, and parts.
+
+        Built on first use and reused while the content version is unchanged. The
+        catalog mutation methods patch it in place (see :meth:`_index_added` and
+        :meth:`_index_removed`); any other change to the content leaves it stale, and
+        it is rebuilt on the next lookup.
+        """
+        root = self._catalog_root()
+        if (self._nodes is None or self._nodes_version != self._content_version
+                or self._nodes.root is not root):
+            self._nodes = _NodeIndex(root)
+            self._nodes_version = self._content_version
+        return self._nodes
+
+    # -------------------------------------------------------------------------
+    def _warm_read_caches(self) -> None:
+        """Extends :meth:`OSCAL._warm_read_caches` with the node index."""
+        super()._warm_read_caches()
+        self._node_index()
+
+    # -------------------------------------------------------------------------
+    def _find_node(self, node_id: str, *kinds: str) -> Optional[dict]:
+        """Return the node with ``node_id`` under the first of ``kinds`` that has one, or None."""
+        ref = self._node_index().get(node_id, *kinds)
+        return ref.node if ref is not None else None
+
+    # -------------------------------------------------------------------------
+    def _index_patched(self) -> None:
+        """Carry the node index over the content-version bump of the current mutation.
+
+        Called by a mutation method once the index reflects its change; the version
+        bump that follows (from ``if_update_successful`` or an explicit
+        ``_content_changed``) then leaves the index current. An index that was already
+        stale stays stale.
+        """
+        if (self._nodes is not None and not self._nodes.duplicates
+                and self._nodes_version == self._content_version):
+            self._nodes_version = self._content_version + 1
+        if self._current_refs() is not None:
+            self._refs_version = self._content_version + 1
+
+    # -------------------------------------------------------------------------
+    def _index_added(self, node: dict, parent: dict, kind: str) -> None:
+        """Record a newly attached ``node`` (and its subtree) in the node and reference indexes."""
+        refs = self._current_refs()
+        if refs is not None:
+            refs.add(node)
+        self._node_index().add(node, parent, kind)
+        self._index_patched()
+        self._patch_indexes_at(parent, None, node, key=_NODE_LIST_KEYS[kind])
+
+    # -------------------------------------------------------------------------
+    def _index_removed(self, node: dict, kind: str) -> None:
+        """Drop a just-detached ``node`` (and its subtree) from the node and reference indexes."""
+        refs = self._current_refs()
+        if refs is not None:
+            refs.discard(node)
+        self._node_index().discard(node, kind)
+        self._index_patched()
+        self._discard_from_document_indexes(node)
+
+    # -------------------------------------------------------------------------
+    def _patch_indexes_at(self, node: dict, old: Any, new: Any, key: Optional[str] = None) -> None:
+        """Patch the id and prop indexes after a write to ``node``, or to its ``key`` list.
+
+        ``old`` and ``new`` are the value that was replaced and the one written, as for
+        :meth:`OSCAL._patch_document_indexes`. The trail down to ``node`` comes from the
+        node index; when it cannot be found both indexes are reset instead.
+        """
+        if self._id_index is None and self._prop_index is None:
+            self._document_indexes_patched()
+            return
+        trail = self._node_trail(node)
+        if trail is None:
+            self._reset_document_indexes()
+            return
+        if key is not None:
+            trail += (node[key],)
+        self._patch_document_indexes(trail, old, new)
+
+    # -------------------------------------------------------------------------
+    def _node_trail(self, node: dict) -> Optional[tuple]:
+        """Return the containers from the document down to ``node``, or None.
+
+        ``node`` is the catalog root or one of its groups, controls, params, or parts;
+        its ancestors are looked up in the node index. None when a node on the way is
+        not indexed under its id (it has none, or shares it with another node).
+        """
+        root = self._catalog_root()
+        nodes = self._node_index()
+        chain: list = []
+        while node is not root:
+            node_id = node.get("id")
+            ref = None
+            if isinstance(node_id, str):
+                ref = next((found for found in (nodes.get(node_id, kind) for kind in _NODE_KINDS)
+                            if found is not None and found.node is node), None)
+            if ref is None:
+                return None
+            chain += (node, ref.parent[_NODE_LIST_KEYS[ref.kind]])
+            node = ref.parent
+        return (self._dict, root, *reversed(chain))
+
+    # -------------------------------------------------------------------------
+    def _ref_index(self) -> _RefIndex:
+        """Return the reverse index of ``#id`` and ``{{ insert: param, id }}`` references.
+
+        Built on first use and kept current by the same mutation methods that patch
+        the node index; any other change leaves it stale, and it is rebuilt on the
+        next lookup.
+        """
+        refs = self._current_refs()
+        if refs is None:
+            refs = self._refs = _RefIndex(self._catalog_root())
+            self._refs_version = self._content_version
+        return refs
+
+    # -------------------------------------------------------------------------
+    def _current_refs(self) -> Optional[_RefIndex]:
+        """Return the reference index if it reflects the current content, else None."""
+        if (self._refs is not None and self._refs_version == self._content_version
+                and self._refs.root is self._catalog_root()):
+            return self._refs
+        return None
+
+    # -------------------------------------------------------------------------
+    def _local_ids(self) -> set:
+        """Return every ``id``/``uuid`` value in this catalog, from the reference index."""
+        return set(self._ref_index().defined)
+
+    # -------------------------------------------------------------------------
+    @contextmanager
+    def _refs_field(self, owner: dict, key: str):
+        """Keep the reference index current across a change to ``owner[key]``."""
+        refs = self._current_refs()
+        if refs is not None:
+            refs.discard_field(owner, key)
+        try:
+            yield
+        finally:
+            if refs is not None:
+                refs.add_field(owner, key)
+
+    # -------------------------------------------------------------------------
+    def _refill_control(self, control_id: str, content: dict) -> bool:
+        """Replace a control's own content in place, keeping its nested controls.
+
+        Used by incremental profile resolution (:meth:`Profile._update_resolution`).
+        The control keeps its position and enhancements; ``content`` is adopted. The
+        node and reference indexes and the ``controls_tree`` entry are patched, as
+        the public mutation methods do.
+
+        Args:
+            control_id (str, required): ID of the control to refill.
+            content (dict, required): The control's new content, without ``controls``.
+
+        Returns:
+            bool: True on success, False if no control has ``control_id``.
+        """
+        nodes = self._node_index()
+        ref = nodes.get(control_id, "control")
+        if ref is None:
+            return False
+        control, refs = ref.node, self._current_refs()
+        if refs is not None:
+            refs.discard(control)
+        nodes.discard(control, "control")
+        self._discard_from_document_indexes(control)
+        nested = control.get("controls")
+        control.clear()
+        control.update(content)
+        if nested is not None:
+            control["controls"] = nested
+        if refs is not None:
+            refs.add(control)
+        nodes.add(control, ref.parent, "control")
+        self._index_patched()
+        self._patch_indexes_at(ref.parent, None, control, key="controls")
+        self._tree_refreshed(control)
+        self._content_changed()
+        return True
+
+    # -------------------------------------------------------------------------
+    def _replace_root_params(self, params: list) -> None:
+        """Replace the catalog root's ``params`` (adopting ``params``), patching the indexes.
+
+        An empty list removes ``params``. A newly added ``params`` is kept ahead of
+        ``back-matter``, where profile resolution places it.
+        """
+        root = self._catalog_root()
+        nodes, refs = self._node_index(), self._current_refs()
+        replaced = root.get("params")
+        if refs is not None:
+            refs.discard_field(root, "params")
+        for param in root.get("params", []):
+            if isinstance(param, dict):
+                nodes.discard(param, "param")
+        if params:
+            root["params"] = params
+            if "back-matter" in root:
+                root["back-matter"] = root.pop("back-matter")
+        else:
+            root.pop("params", None)
+        for param in params:
+            if isinstance(param, dict):
+                nodes.add(param, root, "param")
+        if refs is not None:
+            refs.add_field(root, "params")
+        self._index_patched()
+        self._patch_indexes_at(root, replaced, root.get("params"))
+        self._tree_unaffected()
+        self._content_changed()
+
+    # -------------------------------------------------------------------------
+    def _find_local_element(self, fragment_id: str, kinds=None) -> Optional[dict]:
+        """Find an element identified by ``fragment_id`` in this catalog only.
+
+        Extends :meth:`OSCAL._find_local_element` by answering control, group, param,
+        and part lookups from the node index. Falls back to the document walk when
+        the id is ambiguous (it repeats, or names nodes of more than one wanted kind),
+        since the walk's order then decides which element is returned.
+        """
+        wanted = tuple(kinds) if kinds else self._RESOLVE_KINDS
+        other = tuple(k for k in wanted if k not in _NODE_KINDS)
+        if other:
+            found = super()._find_local_element(fragment_id, other)
+            if found is not None:
+                return found
+        node_kinds = tuple(k for k in wanted if k in _NODE_KINDS)
+        if not node_kinds:
+            return None
+        index = self._node_index()
+        refs = [ref for ref in (index.get(fragment_id, k) for k in node_kinds) if ref is not None]
+        if index.duplicates or len(refs) > 1:
+            return super()._find_local_element(fragment_id, node_kinds)
+        if not refs:
+            return None
+        return {"element": copy.deepcopy(refs[0].node), "kind": refs[0].kind, "id": fragment_id}
+
+    # -------------------------------------------------------------------------
+    @contextmanager
+    def bulk(self):
+        """Batch a run of catalog mutations, rebuilding ``controls_tree`` once at the end.
+
+        Inside the block, mutation methods that would refresh ``controls_tree`` mark it
+        stale instead; the tree is rebuilt once when the outermost block exits (also on
+        error). Lookups are unaffected — they use the node index, which every mutation
+        keeps current — but ``controls_tree`` itself is not refreshed until exit.
+        Blocks may be nested.
+
+        Example:
+            >>> with catalog.bulk():
+            ...     for ctrl in controls:
+            ...         catalog.insert_control("ac", ctrl, validate=False, adopt=True)
+
+        Yields:
+            Catalog: This catalog.
+        """
+        self._bulk_depth += 1
+        try:
+            yield self
+        finally:
+            self._bulk_depth -= 1
+            if not self._bulk_depth and self._tree_stale:
+                self._build_controls_tree()
+
     # -------------------------------------------------------------------------
     def __len__(self):
         """Return the total number of controls in the catalog at all levels."""
@@ -998,9 +1541,7 @@ class Catalog(OSCAL):
             if parent_id in ("", "[root]"):
                 parent = self._catalog_root()
             else:
-                parent = _find_group(self._catalog_root().get("groups", []), parent_id)
-                if parent is None:
-                    parent = _find_control(self._catalog_root(), parent_id)
+                parent = self._find_node(parent_id, "group", "control")
             if parent is None:
                 logger.warning(f"CREATE CONTROL: Unable to find parent group or control with id '{parent_id}'")
                 return None
@@ -1069,7 +1610,8 @@ class Catalog(OSCAL):
                 control["remarks"] = remarks
 
             parent.setdefault("controls", []).append(control)
-            self._build_controls_tree()
+            self._index_added(control, parent, "control")
+            self._tree_added(control, parent, is_group=False)
             # Return a safe copy — the live control stays in _dict; edits go through methods.
             return copy.deepcopy(control)
 
@@ -1142,7 +1684,7 @@ class Catalog(OSCAL):
             if parent_id == "[root]":
                 target = self._catalog_root()
             else:
-                target = _find_group(self._catalog_root().get("groups", []), parent_id)
+                target = self._find_node(parent_id, "group")
                 if target is None:
                     logger.warning(f"CREATE GROUP: Unable to find parent group with id '{parent_id}'")
                     return None
@@ -1156,7 +1698,8 @@ class Catalog(OSCAL):
                 return None
 
             target.setdefault("groups", []).append(group)
-            self._build_controls_tree()
+            self._index_added(group, target, "group")
+            self._tree_added(group, target, is_group=True)
             # Return a safe copy — the live group stays in _dict; edits go through methods.
             return copy.deepcopy(group)
 
@@ -1215,7 +1758,8 @@ class Catalog(OSCAL):
     # -------------------------------------------------------------------------
     @requires(is_read_only=False)
     @if_update_successful
-    def insert_control(self, parent_id: str, control: dict, validate: bool = True) -> Optional[dict]:
+    def insert_control(self, parent_id: str, control: dict, validate: bool = True,
+                       adopt: bool = False) -> Optional[dict]:
         """Insert a pre-formed control subtree whole under a parent, as a safe copy.
 
         Unlike :meth:`create_control` (which authors a control from discrete parts),
@@ -1225,7 +1769,8 @@ class Catalog(OSCAL):
         from a source catalog into a resolved one.
 
         The incoming dict is deep-copied before insertion, so the caller's object is not
-        aliased into the catalog (getters still return detached copies).
+        aliased into the catalog (getters still return detached copies), unless ``adopt``
+        hands it over.
 
         Args:
             parent_id (str, required): ID of the parent to add the control to —
@@ -1237,9 +1782,15 @@ class Catalog(OSCAL):
             validate (bool, optional): When True (default), the control is validated
                 against the ``control`` metaschema node first; on any error the insert is
                 rejected and the catalog is left unchanged.
+            adopt (bool, optional): When True, the catalog takes ownership of
+                ``control``: it is inserted as-is rather than copied, and the same dict is
+                returned. The caller must not modify it afterwards. For builders (e.g.
+                profile resolution) that hand over freshly made content. Defaults to
+                False.
 
         Returns:
-            Optional[dict]: A safe copy of the inserted control, or None on failure —
+            Optional[dict]: A safe copy of the inserted control (the adopted dict itself
+                when ``adopt`` is True), or None on failure —
                 bad input, parent not found, an id collision with an existing control, a
                 controls/groups mix, or failed validation.
         """
@@ -1251,9 +1802,7 @@ class Catalog(OSCAL):
         if parent_id in ("", "[root]"):
             parent = self._catalog_root()
         else:
-            parent = _find_group(self._catalog_root().get("groups", []), parent_id)
-            if parent is None:
-                parent = _find_control(self._catalog_root(), parent_id)
+            parent = self._find_node(parent_id, "group", "control")
         if parent is None:
             logger.warning(f"insert_control: parent group or control '{parent_id}' not found.")
             return None
@@ -1265,11 +1814,11 @@ class Catalog(OSCAL):
             )
             return None
 
-        if _find_control(self._catalog_root(), cid) is not None:
+        if self._find_node(cid, "control") is not None:
             logger.warning(f"insert_control: control id '{cid}' already exists in the catalog.")
             return None
 
-        node = copy.deepcopy(control)
+        node = control if adopt else copy.deepcopy(control)
         if validate:
             errors = self._validate_subtree(node, "control")
             if errors:
@@ -1278,7 +1827,10 @@ class Catalog(OSCAL):
                 return None
 
         parent.setdefault("controls", []).append(node)
-        self._build_controls_tree()
+        self._index_added(node, parent, "control")
+        self._tree_added(node, parent, is_group=False)
+        if adopt:
+            return node
         # Return a safe copy — the live control stays in _dict; edits go through methods.
         return copy.deepcopy(node)
 
@@ -1286,7 +1838,7 @@ class Catalog(OSCAL):
     @requires(is_read_only=False)
     @if_update_successful
     def insert_group(self, parent_id: str, group: dict, shallow: bool = True,
-                     validate: bool = True) -> Optional[dict]:
+                     validate: bool = True, adopt: bool = False) -> Optional[dict]:
         """Insert a group node under a parent, as a safe copy.
 
         Companion to :meth:`insert_control` for faithful-copy workflows. By default the
@@ -1308,9 +1860,13 @@ class Catalog(OSCAL):
             validate (bool, optional): When True (default), validate the (possibly
                 shallow) group against the ``group`` metaschema node first; on any error
                 the insert is rejected and the catalog is left unchanged.
+            adopt (bool, optional): When True, the catalog takes ownership of ``group``
+                (see :meth:`insert_control`): it is inserted as-is (a shallow insert drops
+                its children in place) and the same dict is returned. Defaults to False.
 
         Returns:
-            Optional[dict]: A safe copy of the inserted group, or None on failure — bad
+            Optional[dict]: A safe copy of the inserted group (the adopted dict itself
+                when ``adopt`` is True), or None on failure — bad
                 input, parent not found, an id collision with an existing group, a
                 controls/groups mix, or failed validation.
         """
@@ -1322,7 +1878,7 @@ class Catalog(OSCAL):
         if parent_id in ("", "[root]"):
             parent = self._catalog_root()
         else:
-            parent = _find_group(self._catalog_root().get("groups", []), parent_id)
+            parent = self._find_node(parent_id, "group")
         if parent is None:
             logger.warning(f"insert_group: parent group '{parent_id}' not found.")
             return None
@@ -1334,11 +1890,11 @@ class Catalog(OSCAL):
             )
             return None
 
-        if _find_group(self._catalog_root().get("groups", []), gid) is not None:
+        if self._find_node(gid, "group") is not None:
             logger.warning(f"insert_group: group id '{gid}' already exists in the catalog.")
             return None
 
-        node = copy.deepcopy(group)
+        node = group if adopt else copy.deepcopy(group)
         if shallow:
             node.pop("groups", None)
             node.pop("controls", None)
@@ -1350,7 +1906,10 @@ class Catalog(OSCAL):
                 return None
 
         parent.setdefault("groups", []).append(node)
-        self._build_controls_tree()
+        self._index_added(node, parent, "group")
+        self._tree_added(node, parent, is_group=True)
+        if adopt:
+            return node
         # Return a safe copy — the live group stays in _dict; edits go through methods.
         return copy.deepcopy(node)
 
@@ -1371,7 +1930,7 @@ class Catalog(OSCAL):
         Returns:
             Optional[dict]: A safe copy of the matching control, or None if not found.
         """
-        control = _find_control(self._catalog_root(), control_id)
+        control = self._find_node(control_id, "control")
         return prune_tree_copy(control, depth, child_keys=("controls",))
 
     # -------------------------------------------------------------------------
@@ -1392,7 +1951,7 @@ class Catalog(OSCAL):
         Returns:
             Optional[dict]: A safe copy of the matching group, or None if not found.
         """
-        group = _find_group(self._catalog_root().get("groups", []), group_id)
+        group = self._find_node(group_id, "group")
         return prune_tree_copy(group, depth, child_keys=("groups", "controls"))
 
     # -------------------------------------------------------------------------
@@ -1450,12 +2009,7 @@ class Catalog(OSCAL):
             logger.warning(f"ADD PART: a '{name}' part may not contain child parts.")
             return None
         try:
-            root = self._catalog_root()
-            parent = _find_group(root.get("groups", []), parent_id)
-            if parent is None:
-                parent = _find_control(root, parent_id)
-            if parent is None:
-                parent = _find_part(root, parent_id)
+            parent = self._find_node(parent_id, "group", "control", "part")
             if parent is None:
                 logger.warning(f"ADD PART: Unable to find control, group, or part with id '{parent_id}'")
                 return None
@@ -1485,6 +2039,8 @@ class Catalog(OSCAL):
                 part["parts"] = list(parts)
 
             parent.setdefault("parts", []).append(part)
+            self._index_added(part, parent, "part")
+            self._tree_unaffected()
             # Return a safe copy — the live part stays in _dict; edits go through methods.
             return copy.deepcopy(part)
 
@@ -1509,14 +2065,18 @@ class Catalog(OSCAL):
             Optional[dict]: The modified part dict, or None if no part with that id
                 is found.
         """
-        part = _find_part(self._catalog_root(), part_id)
+        part = self._find_node(part_id, "part")
         if part is None:
             logger.warning(f"SET PART TITLE: no part found with id '{part_id}'")
             return None
-        if title:
-            part["title"] = title
-        else:
-            part.pop("title", None)
+        with self._refs_field(part, "title"):
+            if title:
+                part["title"] = title
+            else:
+                part.pop("title", None)
+        self._index_patched()
+        self._document_indexes_patched()
+        self._tree_unaffected()
         # Return a safe copy — the live part stays in _dict; edits go through methods.
         return copy.deepcopy(part)
 
@@ -1534,11 +2094,7 @@ class Catalog(OSCAL):
         Returns:
             Optional[dict]: The matching group or control dict, or None.
         """
-        root = self._catalog_root()
-        obj = _find_group(root.get("groups", []), id)
-        if obj is None:
-            obj = _find_control(root, id)
-        return obj
+        return self._find_node(id, "group", "control")
 
     # -------------------------------------------------------------------------
     @requires(is_read_only=False)
@@ -1565,8 +2121,11 @@ class Catalog(OSCAL):
         if obj is None:
             logger.warning(f"SET TITLE: no control or group found with id '{id}'")
             return None
-        obj["title"] = title
-        self._build_controls_tree()
+        with self._refs_field(obj, "title"):
+            obj["title"] = title
+        self._index_patched()
+        self._document_indexes_patched()
+        self._tree_refreshed(obj)
         # Return a safe copy — the live node stays in _dict; edits go through methods.
         return copy.deepcopy(obj)
 
@@ -1619,25 +2178,29 @@ class Catalog(OSCAL):
                 return False
             return True
 
-        props = obj.get("props", [])
-        if label == "":
-            remaining = [p for p in props if not _matches(p)]
-            if remaining:
-                obj["props"] = remaining
-            else:
-                obj.pop("props", None)
-        else:
-            existing = [p for p in props if _matches(p)]
-            if existing:
-                existing[0]["value"] = label
+        with self._refs_field(obj, "props"):
+            props = obj.get("props", [])
+            before = list(props) if "props" in obj else None
+            if label == "":
+                remaining = [p for p in props if not _matches(p)]
+                if remaining:
+                    obj["props"] = remaining
+                else:
+                    obj.pop("props", None)
             else:
-                new_prop: dict[str, Any] = {"name": "label", "value": label}
-                if class_:
-                    new_prop["class"] = class_
-                if group:
-                    new_prop["group"] = group
-                append_props(obj, [new_prop])
-        self._build_controls_tree()
+                existing = [p for p in props if _matches(p)]
+                if existing:
+                    existing[0]["value"] = label
+                else:
+                    new_prop: dict[str, Any] = {"name": "label", "value": label}
+                    if class_:
+                        new_prop["class"] = class_
+                    if group:
+                        new_prop["group"] = group
+                    append_props(obj, [new_prop])
+        self._index_patched()
+        self._patch_indexes_at(obj, before, obj.get("props"))
+        self._tree_refreshed(obj)
         # Return a safe copy — the live node stays in _dict; edits go through methods.
         return copy.deepcopy(obj)
 
@@ -1653,16 +2216,10 @@ class Catalog(OSCAL):
             ``"groups"`` or ``"controls"``) is the list holding ``obj``; or
             ``(None, None, None)`` when no group/control has that id.
         """
-        root = self._catalog_root()
-        stack = [root]
-        while stack:
-            container = stack.pop()
-            for kind in ("groups", "controls"):
-                for child in container.get(kind, []):
-                    if child.get("id") == id:
-                        return container, kind, child
-                    stack.append(child)
-        return None, None, None
+        ref = self._node_index().get(id, "group", "control")
+        if ref is None:
+            return None, None, None
+        return ref.parent, ref.kind + "s", ref.node
 
     # -------------------------------------------------------------------------
     @staticmethod
@@ -1737,27 +2294,92 @@ class Catalog(OSCAL):
     def _external_referenced_ids(self, skip_obj: dict, id_list: list) -> list:
         """Return which of ``id_list`` are referenced from *outside* ``skip_obj``.
 
-        Scans the catalog's group/control/part links for hrefs of the form
-        ``#<id>`` targeting one of the ids that would be removed, ignoring links that
-        live inside the ``skip_obj`` subtree (those would be removed too and so can't
+        Looks up, in the reference index, the group/control/part links whose href is
+        ``#<id>`` for one of the ids that would be removed, ignoring links that live
+        inside the ``skip_obj`` subtree (those would be removed too and so can't
         dangle). Result preserves ``id_list`` order.
         """
-        target_set = set(id_list)
-        referenced: set = set()
+        refs = self._ref_index()
+        inside: set[int] = set()
 
         def walk(node: dict) -> None:
-            if node is skip_obj:
-                return  # do not look inside the branch being removed
-            for link in node.get("links", []):
-                href = link.get("href", "")
-                if href.startswith("#") and href[1:] in target_set:
-                    referenced.add(href[1:])
-            for kind in ("groups", "controls", "parts"):
+            inside.add(id(node))
+            for kind in _OWNER_LISTS:
                 for child in node.get(kind, []):
-                    walk(child)
+                    if isinstance(child, dict):
+                        walk(child)
+
+        walk(skip_obj)
+        return [i for i in id_list
+                if any(site.link and id(site.owner) not in inside
+                       for site in refs.referrers(i, ("href",)))]
+
+    # -------------------------------------------------------------------------
+    def _check_referential_integrity(self, path: str, value, mode: str) -> bool:
+        """Reject a replacing write that would leave catalog references dangling.
+
+        Extends :meth:`OSCAL._check_referential_integrity`. An id (or uuid) defined
+        only in the value being replaced, and absent from ``value``, disappears with
+        the write; when a ``#id`` href, markdown link, or ``{{ insert: param, id }}``
+        outside the replaced value still refers to it, the write is refused. Each
+        check is a lookup in the reference index (see :meth:`_ref_index`). Inserts
+        only add content and always pass.
+
+        Args:
+            path (str, required): The slash path being written.
+            value (Any, required): The value being written.
+            mode (str, required): The write mode ("replace" or "insert").
 
-        walk(self._catalog_root())
-        return [i for i in id_list if i in referenced]
+        Returns:
+            bool: True when the write is permitted.
+        """
+        if mode != "replace":
+            return True
+        parts = [p for p in path.strip("/").split("/") if p != ""]
+        parent: Any = self._catalog_root()
+        for part in parts[:-1]:
+            parent = self._path_step(parent, part)
+            if parent is None:
+                return True   # put creates the path; nothing is being replaced
+        old = self._path_step(parent, parts[-1])
+        if old is None:
+            return True
+
+        leaf = parts[-1]
+        removed = _RefIndex({leaf: old}).defined
+        added = _RefIndex({leaf: value}).defined
+        refs = self._ref_index()
+        gone = [i for i, n in removed.items()
+                if n > added.get(i, 0) and refs.defined.get(i, 0) - n + added.get(i, 0) <= 0]
+        if not gone:
+            return True
+
+        # References held inside the replaced value (or in the slot itself) go with it.
+        slot = (id(parent), self._as_index(leaf) if isinstance(parent, list) else leaf)
+        inside: set[int] = set()
+        stack = [old]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, (dict, list)):
+                inside.add(id(node))
+                stack.extend(node.values() if isinstance(node, dict) else node)
+        dangling = sorted({i for i in gone for site in refs.referrers(i)
+                           if id(site.container) not in inside
+                           and (id(site.container), site.key) != slot})
+        if dangling:
+            logger.error(f"put: writing '{path}' would leave references to {dangling} dangling.")
+            return False
+        return True
+
+    # -------------------------------------------------------------------------
+    def _path_step(self, node, segment: str):
+        """Return ``node[segment]`` for a dict key or list index, or None when absent."""
+        if isinstance(node, dict):
+            return node.get(segment)
+        if isinstance(node, list):
+            idx = self._as_index(segment)
+            return node[idx] if idx is not None and idx < len(node) else None
+        return None
 
     # -------------------------------------------------------------------------
     @requires(is_read_only=False)
@@ -1832,13 +2454,18 @@ class Catalog(OSCAL):
         # OSCAL keeps empty arrays out of content; drop the list if it is now empty.
         if not container[kind]:
             container.pop(kind, None)
+        self._index_removed(obj, kind[:-1])
 
-        targets = {f"#{rid}" for rid in would_remove}
-        dangling_refs = self._scan_dangling_refs(self._catalog_root(), targets)
+        # Only links counted in referenced_ids can dangle; skip the scan when none do.
+        dangling_refs: list = []
+        if referenced_ids:
+            targets = {f"#{rid}" for rid in referenced_ids}
+            dangling_refs = self._scan_dangling_refs(self._catalog_root(), targets)
 
-        self._build_controls_tree()
+        self._tree_removed(obj, container)
         self.is_unsaved = True
         self.last_modified = oscal_date_time_with_timezone()
+        self._content_changed()
 
         logger.warning(
             f"REMOVE: removed {len(would_remove)} object(s) [{', '.join(would_remove)}]; "
@@ -1864,22 +2491,121 @@ class Catalog(OSCAL):
         Returns:
             dict: A node ``{"id", "label", "title", "group", "children"}``.
         """
-        label_props = get_props(obj, name="label")
-        label = label_props[0].get("value", "") if label_props else ""
-
         children: list[dict[str, Any]] = []
         for grp in obj.get("groups", []):
             children.append(self._tree_node(grp, is_group=True))
         for ctrl in obj.get("controls", []):
             children.append(self._tree_node(ctrl, is_group=False))
 
-        return {
+        node = {
             "id":       obj.get("id", ""),
-            "label":    label,
+            "label":    self._tree_label(obj, self._document_prop_index()),
             "title":    obj.get("title", ""),
             "group":    is_group,
             "children": children,
         }
+        self._tree_nodes[id(obj)] = (obj, node)
+        return node
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def _tree_label(obj: dict, index=None) -> str:
+        """Return the ``controls_tree`` label of a group or control (see :meth:`_tree_node`)."""
+        label_props = get_props(obj, name="label", index=index)
+        return label_props[0].get("value", "") if label_props else ""
+
+    # -------------------------------------------------------------------------
+    def _tree_patchable(self) -> bool:
+        """Return True when ``controls_tree`` is current and may be patched in place."""
+        return (self._tree_root is not None and self._tree_root is self._catalog_root()
+                and self._controls_tree_version == self._content_version)
+
+    # -------------------------------------------------------------------------
+    def _tree_entry(self, obj: dict) -> Optional[dict]:
+        """Return the ``controls_tree`` node built for ``obj``, or None if it has none."""
+        entry = self._tree_nodes.get(id(obj))
+        return entry[1] if entry is not None and entry[0] is obj else None
+
+    # -------------------------------------------------------------------------
+    def _tree_siblings(self, container: dict) -> Optional[list]:
+        """Return the ``controls_tree`` list mirroring ``container``'s groups and controls."""
+        if container is self._tree_root:
+            return self.controls_tree
+        node = self._tree_entry(container)
+        return node["children"] if node is not None else None
+
+    # -------------------------------------------------------------------------
+    def _tree_patched(self, patched: bool) -> None:
+        """Finish a ``controls_tree`` update made by a mutation method.
+
+        Falls back to a full rebuild when the in-place patch was not possible, then
+        carries the tree over the content-version bump of the current mutation (see
+        :meth:`_index_patched`).
+        """
+        if not patched:
+            self._build_controls_tree()
+        self._controls_tree_version = self._content_version + 1
+
+    # -------------------------------------------------------------------------
+    def _tree_unaffected(self) -> None:
+        """Carry a current ``controls_tree`` over a mutation that does not change it."""
+        if self._tree_patchable():
+            self._controls_tree_version = self._content_version + 1
+
+    # -------------------------------------------------------------------------
+    def _tree_added(self, obj: dict, container: dict, is_group: bool) -> None:
+        """Add the ``controls_tree`` node for a newly attached group or control.
+
+        Groups precede controls among a node's children, so a group is placed after
+        its last group sibling and a control at the end.
+        """
+        if self._bulk_depth:
+            self._tree_stale = True
+            return
+        siblings = self._tree_siblings(container) if self._tree_patchable() else None
+        if siblings is not None:
+            at = sum(1 for n in siblings if n["group"]) if is_group else len(siblings)
+            siblings.insert(at, self._tree_node(obj, is_group))
+        self._tree_patched(siblings is not None)
+
+    # -------------------------------------------------------------------------
+    def _tree_removed(self, obj: dict, container: dict) -> None:
+        """Drop the ``controls_tree`` node of a just-detached group or control."""
+        if self._bulk_depth:
+            self._tree_stale = True
+            return
+        patched = False
+        if self._tree_patchable():
+            siblings = self._tree_siblings(container)
+            node = self._tree_entry(obj)
+            for i, sibling in enumerate(siblings or []):
+                if sibling is node:
+                    del siblings[i]
+                    self._forget_tree_nodes(obj)
+                    patched = True
+                    break
+        self._tree_patched(patched)
+
+    # -------------------------------------------------------------------------
+    def _forget_tree_nodes(self, obj: dict) -> None:
+        """Remove ``obj`` and its nested groups/controls from the tree-node map."""
+        self._tree_nodes.pop(id(obj), None)
+        for kind in ("groups", "controls"):
+            for child in obj.get(kind, []):
+                if isinstance(child, dict):
+                    self._forget_tree_nodes(child)
+
+    # -------------------------------------------------------------------------
+    def _tree_refreshed(self, obj: dict) -> None:
+        """Refresh the ``title`` and ``label`` of ``obj``'s ``controls_tree`` node."""
+        if self._bulk_depth:
+            self._tree_stale = True
+            return
+        node = self._tree_entry(obj) if self._tree_patchable() else None
+        if node is not None:
+            node["title"] = obj.get("title", "")
+            node["label"] = self._tree_label(obj)
+        self._tree_patched(node is not None)
 
     # -------------------------------------------------------------------------
     def _build_controls_tree(self) -> list[dict[str, Any]]:
@@ -1889,11 +2615,18 @@ class Catalog(OSCAL):
         nodes mirroring the catalog's groups and controls, intended for tree
         navigation in a UI. Rebuilt from the current ``_dict`` on each call, so it
         is safe to call after any structural change. Also stored on
-        ``self.controls_tree``.
+        ``self.controls_tree``. Inside a :meth:`bulk` block the rebuild is deferred
+        to the end of the block.
 
         Returns:
-            list: The freshly built ``controls_tree``.
+            list: The freshly built ``controls_tree`` (the current, stale one when
+                deferred).
         """
+        if self._bulk_depth:
+            self._tree_stale = True
+            return self.controls_tree
+        self._tree_stale = False
+        self._tree_nodes = {}
         root = self._catalog_root()
         tree: list[dict[str, Any]] = []
         for grp in root.get("groups", []):
@@ -1901,6 +2634,8 @@ class Catalog(OSCAL):
         for ctrl in root.get("controls", []):
             tree.append(self._tree_node(ctrl, is_group=False))
         self.controls_tree = tree
+        self._tree_root = root
+        self._controls_tree_version = self._content_version
         return tree
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
@@ -1968,8 +2703,18 @@ class Profile(OSCAL):
         # Set whenever imports/directives change; the tree is rebuilt on next access.
         self._tree_dirty: bool = True
         # Cached index of this profile's modify directives (alters by control-id,
-        # set-parameters by param-id); rebuilt lazily and cleared with the tree.
+        # set-parameters by param-id); rebuilt lazily, cleared with the tree and on edits.
         self._modify_idx: Optional[dict] = None
+        # What the resolved catalog was built from, for incremental updates (see
+        # _update_resolution): {directives, controls: [_ControlDeps], rewritten}.
+        self._resolution_deps: Optional[dict] = None
+        # Just-in-time materialized controls, {(node id, depth): control or None}, for
+        # reads while unresolved; cleared with the modify index and checked against the
+        # import tree's content versions (see _jit_control).
+        self._jit_controls: dict[tuple, Optional[dict]] = {}
+        self._jit_stamp: Optional[tuple] = None
+        # Id maps over controls_tree: (tree they were built from, controls, groups).
+        self._tree_ids: Optional[tuple] = None
 
         # Best-effort build at load; guarded so content-not-ready never breaks init.
         try:
@@ -1983,32 +2728,180 @@ class Profile(OSCAL):
         if self._tree_dirty:
             self._build_controls_tree()
 
+    # -------------------------------------------------------------------------
+    def _tree_lookup(self) -> tuple:
+        """Return id maps over :attr:`controls_tree`, rebuilding it first if stale.
+
+        Built on first use after each tree (re)build. Where an id repeats, the first
+        node in depth-first order wins, as with :func:`_find_tree_node`.
+
+        Returns:
+            tuple: ``(controls, groups)`` where ``controls`` maps a control id to
+                ``(node, ancestor_source_ids)`` and ``groups`` maps a group id to its node.
+        """
+        self._ensure_controls_tree()
+        tree = self.controls_tree
+        if self._tree_ids is None or self._tree_ids[0] is not tree:
+            controls: dict[str, tuple] = {}
+            for node, ancestors in _all_control_nodes_with_ancestors(tree):
+                controls.setdefault(node.get("id"), (node, ancestors))
+            groups: dict[str, dict] = {}
+            stack = list(reversed(tree))
+            while stack:
+                node = stack.pop()
+                if node.get("group"):
+                    groups.setdefault(node.get("id"), node)
+                stack.extend(reversed(node.get("children", [])))
+            self._tree_ids = (tree, controls, groups)
+        return self._tree_ids[1], self._tree_ids[2]
+
+    # -------------------------------------------------------------------------
+    def _warm_read_caches(self) -> None:
+        """Extends :meth:`OSCAL._warm_read_caches` with the controls_tree id maps, the
+        modify index, and the resolved catalog's caches."""
+        super()._warm_read_caches()
+        self._tree_lookup()
+        self._modify_index()
+        if self.catalog is not None:
+            self.catalog._warm_read_caches()
+
     # -------------------------------------------------------------------------
     def _on_content_mutated(self) -> None:
-        """React to any edit of the profile's content by dropping a stale resolved catalog.
+        """React to any edit of the profile's content by updating or dropping the resolved catalog.
 
         Invoked automatically after every successful content mutation (via
         :func:`if_update_successful` and :meth:`OSCAL.put`). A resolved catalog reflects
-        the profile as it was *before* the edit, so any change resets the profile to
-        ``UNRESOLVED``; re-run :meth:`resolve` to rebuild it. (Manual duplicate resolution
-        edits :attr:`catalog` through Catalog methods, which do not trigger this hook, so
-        those intentionally keep the profile resolved.)
+        the profile as it was *before* the edit. When the edit only changed ``modify``
+        directives, :meth:`_update_resolution` re-materializes the affected controls in
+        place and the profile reports ``INCREMENTAL``; any other change resets the
+        profile to ``UNRESOLVED``; re-run :meth:`resolve` to rebuild it. (Manual
+        duplicate resolution edits :attr:`catalog` through Catalog methods, which do not
+        trigger this hook, so those intentionally keep the profile resolved.)
 
         This does not itself mark the ``controls_tree`` stale: scope/organization mutators
         (:meth:`add_import`, :meth:`set_merge`) already set ``_tree_dirty`` and rebuild;
         edits that don't affect scope (e.g. metadata) leave the tree valid. Any future
         directive editor that changes scope must set ``_tree_dirty`` itself.
         """
-        self._invalidate_resolution()
+        self._modify_idx = None
+        self._jit_controls = {}
+        if not self._update_resolution():
+            self._invalidate_resolution()
 
     # -------------------------------------------------------------------------
     def _invalidate_resolution(self) -> None:
         """Drop the resolved catalog and reset the profile to ``UNRESOLVED``."""
+        self._resolution_deps = None
         if self.resolution_status != ResolutionStatus.UNRESOLVED or self.catalog is not None:
             self.catalog = None
             self.resolution_status = ResolutionStatus.UNRESOLVED
             self.resolution_state = "unresolved"
 
+    # -------------------------------------------------------------------------
+    def _has_resolution(self) -> bool:
+        """Return True when :attr:`catalog` holds a current resolution (RESOLVED or INCREMENTAL)."""
+        return (self.resolution_status in (ResolutionStatus.RESOLVED, ResolutionStatus.INCREMENTAL)
+                and self.catalog is not None)
+
+    # -------------------------------------------------------------------------
+    def _update_resolution(self) -> bool:
+        """Bring the resolved catalog up to date after an edit to ``modify`` directives.
+
+        Compares the profile with the content the catalog was resolved from (recorded
+        by :meth:`resolve`). When only alters and set-parameters changed, each control
+        whose :class:`_ControlDeps` name a changed alter's ``control-id`` or a changed
+        set-parameter's ``param-id`` is re-materialized and refilled in place
+        (:meth:`Catalog._refill_control`); the hoisted root parameters are re-collected
+        and out-of-scope references rewritten as :meth:`resolve` does, so the catalog
+        matches a full resolve. Other edits (imports and their selections, merge,
+        metadata), and directive edits that reach beyond the refilled controls — a
+        newly defined id that other controls' rewritten references point at, or a
+        change in carried back-matter — are left to a full resolve.
+
+        Returns:
+            bool: True when the catalog is current (updated, or unaffected by the edit);
+                False when it must be discarded.
+        """
+        deps = self._resolution_deps
+        target = self.catalog
+        if (deps is None or target is None or not self._has_resolution()
+                or self._tree_dirty or not isinstance(self._dict, dict)):
+            return False
+        root = self._dict.get(self.model, {})
+        before = deps["directives"]
+        if ({key: val for key, val in root.items() if key != "modify"}
+                != {key: val for key, val in before.items() if key != "modify"}):
+            return False
+        old_modify, new_modify = before.get("modify", {}), root.get("modify", {})
+        if not isinstance(old_modify, dict) or not isinstance(new_modify, dict):
+            return False
+        changes = _directive_changes(old_modify, new_modify)
+        if changes is None:
+            return False
+        control_ids, param_ids = changes
+        stale = [i for i, dep in enumerate(deps["controls"])
+                 if dep.alters & control_ids or dep.params & param_ids]
+        if stale and not self._refill_stale(target, stale):
+            return False
+        deps["directives"] = copy.deepcopy(root)
+        if stale:
+            self.resolution_status = ResolutionStatus.INCREMENTAL
+            self.resolution_state = "incremental"
+            self.resolved_datetime = datetime.now(timezone.utc)
+            logger.info(f"resolve: re-materialized {len(stale)} control(s) affected by a "
+                        "directive edit.")
+        return True
+
+    # -------------------------------------------------------------------------
+    def _refill_stale(self, target: "Catalog", stale: list) -> bool:
+        """Re-materialize the controls at ``stale`` positions of the dependency record.
+
+        Returns:
+            bool: True when ``target`` was updated; False when the update cannot
+                reproduce a full resolve (``target`` may then be partly updated).
+        """
+        deps = self._resolution_deps
+        controls = list(deps["controls"])
+        defined = set(target._ref_index().defined)
+        # Read parameters from the import tree, as resolve does, not from self.catalog.
+        self.resolution_status = ResolutionStatus.RESOLVING
+        for i in stale:
+            dep, record = controls[i], []
+            content = self._materialize_control_node(dep.node, depth=0, ancestors=dep.ancestors,
+                                                     shared_sink=[], deps=record)
+            if content is None or not target._refill_control(dep.node.get("id"), content):
+                return False
+            controls[i] = record[0]
+
+        shared: list = []
+        seen: set = set()
+        for dep in controls:
+            for param in dep.shared:
+                pid = param.get("id")
+                if pid and pid not in seen:
+                    shared.append(param)
+                    seen.add(pid)
+        current = target._catalog_root().get("params", [])
+        if len(shared) != len(current) or any(a is not b for a, b in zip(shared, current)):
+            target._replace_root_params(shared)
+
+        refs = target._ref_index()
+        if (set(refs.defined) - defined) & deps["rewritten"]:
+            return False
+        resources = target._catalog_root().get("back-matter", {}).get("resources", [])
+        carried = {res.get("uuid") for res in resources if isinstance(res, dict)}
+        uuid_refs = {ref for ref in refs.targets(("href",)) if _UUID_RE.match(ref)}
+        if not carried <= uuid_refs or (uuid_refs - carried) & self._backmatter_resources().keys():
+            return False
+
+        deps["rewritten"] |= self._rewrite_out_of_scope_refs(target)
+        deps["controls"] = controls
+        target.validate()
+        if not target.is_valid:
+            logger.warning("resolve: updated catalog did not pass validation; "
+                           "inspect Profile.catalog.validation_errors.")
+        return True
+
     # -------------------------------------------------------------------------
     def validate(self, format: str = "") -> bool:
         """Validate the profile, then (re)build ``controls_tree`` on success.
@@ -2054,6 +2947,7 @@ class Profile(OSCAL):
         """
         self.duplicates = {"controls": {}, "groups": {}}
         self._modify_idx = None
+        self._jit_controls = {}
         if not isinstance(self._dict, dict) or self.model not in self._dict:
             self.controls_tree = []
             return
@@ -2640,7 +3534,8 @@ class Profile(OSCAL):
     # =========================================================================
     # Profile resolution: materialize the resolved catalog in self.catalog
     # =========================================================================
-    def resolve(self) -> "ResolutionStatus":
+    def resolve(self, *, cache_directive: "CacheDirective | None" = None,
+                workers: int = 1) -> "ResolutionStatus":
         """Materialize the profile's controls_tree into a fresh ``self.catalog``.
 
         Resolution is the cacheable heavy step: it walks the profile's
@@ -2658,6 +3553,33 @@ class Profile(OSCAL):
         Because content is fetched through each source's own getters, imported *profiles*
         need not be pre-resolved — their load-time controls_tree and lazy getters suffice.
 
+        With a ``cache_directive``, the result is also kept in the local cache database,
+        keyed by a fingerprint of this profile's content plus the content and location
+        of every document in its import tree. A later resolve of the same inputs — in
+        this or another process — loads the stored catalog instead of materializing it.
+        The directive governs reuse as for remote content: its TTL bounds the age of a
+        stored result, ``refresh`` resolves anew and replaces it, and ``CACHE_NEVER``
+        purges it.
+
+        Resolution runs in two phases: every controls_tree node is materialized
+        independently (:meth:`_materialize_tree`), then the results are placed into the
+        catalog in tree order. With ``workers`` > 1 the first phase runs top-level
+        subtrees on a thread pool; the output is identical either way. The work is
+        CPU-bound Python, so the gain depends on the interpreter running threads in
+        parallel (a free-threaded build).
+
+        Each materialized control's dependencies on ``modify`` directives are recorded
+        (:class:`_ControlDeps`), so a later edit to alters or set-parameters updates
+        only the controls it reaches, in place, and reports ``INCREMENTAL`` (see
+        :meth:`_update_resolution`).
+
+        Args:
+            cache_directive (CacheDirective | None, optional): Enables the persistent
+                resolution cache under this directive. Keyword-only. Defaults to None
+                (always resolve; nothing is stored).
+            workers (int, optional): Threads for the materialize phase. Keyword-only.
+                Defaults to 1 (in-line).
+
         Returns:
             ResolutionStatus: ``RESOLVED`` on success, or ``BLOCKED`` when content is
                 missing or an import could not be resolved.
@@ -2681,49 +3603,144 @@ class Profile(OSCAL):
             self.resolution_state = "blocked"
             return self.resolution_status
 
+        cache_key = None
+        if cache_directive is not None:
+            cache_key = _resolution_cache_key(self._dict, self._all_import_objects())
+            cached = self._cached_resolution(cache_key, cache_directive)
+            if cached is not None:
+                return self._install_resolution(cached, "loaded resolved catalog from the local cache")
+
         target = cast(Catalog, Catalog.new(self._profile_title()))
-        shared_params: list = []   # cited-but-externally-defined params, hoisted to root
-        for node in self.controls_tree:
-            self._materialize_into_catalog(target, node, "[root]", shared_params)
+        materialized, shared_params, deps = self._materialize_tree(workers)
+        with target.bulk():
+            for item in materialized:
+                self._place_materialized(target, item, "[root]")
         self._insert_shared_params(target, shared_params)
 
         self._assemble_metadata(target, sources)
         self._carry_backmatter(target)
-        self._rewrite_out_of_scope_refs(target)
+        target._content_changed()   # the steps above edit target._dict directly
+        rewritten = self._rewrite_out_of_scope_refs(target)
 
         target.validate()
         if not target.is_valid:
             logger.warning("resolve: resolved catalog did not pass validation; "
                            "inspect Profile.catalog.validation_errors.")
+        elif cache_key:
+            get_local_cache().put(cache_key, target.dumps(format="json"), cache_directive,
+                                  file_type="resolved-profile")
+        return self._install_resolution(target, "produced catalog", {
+            "directives": copy.deepcopy(self._dict.get(self.model, {})),
+            "controls": deps,
+            "rewritten": rewritten,
+        })
 
+    # -------------------------------------------------------------------------
+    def _install_resolution(self, target: "Catalog", action: str,
+                            deps: Optional[dict] = None) -> "ResolutionStatus":
+        """Install ``target`` as the resolved catalog and mark the profile RESOLVED.
+
+        ``deps`` is the directive dependency record :meth:`_update_resolution` works
+        from; without one (e.g. a catalog loaded from the cache) any later edit falls
+        back to discarding the catalog.
+        """
         self.catalog = target
+        self._resolution_deps = deps
         self.resolution_status = ResolutionStatus.RESOLVED
         self.resolution_state = "resolved"
         self.resolved_datetime = datetime.now(timezone.utc)
-        logger.info(f"resolve: produced catalog with {len(target)} controls.")
+        logger.info(f"resolve: {action} with {len(target)} controls.")
         return self.resolution_status
 
     # -------------------------------------------------------------------------
-    def _materialize_into_catalog(self, target: "Catalog", node: dict, parent_id: str,
-                                  shared_params: list) -> None:
-        """Insert one controls_tree node (and its subtree) into ``target``."""
+    def _cached_resolution(self, cache_key: str, directive: "CacheDirective") -> Optional["Catalog"]:
+        """Return the resolved catalog stored under ``cache_key``, or None on a miss.
+
+        A stored entry that no longer loads as a valid catalog is purged and missed.
+        """
+        cache = get_local_cache()
+        content = cache.get(cache_key, directive)
+        if not content:
+            return None
+        target = Catalog.loads(content)
+        if not isinstance(target, Catalog) or not target.is_valid:
+            logger.warning("resolve: discarding an unusable cached resolution.")
+            cache.purge(cache_key)
+            return None
+        return target
+
+    # -------------------------------------------------------------------------
+    def _materialize_tree(self, workers: int = 1) -> tuple:
+        """Materialize every controls_tree node for placement (the parallel phase).
+
+        Each top-level node's subtree is materialized independently — content fetched
+        from its source, this profile's modifications and duplicate renames applied —
+        so with ``workers`` > 1 the subtrees are spread over a thread pool. Sources are
+        shared read-only: their lazily built lookup structures are built up front (see
+        :meth:`OSCAL._warm_read_caches`), so workers only read them. Results keep tree
+        order, making the output independent of ``workers``.
+
+        Args:
+            workers (int, optional): Maximum worker threads. Defaults to 1 (in-line).
+
+        Returns:
+            tuple: ``(items, shared_params, deps)`` — one :class:`_Materialized` (or
+                None) per top-level node, the cited-but-externally-defined parameters
+                collected for the catalog root, and one :class:`_ControlDeps` per
+                materialized control, all in tree order.
+        """
+        nodes = self.controls_tree
+        if workers > 1 and len(nodes) > 1:
+            for obj in self._import_directory()[0]:
+                obj._warm_read_caches()
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(self._materialize_subtree, nodes))
+        else:
+            results = [self._materialize_subtree(node) for node in nodes]
+        shared_params = [param for _, params, _ in results for param in params]
+        deps = [dep for _, _, subtree_deps in results for dep in subtree_deps]
+        return [item for item, _, _ in results], shared_params, deps
+
+    # -------------------------------------------------------------------------
+    def _materialize_subtree(self, node: dict) -> tuple:
+        """Materialize one top-level node; return ``(item, shared_params, deps)``."""
+        shared_params: list = []
+        deps: list = []
+        return self._materialize_node(node, shared_params, deps), shared_params, deps
+
+    # -------------------------------------------------------------------------
+    def _materialize_node(self, node: dict, shared_params: list,
+                          deps: list) -> Optional["_Materialized"]:
+        """Materialize one controls_tree node (and its subtree), or None when unavailable."""
         if node.get("group"):
-            intrinsic = self._fetch_group_intrinsic(node)
-            if target.insert_group(parent_id, intrinsic, shallow=True, validate=False) is None:
-                logger.warning(f"resolve: could not place group '{node.get('id')}' "
+            children = [self._materialize_node(child, shared_params, deps)
+                        for child in node.get("children", [])]
+            return _Materialized(True, node["id"], self._fetch_group_intrinsic(node), children)
+        content = self._materialize_control_node(node, depth=None, shared_sink=shared_params,
+                                                 deps=deps)
+        if content is None:
+            logger.warning(f"resolve: could not fetch content for control "
+                           f"'{node.get('id')}'; skipping.")
+            return None
+        return _Materialized(False, node["id"], content, [])
+
+    # -------------------------------------------------------------------------
+    def _place_materialized(self, target: "Catalog", item: Optional["_Materialized"],
+                            parent_id: str) -> None:
+        """Insert one materialized node (and its subtree) into ``target`` (the ordered phase)."""
+        if item is None:
+            return
+        if item.group:
+            if target.insert_group(parent_id, item.content, shallow=True, validate=False,
+                                   adopt=True) is None:
+                logger.warning(f"resolve: could not place group '{item.node_id}' "
                                f"under '{parent_id}'; skipping its subtree.")
                 return
-            for child in node.get("children", []):
-                self._materialize_into_catalog(target, child, node["id"], shared_params)
-        else:
-            content = self._materialize_control_node(node, depth=None, shared_sink=shared_params)
-            if content is None:
-                logger.warning(f"resolve: could not fetch content for control "
-                               f"'{node.get('id')}'; skipping.")
-                return
-            if target.insert_control(parent_id, content, validate=False) is None:
-                logger.warning(f"resolve: could not place control "
-                               f"'{content.get('id')}' under '{parent_id}'.")
+            for child in item.children:
+                self._place_materialized(target, child, item.node_id)
+        elif target.insert_control(parent_id, item.content, validate=False, adopt=True) is None:
+            logger.warning(f"resolve: could not place control "
+                           f"'{item.content.get('id')}' under '{parent_id}'.")
 
     # -------------------------------------------------------------------------
     def _insert_shared_params(self, target: "Catalog", shared_params: list) -> None:
@@ -2853,7 +3870,8 @@ class Profile(OSCAL):
     # -------------------------------------------------------------------------
     def _materialize_control_node(self, node: dict, depth: Optional[int] = None,
                                   ancestors: tuple = (),
-                                  shared_sink: Optional[list] = None) -> Optional[dict]:
+                                  shared_sink: Optional[list] = None,
+                                  deps: Optional[list] = None) -> Optional[dict]:
         """Build a full control dict from a controls_tree control node.
 
         Fetches the control's intrinsic content from its origin source (recursing through
@@ -2878,6 +3896,8 @@ class Profile(OSCAL):
             shared_sink (list | None, optional): When a list (resolve), cited-but-
                 externally-defined parameters are collected into it for hoisting to the
                 catalog root; when None (JIT), they are embedded in the control instead.
+            deps (list | None, optional): When a list (resolve), a :class:`_ControlDeps`
+                is appended for this control and each nested one, in document order.
 
         Returns:
             Optional[dict]: The materialized control, or None when the source content
@@ -2894,7 +3914,15 @@ class Profile(OSCAL):
         # This profile's modify directives — on natural (source-scope) ids.
         self._apply_modify(content, origin.get("source_id"), ancestors)
         # Parameters cited here but defined elsewhere are also in scope.
+        hoisted = len(shared_sink) if shared_sink is not None else 0
         self._resolve_cited_params(content, shared_sink)
+        if deps is not None:
+            shared = tuple(shared_sink[hoisted:]) if shared_sink is not None else ()
+            param_ids = {p.get("id") for p in (*content.get("params", []), *shared)
+                         if isinstance(p, dict)}
+            deps.append(_ControlDeps(node, ancestors,
+                                     frozenset((*ancestors, origin.get("source_id"))),
+                                     frozenset(param_ids), shared))
 
         uid = self._rename_uuid_for("controls", node.get("id"))
         if uid:
@@ -2909,7 +3937,7 @@ class Profile(OSCAL):
                 if child.get("group"):
                     continue
                 materialized = self._materialize_control_node(child, child_depth,
-                                                              child_ancestors, shared_sink)
+                                                              child_ancestors, shared_sink, deps)
                 if materialized is not None:
                     kids.append(materialized)
             if kids:
@@ -3061,6 +4089,37 @@ class Profile(OSCAL):
         else:
             content.setdefault("params", []).extend(acquired)   # JIT: embed in control
 
+    # -------------------------------------------------------------------------
+    def _jit_control(self, node: dict, depth: Optional[int] = None,
+                     ancestors: tuple = ()) -> Optional[dict]:
+        """Return a control node materialized for just-in-time reads, memoized.
+
+        Results are kept per ``(node id, depth)`` until the modify index or the
+        controls_tree is rebuilt, or until any document in the import tree (this
+        profile included) records a content change or the import tree itself changes.
+        The returned dict is shared with the memo: callers hand out copies.
+
+        Args:
+            node (dict, required): A control node from the profile's controls_tree.
+            depth (int | None, optional): Enhancement depth, as for
+                :meth:`_materialize_control_node`.
+            ancestors (tuple, optional): Source ids of enclosing control nodes.
+
+        Returns:
+            Optional[dict]: The memoized control, or None when its source content
+                cannot be fetched.
+        """
+        stamp = (OSCAL._import_generation,
+                 tuple(obj.content_version for obj in self._import_directory()[0]))
+        if stamp != self._jit_stamp:
+            self._jit_controls = {}
+            self._jit_stamp = stamp
+        key = (node.get("id"), depth)
+        if key not in self._jit_controls:
+            self._jit_controls[key] = self._materialize_control_node(node, depth=depth,
+                                                                     ancestors=ancestors)
+        return self._jit_controls[key]
+
     # -------------------------------------------------------------------------
     def _materialize_group_node(self, node: dict, depth: Optional[int] = None) -> dict:
         """Build a full group dict (with in-scope children per ``depth``) from a node."""
@@ -3076,9 +4135,9 @@ class Profile(OSCAL):
                     materialized = self._materialize_group_node(child, child_depth)
                     child_groups.append(materialized)
                 else:
-                    materialized = self._materialize_control_node(child, child_depth)
+                    materialized = self._jit_control(child, child_depth)
                     if materialized is not None:
-                        child_controls.append(materialized)
+                        child_controls.append(_json_copy(materialized))
             if child_groups:
                 group["groups"] = child_groups
             if child_controls:
@@ -3088,20 +4147,7 @@ class Profile(OSCAL):
     # -------------------------------------------------------------------------
     def _all_import_objects(self) -> list:
         """Return every live object reachable through the import tree (dedup by identity)."""
-        seen: set[int] = set()
-        out: list = []
-
-        def visit(obj) -> None:
-            if obj is None or id(obj) in seen:
-                return
-            seen.add(id(obj))
-            out.append(obj)
-            for entry in getattr(obj, "import_list", []):
-                visit(entry.get("object"))
-
-        for entry in self.import_list:
-            visit(entry.get("object"))
-        return out
+        return [obj for obj in self._import_directory()[0] if obj is not self]
 
     # -------------------------------------------------------------------------
     def _assemble_metadata(self, target: "Catalog", sources: list) -> None:
@@ -3175,15 +4221,7 @@ class Profile(OSCAL):
         if not referenced:
             return
 
-        res_by_uuid: dict[str, dict] = {}
-        holders = [self._dict.get(self.model, {})] + \
-                  [o._dict.get(o.model, {}) for o in self._all_import_objects()]
-        for holder in holders:
-            for res in holder.get("back-matter", {}).get("resources", []):
-                u = res.get("uuid")
-                if u and u not in res_by_uuid:
-                    res_by_uuid[u] = res
-
+        res_by_uuid = self._backmatter_resources()
         wanted = [copy.deepcopy(res_by_uuid[u]) for u in referenced if u in res_by_uuid]
         missing = sorted(u for u in referenced if u not in res_by_uuid)
         if missing:
@@ -3194,7 +4232,24 @@ class Profile(OSCAL):
             bm.setdefault("resources", []).extend(wanted)
 
     # -------------------------------------------------------------------------
-    def _rewrite_out_of_scope_refs(self, target: "Catalog") -> None:
+    def _backmatter_resources(self) -> dict:
+        """Return ``{uuid: resource}`` across the profile's and its import tree's back-matter.
+
+        Where a uuid repeats, the profile's resource wins, then the first in import-tree
+        order.
+        """
+        res_by_uuid: dict[str, dict] = {}
+        holders = [self._dict.get(self.model, {})] + \
+                  [o._dict.get(o.model, {}) for o in self._all_import_objects()]
+        for holder in holders:
+            for res in holder.get("back-matter", {}).get("resources", []):
+                u = res.get("uuid")
+                if u and u not in res_by_uuid:
+                    res_by_uuid[u] = res
+        return res_by_uuid
+
+    # -------------------------------------------------------------------------
+    def _rewrite_out_of_scope_refs(self, target: "Catalog") -> set:
         """Rewrite references to out-of-scope ids to absolute source URIs.
 
         Any ``#id`` reference in the resolved catalog (an ``href`` value or a prose
@@ -3202,16 +4257,14 @@ class Profile(OSCAL):
         ``<source-uri>#id``, where the source is the import that still resolves it — the
         behavior of the official resolver for controls dropped from the baseline. In-scope
         references (including carried back-matter resources) are left untouched.
-        """
-        cat_root = target._dict.get("catalog", {})
-        in_scope: set[str] = set()
-        _collect_ids(cat_root, in_scope)
 
-        refs: set[str] = set()
-        _collect_fragment_refs(cat_root, refs)
-        out_of_scope = {r for r in refs if r not in in_scope}
+        Returns:
+            set: The ids whose references were rewritten.
+        """
+        refs = target._ref_index()
+        out_of_scope = {r for r in refs.targets(("href", "markdown")) if r not in refs.defined}
         if not out_of_scope:
-            return
+            return set()
 
         ready = [(e.get("href_valid"), e.get("object")) for e in self.import_list
                  if e.get("status") == ImportState.READY and e.get("object") is not None]
@@ -3224,9 +4277,14 @@ class Profile(OSCAL):
                     base_for[frag] = _as_file_uri(href)
                     break
         if base_for:
-            _apply_ref_rewrite(cat_root, base_for)
+            refs.rewrite(base_for)
+            target._index_patched()
+            target._document_indexes_patched()
+            target._tree_unaffected()
+            target._content_changed()
             logger.info(f"resolve: rewrote {len(base_for)} out-of-scope reference(s) "
                         "to their source document.")
+        return set(base_for)
 
     # =========================================================================
     # Read-only Catalog surface (resolved -> .catalog; unresolved -> lazy from tree)
@@ -3247,13 +4305,12 @@ class Profile(OSCAL):
         Returns:
             Optional[dict]: A safe copy of the control, or None when absent.
         """
-        if self.resolution_status == ResolutionStatus.RESOLVED and self.catalog is not None:
+        if self._has_resolution():
             return self.catalog.get_control_by_id(control_id, depth=depth)
-        self._ensure_controls_tree()
-        node, ancestors = _find_control_node_with_ancestors(self.controls_tree, control_id)
+        node, ancestors = self._tree_lookup()[0].get(control_id, (None, ()))
         if node is None:
             return None
-        return self._materialize_control_node(node, depth=depth, ancestors=ancestors)
+        return _json_copy(self._jit_control(node, depth, ancestors))
 
     # -------------------------------------------------------------------------
     def get_group_by_id(self, group_id: str, depth: Optional[int] = None) -> Optional[dict]:
@@ -3267,10 +4324,9 @@ class Profile(OSCAL):
         Returns:
             Optional[dict]: A safe copy of the group, or None when absent.
         """
-        if self.resolution_status == ResolutionStatus.RESOLVED and self.catalog is not None:
+        if self._has_resolution():
             return self.catalog.get_group_by_id(group_id, depth=depth)
-        self._ensure_controls_tree()
-        node = _find_tree_node(self.controls_tree, group_id, want_group=True)
+        node = self._tree_lookup()[1].get(group_id)
         if node is None:
             return None
         return self._materialize_group_node(node, depth=depth)
@@ -3280,7 +4336,7 @@ class Profile(OSCAL):
         """Return a parameter as a safe copy — from the resolved catalog if resolved,
         otherwise located in the import tree (its source, unmutated).
         """
-        if self.resolution_status == ResolutionStatus.RESOLVED and self.catalog is not None:
+        if self._has_resolution():
             return self.catalog.get_parameter_by_id(param_id)
         return super().get_parameter_by_id(param_id)
 
@@ -3292,14 +4348,14 @@ class Profile(OSCAL):
         control node in the profile's controls_tree is materialized standalone (depth 0),
         mirroring the flat, enhancement-inclusive list a catalog returns.
         """
-        if self.resolution_status == ResolutionStatus.RESOLVED and self.catalog is not None:
+        if self._has_resolution():
             return self.catalog.get_control_list()
         self._ensure_controls_tree()
         out: list = []
         for node, ancestors in _all_control_nodes_with_ancestors(self.controls_tree):
-            materialized = self._materialize_control_node(node, depth=0, ancestors=ancestors)
+            materialized = self._jit_control(node, 0, ancestors)
             if materialized is not None:
-                out.append(materialized)
+                out.append(_json_copy(materialized))
         return out
 
     # -------------------------------------------------------------------------
@@ -3391,7 +4447,7 @@ class Profile(OSCAL):
     # -------------------------------------------------------------------------
     def _resolved(self, what: str) -> bool:
         """Return True if resolved; otherwise warn about accessing ``what`` and return False."""
-        if self.resolution_status != ResolutionStatus.RESOLVED or self.catalog is None:
+        if not self._has_resolution():
             logger.warning(f"Attempting to access {what} before the profile is resolved; "
                            "call Profile.resolve() first.")
             return False
@@ -3447,6 +4503,9 @@ class Profile(OSCAL):
             logger.warning(f"resolve_duplicate: no live variants found for '{control_id}'.")
             return None
 
+        # Manual edits are not reproducible from directives: later edits re-resolve in full.
+        self._resolution_deps = None
+
         if replacement is not None:
             if not isinstance(replacement, dict) or not replacement.get("id"):
                 logger.error("resolve_duplicate: 'replacement' must be a control dict with an 'id'.")
@@ -3514,6 +4573,9 @@ class Profile(OSCAL):
             logger.warning(f"resolve_duplicate_group: no live variants found for '{group_id}'.")
             return None
 
+        # Manual edits are not reproducible from directives: later edits re-resolve in full.
+        self._resolution_deps = None
+
         if replacement is not None:
             if not isinstance(replacement, dict) or not replacement.get("id"):
                 logger.error("resolve_duplicate_group: 'replacement' must be a group dict with an 'id'.")
@@ -3569,12 +4631,15 @@ class ResolutionStatus(str, Enum):
         RESOLVED (str): "resolved" — the resolved catalog is available.
         BLOCKED (str): "blocked" — resolution could not complete (e.g. missing import).
         EXPIRED (str): "expired" — a previously resolved catalog is stale.
+        INCREMENTAL (str): "incremental" — the resolved catalog is available and was
+            brought up to date in place after a directive edit.
     """
     UNRESOLVED   = "unresolved"
     RESOLVING    = "resolving"
     RESOLVED     = "resolved"
     BLOCKED      = "blocked"
     EXPIRED      = "expired"
+    INCREMENTAL  = "incremental"
 
 # ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
 # Register model classes so OSCAL factory methods return typed instances.
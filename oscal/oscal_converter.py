@@ -35,11 +35,16 @@ Unmodeled content (declared via <any/> in the metaschema):
 from __future__ import annotations
 
 import html.parser as _html_parser
+import io
 import json
+import operator
 import re
+import threading
 import xml.etree.ElementTree as ET
+from collections import OrderedDict
 from xml.etree.ElementTree import Element, SubElement
 import logging
+from typing import Iterator, NamedTuple
 
 import markdown
 from markdown.extensions import Extension
@@ -132,30 +137,179 @@ class _OscalParameterExtension(Extension):
         )
 
 
+# Per-thread Markdown engine: building one loads every extension, so each thread
+# keeps a single instance and reset()s it between conversions.
+_md_engine_local = threading.local()
+
+# Single-line text matching none of these can produce no Markdown construct, entity
+# reference or raw HTML: emphasis/code/link/escape/insert/sub/sup characters anywhere,
+# block markers at the start, entity references, and significant whitespace.
+_MD_SPECIAL_RE = re.compile(
+    r"[\\`*_{}\[\]<>#!~^\n\r\t]|&#?\w+;|^[-+:=|]|^\d+[.)]|^\s|\s$|\s\s"
+)
+
+
+def _markdown_engine() -> markdown.Markdown:
+    """Return this thread's reusable OSCAL Markdown engine, creating it on first use."""
+    md = getattr(_md_engine_local, "md", None)
+    if md is None:
+        md = markdown.Markdown(
+            extensions=["extra", "sane_lists", _OscalParameterExtension()],
+            extension_configs={
+                "extra": {
+                    "markdown.extensions.fenced_code": {},
+                    "markdown.extensions.tables": {},
+                }
+            },
+        )
+        _md_engine_local.md = md
+    return md
+
+
+def _plain_markup_html(markdown_text: str, multiline: bool) -> str | None:
+    """Fast path: the HTML for markup-free text, or ``None`` when Markdown is needed."""
+    if _MD_SPECIAL_RE.search(markdown_text):
+        return None
+    if "&" in markdown_text:
+        markdown_text = markdown_text.replace("&", "&amp;")
+    return f"<p>{markdown_text}</p>" if multiline else markdown_text
+
+
+class MarkupCacheInfo(NamedTuple):
+    """Counters for one markup conversion memo (see ``markup_cache_info``)."""
+    hits: int
+    misses: int
+    entries: int
+    max_entries: int
+    chars: int
+    max_chars: int
+
+
+class _MarkupMemo:
+    """
+    Bounded LRU memo of markup conversions keyed by ``(text, datatype)``.
+
+    Size-aware: besides the entry limit, the total length of cached keys and
+    results is capped at ``max_chars``; least recently used entries are evicted
+    to stay under both limits, and a single conversion larger than the whole
+    budget is not cached.  Shared by all threads.
+    """
+
+    def __init__(self, max_entries: int, max_chars: int) -> None:
+        self.max_entries = max_entries
+        self.max_chars = max_chars
+        self._entries: OrderedDict[tuple[str, str], str] = OrderedDict()
+        self._chars = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, text: str, datatype: str) -> str | None:
+        key = (text, datatype)
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return result
+
+    def put(self, text: str, datatype: str, result: str) -> None:
+        size = len(text) + len(result)
+        if size > self.max_chars:
+            return
+        key = (text, datatype)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._chars -= len(text) + len(previous)
+            self._entries[key] = result
+            self._chars += size
+            while len(self._entries) > self.max_entries or self._chars > self.max_chars:
+                (old_text, _), old_result = self._entries.popitem(last=False)
+                self._chars -= len(old_text) + len(old_result)
+
+    def info(self) -> MarkupCacheInfo:
+        with self._lock:
+            return MarkupCacheInfo(self._hits, self._misses, len(self._entries),
+                                   self.max_entries, self._chars, self.max_chars)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._chars = 0
+            self._hits = 0
+            self._misses = 0
+
+
+# Repeated prose (boilerplate guidance, parameter labels, part text inherited
+# across baselines) is converted once per process and reused from these memos.
+_MARKUP_MEMO_MAX_ENTRIES = 20000
+_MARKUP_MEMO_MAX_CHARS = 16 * 1024 * 1024
+_markdown_to_html_memo = _MarkupMemo(_MARKUP_MEMO_MAX_ENTRIES, _MARKUP_MEMO_MAX_CHARS)
+_html_to_markdown_memo = _MarkupMemo(_MARKUP_MEMO_MAX_ENTRIES, _MARKUP_MEMO_MAX_CHARS)
+
+
+def markup_cache_info() -> dict[str, MarkupCacheInfo]:
+    """Return hit/miss and size counters for the markup conversion memos.
+
+    Keys are ``"markdown_to_html"`` (``oscal_markdown_to_html``) and
+    ``"html_to_markdown"`` (``oscal_html_to_markdown`` and XML→JSON prose).
+    """
+    return {
+        "markdown_to_html": _markdown_to_html_memo.info(),
+        "html_to_markdown": _html_to_markdown_memo.info(),
+    }
+
+
+def clear_markup_cache() -> None:
+    """Empty the markup conversion memos and reset their counters."""
+    _markdown_to_html_memo.clear()
+    _html_to_markdown_memo.clear()
+
+
+def _markup_datatype(multiline: bool) -> str:
+    return "markup-multiline" if multiline else "markup-line"
+
+
 def oscal_markdown_to_html(markdown_text: str, multiline: bool = False) -> str:
     """Convert OSCAL CommonMark to an HTML fragment.
 
     ``multiline=True``  → markup-multiline: block elements preserved, ``<p>`` wrap applied.
     ``multiline=False`` → markup-line: inline only, outer ``<p>`` stripped.
+
+    Text without any Markdown-significant character is wrapped directly; everything
+    else goes through this thread's cached Markdown engine, memoized per
+    ``(text, datatype)`` (see ``markup_cache_info``).
     """
     if not markdown_text:
         return ""
 
+    html = _plain_markup_html(markdown_text, multiline)
+    if html is not None:
+        return html
+
+    datatype = _markup_datatype(multiline)
+    html = _markdown_to_html_memo.get(markdown_text, datatype)
+    if html is None:
+        html = _render_markdown_html(markdown_text, multiline)
+        _markdown_to_html_memo.put(markdown_text, datatype, html)
+    return html
+
+
+def _render_markdown_html(markdown_text: str, multiline: bool) -> str:
+    """Run *markdown_text* through the Markdown engine and apply OSCAL wrapping rules."""
     # OSCAL markdown does not allow raw HTML.  Escape any angle bracket that
     # looks like the start of an HTML/XML tag so the markdown library treats it
     # as literal text rather than inline HTML.
     markdown_text = re.sub(r"<(?=[a-zA-Z/!])", r"&lt;", markdown_text)
 
-    md = markdown.Markdown(
-        extensions=["extra", "sane_lists", _OscalParameterExtension()],
-        extension_configs={
-            "extra": {
-                "markdown.extensions.fenced_code": {},
-                "markdown.extensions.tables": {},
-            }
-        },
-    )
-    html = md.convert(markdown_text)
+    md = _markdown_engine()
+    try:
+        html = md.convert(markdown_text)
+    finally:
+        md.reset()
 
     if not multiline:
         if html.startswith("<p>") and html.endswith("</p>"):
@@ -178,25 +332,57 @@ def oscal_html_to_markdown(html_text: str, multiline: bool = True) -> str:
 
     ``multiline=True``  → markup-multiline (block elements converted).
     ``multiline=False`` → markup-line (inline elements only).
+
+    The fragment is tokenized once and rendered in a single traversal (see
+    ``_render_markup``).  Fragments the tokenizer cannot model exactly (stray
+    ``<``, mismatched tags, tables, nested ``<p>``/``<q>``) go through the
+    sequential rewrite passes in ``_html_to_markdown_passes``, which define
+    the output rules.  Results are memoized per ``(text, datatype)``.
     """
     if not html_text:
         return ""
 
-    md = html_text.strip()
+    datatype = _markup_datatype(multiline)
+    md = _html_to_markdown_memo.get(html_text, datatype)
+    if md is None:
+        html = html_text.strip()
+        nodes = _tokenize_markup(html, multiline)
+        if nodes is None:
+            md = _html_to_markdown_passes(html, multiline)
+        else:
+            md = _tidy_markdown(_render_markup(nodes, multiline), multiline)
+        _html_to_markdown_memo.put(html_text, datatype, md)
+    return md
+
+
+_INSERT_TAG_RE  = re.compile(r"<insert\b([^>]*)\s*(?:/\s*>|>\s*</insert\s*>)", re.IGNORECASE)
+_INSERT_TYPE_RE = re.compile(r'\btype\s*=\s*(["\'])(.*?)\1', re.IGNORECASE)
+_INSERT_ID_RE   = re.compile(r'\bid-ref\s*=\s*(["\'])(.*?)\1', re.IGNORECASE)
+
+
+def _insert_markdown(attrs: str | None) -> str | None:
+    """Return the ``{{ insert: type, id-ref }}`` form of an insert tag's attributes."""
+    attrs = attrs or ""
+    type_m = _INSERT_TYPE_RE.search(attrs)
+    id_m   = _INSERT_ID_RE.search(attrs)
+    if not type_m or not id_m:
+        return None
+    return f"{{{{ insert: {type_m.group(2).strip()}, {id_m.group(2).strip()} }}}}"
+
+
+def _html_to_markdown_passes(md: str, multiline: bool) -> str:
+    """Convert a stripped HTML fragment to CommonMark with sequential rewrites.
+
+    Each pass rewrites the whole string; the order of the passes decides how
+    nested markup renders (e.g. ``<strong>`` only converts when its content
+    is already tag-free).  ``_render_markup`` reproduces these rules.
+    """
 
     # OSCAL insert tags → {{ insert: type, id-ref }}
     def _replace_insert(match):
-        attrs = match.group(1) or ""
-        type_m = re.search(r'\btype\s*=\s*(["\'])(.*?)\1', attrs, flags=re.IGNORECASE)
-        id_m   = re.search(r'\bid-ref\s*=\s*(["\'])(.*?)\1', attrs, flags=re.IGNORECASE)
-        if not type_m or not id_m:
-            return match.group(0)
-        return f"{{{{ insert: {type_m.group(2).strip()}, {id_m.group(2).strip()} }}}}"
-
-    md = re.sub(
-        r"<insert\b([^>]*)\s*(?:/\s*>|>\s*</insert\s*>)",
-        _replace_insert, md, flags=re.IGNORECASE,
-    )
+        return _insert_markdown(match.group(1)) or match.group(0)
+
+    md = _INSERT_TAG_RE.sub(_replace_insert, md)
 
     if multiline:
         for level in range(1, 7):
@@ -252,7 +438,11 @@ def oscal_html_to_markdown(html_text: str, multiline: bool = True) -> str:
     # without this the quotes are lost when the catch-all below strips the tags.
     md = re.sub(r"<q>(.*?)</q>", r'"\1"', md, flags=re.DOTALL)
     md = re.sub(r"<[^>]+>", "", md)
+    return _tidy_markdown(md, multiline)
+
 
+def _tidy_markdown(md: str, multiline: bool) -> str:
+    """Normalise whitespace in converted markdown (line-wise for multiline)."""
     if multiline:
         lines = [ln.strip() for ln in md.split("\n")]
         cleaned: list[str] = []
@@ -268,6 +458,247 @@ def oscal_html_to_markdown(html_text: str, multiline: bool = True) -> str:
     return md.strip()
 
 
+# ---------------------------------------------------------------------------
+# Single-pass markup rendering
+# ---------------------------------------------------------------------------
+# A markup fragment is modelled as a list of nodes: plain strings for text and
+# ``[name, start_tag, end_tag, children]`` lists for elements (``end_tag`` is
+# None for void, self-closing and opaque ``<!...>`` tags).  ``_render_markup``
+# walks that tree once and applies the rules of ``_html_to_markdown_passes``.
+#
+# The passes run in a fixed order, and a pattern with tag-free content
+# (``<strong>([^<]+)</strong>`` and friends) only matches when every element
+# inside it was converted by an *earlier* pass.  Each rendered node therefore
+# reports the rank of the pass that removes its last tag; a parent converts
+# only when its children's ranks are below its own.
+
+_RANK_INSERT     = 1     # h1..h6 use ranks 2..7
+_RANK_PRE        = 8
+_RANK_BLOCKQUOTE = 10
+_RANK_UL         = 11
+_RANK_OL         = 12
+_RANK_P          = 13
+_RANK_IMG_TITLE  = 14
+_RANK_IMG        = 15
+_RANK_A_TITLE    = 16
+_RANK_A          = 17
+_RANK_Q          = 23
+_RANK_STRIP      = 24
+
+_INLINE_WRAPS = {
+    "strong": (18, "**"),
+    "em":     (19, "*"),
+    "code":   (20, "`"),
+    "sup":    (21, "^"),
+    "sub":    (22, "~"),
+}
+_HEADING_LEVELS = {f"h{level}": level for level in range(1, 7)}
+_LIST_MARKERS   = {"ul": (_RANK_UL, "- "), "ol": (_RANK_OL, "1. ")}
+
+_IMG_TITLE_TAG_RE = re.compile(r'<img\s+alt="([^"]*)"\s+src="([^"]+)"\s+title="([^"]*)"\s*/>')
+_IMG_TAG_RE       = re.compile(r'<img\s+alt="([^"]*)"\s+src="([^"]+)"\s*/>')
+_A_TITLE_TAG_RE   = re.compile(r'<a\s+href="([^"]+)"\s+title="([^"]*)">')
+_A_TAG_RE         = re.compile(r'<a\s+href="([^"]+)">')
+
+_MARKUP_TOKEN_RE = re.compile(r"<[^>]+>|[^<]+|<")
+_MARKUP_TAG_RE   = re.compile(r"<(/?)([A-Za-z][^\s/>]*)")
+
+
+def _nesting_unsupported(name: str, open_tags: list[str], multiline: bool) -> bool:
+    """True if *name* opens markup the rewrite passes pair non-hierarchically."""
+    if name == "q" or (multiline and name == "p"):
+        return name in open_tags
+    return multiline and name == "table"
+
+
+def _tokenize_markup(html: str, multiline: bool) -> list | None:
+    """
+    Tokenize an HTML fragment into markup nodes in one scan.
+
+    Returns None when the fragment cannot be modelled as a well-formed tree
+    (lone ``<``, quotes left open inside a tag, mismatched or unclosed tags)
+    or contains markup handled only by the rewrite passes.
+    """
+    root: list = []
+    stack: list[list] = []
+    open_tags: list[str] = []
+    children = root
+    for match in _MARKUP_TOKEN_RE.finditer(html):
+        token = match.group()
+        if token[0] != "<":
+            children.append(token)
+            continue
+        if len(token) == 1 or "<" in token[1:] or token.count('"') % 2:
+            return None
+        if token[1] in "!?":
+            children.append(["", token, None, []])
+            continue
+        tag_m = _MARKUP_TAG_RE.match(token)
+        if tag_m is None:
+            return None
+        closing, name = tag_m.groups()
+        if closing:
+            if not stack or stack[-1][0] != name:
+                return None
+            stack.pop()[2] = token
+            open_tags.pop()
+            children = stack[-1][3] if stack else root
+            continue
+        if _nesting_unsupported(name, open_tags, multiline):
+            return None
+        node = [name, token, None, []]
+        children.append(node)
+        if not token.endswith("/>") and name.lower() not in _VOID_HTML_ELEMS:
+            stack.append(node)
+            open_tags.append(name)
+            children = node[3]
+    return None if stack else root
+
+
+def _escape_markup_text(text: str) -> str:
+    """Escape text the way ``ET.tostring(method="html")`` does."""
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def _escape_markup_attrib(value: str) -> str:
+    """Escape an attribute value the way ``ET.tostring(method="html")`` does."""
+    return value.replace("&", "&amp;").replace(">", "&gt;").replace('"', "&quot;")
+
+
+def _et_markup_node(elem: Element, out: list, open_tags: list[str], multiline: bool) -> bool:
+    """
+    Append the markup node for *elem* (and its tail) to *out*.
+
+    Tags and attributes are rendered as ``_markup_to_md`` would see them after
+    ``ET.tostring(method="html")`` and namespace stripping.  Returns False for
+    content that serialization would mangle in ways the node model does not
+    capture; the caller then falls back to the serialized string.
+    """
+    if not isinstance(elem.tag, str):
+        return False
+    name = _local(elem.tag)
+    if ":" in name or not (name[:1].isalnum() or name[:1] == "_"):
+        return False
+    lname = name.lower()
+    if lname in ("script", "style") or _nesting_unsupported(name, open_tags, multiline):
+        return False
+    start = [f"<{name}"]
+    for key, value in elem.items():
+        if "{" in key or "xmlns" in key or "xmlns" in value or "<" in value:
+            return False
+        start.append(f' {key}="{_escape_markup_attrib(value)}"')
+    start.append(">")
+    children: list = []
+    node = [name, "".join(start), None, children]
+    if lname in ET.HTML_EMPTY:
+        if elem.text or len(elem):
+            return False
+    else:
+        node[2] = f"</{name}>"
+        if elem.text:
+            if "xmlns" in elem.text:
+                return False
+            children.append(_escape_markup_text(elem.text))
+        open_tags.append(name)
+        for child in elem:
+            if not _et_markup_node(child, children, open_tags, multiline):
+                return False
+        open_tags.pop()
+    out.append(node)
+    if elem.tail:
+        if "xmlns" in elem.tail:
+            return False
+        out.append(_escape_markup_text(elem.tail))
+    return True
+
+
+def _render_markup(nodes: list, multiline: bool) -> str:
+    """Render markup nodes to (untidied) CommonMark in one traversal."""
+    return "".join(
+        node if node.__class__ is str else _render_element(node, multiline)[0]
+        for node in nodes
+    )
+
+
+def _render_element(node: list, multiline: bool) -> tuple[str, int, int]:
+    """
+    Render one element node.
+
+    Returns ``(markdown, rank, inner_rank)``: the rendered text, the rank of
+    the pass that removes the element's last tag, and the highest such rank
+    among its children.
+    """
+    name, start, end, children = node
+    parts: list[str] = []
+    results: list = []
+    inner = 0
+    for child in children:
+        if child.__class__ is str:
+            parts.append(child)
+            continue
+        result = _render_element(child, multiline)
+        results.append(result)
+        parts.append(result[0])
+        if result[1] > inner:
+            inner = result[1]
+    content = "".join(parts)
+
+    if end is not None and start == f"<{name}>" and end == f"</{name}>":
+        wrap = _INLINE_WRAPS.get(name)
+        if wrap is not None:
+            rank, marker = wrap
+            if content and inner < rank:
+                return f"{marker}{content}{marker}", rank, inner
+        elif name == "q":
+            return f'"{content}"', max(_RANK_Q, inner), inner
+        elif multiline:
+            if name == "p":
+                return f"{content}\n\n", max(_RANK_P, inner), inner
+            level = _HEADING_LEVELS.get(name)
+            if level is not None:
+                if content and inner <= level:
+                    return f"{'#' * level} {content}\n\n", level + 1, inner
+            elif name == "pre":
+                if inner < _RANK_PRE:
+                    return f"\n\n```\n{content}\n```\n\n", _RANK_PRE, inner
+            elif name == "blockquote":
+                if content and inner < _RANK_BLOCKQUOTE:
+                    return f"\n\n> {content}\n\n", _RANK_BLOCKQUOTE, inner
+            elif name in _LIST_MARKERS:
+                rank, marker = _LIST_MARKERS[name]
+                if len(children) == 1 and results:
+                    item = children[0]
+                    text, _, item_inner = results[0]
+                    if (item[0] == "li" and item[1] == "<li>" and item[2] == "</li>"
+                            and text and item_inner < rank):
+                        return f"\n\n{marker}{text}\n", rank, inner
+    elif name == "a":
+        if end == "</a>" and content:
+            link_m = _A_TITLE_TAG_RE.fullmatch(start)
+            if link_m and inner < _RANK_A_TITLE:
+                return f'[{content}]({link_m.group(1)} "{link_m.group(2)}")', _RANK_A_TITLE, inner
+            link_m = _A_TAG_RE.fullmatch(start)
+            if link_m and inner < _RANK_A:
+                return f"[{content}]({link_m.group(1)})", _RANK_A, inner
+    elif name == "img":
+        if end is None:
+            img_m = _IMG_TITLE_TAG_RE.fullmatch(start)
+            if img_m:
+                alt, src, title = img_m.groups()
+                return f'![{alt}]({src} "{title}")', _RANK_IMG_TITLE, 0
+            img_m = _IMG_TAG_RE.fullmatch(start)
+            if img_m:
+                return f"![{img_m.group(1)}]({img_m.group(2)})", _RANK_IMG, 0
+    elif name[:6].lower() == "insert" and not results:
+        insert_m = _INSERT_TAG_RE.fullmatch(f"{start}{content}{end or ''}")
+        if insert_m:
+            insert = _insert_markdown(insert_m.group(1))
+            if insert is not None:
+                return insert, _RANK_INSERT, 0
+
+    return content, _RANK_STRIP, inner
+
+
 def convert_markup_line(markdown_text: str) -> str:
     """Convert OSCAL markup-line (inline-only) markdown to an HTML fragment."""
     return oscal_markdown_to_html(markdown_text, multiline=False)
@@ -410,28 +841,66 @@ def _local(tag: str) -> str:
     return tag.split("}")[-1] if "}" in tag else tag
 
 
+def _cast_int(value: str) -> str | int:
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return value
+
+
+def _cast_float(value: str) -> str | float:
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return value
+
+
+def _cast_bool(value: str) -> bool:
+    return value.lower() in ("true", "1", "yes")
+
+
+# Typed datatypes → cast function; every other datatype stays a string.
+_CASTERS = {
+    **{dt: _cast_int for dt in _INT_TYPES},
+    **{dt: _cast_float for dt in _FLOAT_TYPES},
+    **{dt: _cast_bool for dt in _BOOL_TYPES},
+}
+
+
 def _cast(value: str, datatype: str) -> str | int | float | bool:
     """Cast a string value to its typed Python equivalent for JSON output."""
-    if datatype in _INT_TYPES:
-        try:
-            return int(value)
-        except (ValueError, TypeError):
-            return value
-    if datatype in _FLOAT_TYPES:
-        try:
-            return float(value)
-        except (ValueError, TypeError):
-            return value
-    if datatype in _BOOL_TYPES:
-        return value.lower() in ("true", "1", "yes")
-    return value
+    caster = _CASTERS.get(datatype)
+    return caster(value) if caster is not None else value
 
 
 def _markup_to_md(element: Element, datatype: str) -> str:
     """
     Extract the inner HTML content of an XML element and convert it to
     OSCAL-flavoured CommonMark using ``oscal_html_to_markdown``.
+
+    The element's children are walked directly into markup nodes; only
+    content the walker cannot model is serialized to an HTML string first.
     """
+    multiline = datatype == "markup-multiline"
+    if not len(element):
+        # Text-only prose (titles, labels, simple paragraphs) is the same as
+        # converting its text, which goes through the memo.
+        return oscal_html_to_markdown(element.text or "", multiline=multiline)
+    nodes: list | None = []
+    if element.text:
+        if "<" in element.text or "xmlns" in element.text:
+            nodes = None
+        else:
+            # The leading text is not escaped by the serialized path either.
+            nodes.append(element.text)
+    if nodes is not None:
+        for child in element:
+            if not _et_markup_node(child, nodes, [], multiline):
+                nodes = None
+                break
+    if nodes is not None:
+        return _tidy_markdown(_render_markup(nodes, multiline), multiline)
+
     parts: list[str] = []
     if element.text:
         parts.append(element.text)
@@ -445,7 +914,7 @@ def _markup_to_md(element: Element, datatype: str) -> str:
     html = "".join(parts).strip()
     if not html:
         return ""
-    return oscal_html_to_markdown(html, multiline=(datatype == "markup-multiline"))
+    return oscal_html_to_markdown(html, multiline=multiline)
 
 
 def _md_to_xml(md_text: str, parent: Element, datatype: str, namespace: str) -> None:
@@ -473,6 +942,229 @@ def _md_to_xml(md_text: str, parent: Element, datatype: str, namespace: str) ->
     parent.text = md_text
 
 
+class _ConvertedElement(Element):
+    """
+    Stand-in for an XML subtree that streaming conversion has already turned into
+    its JSON value.  Keeps the original tag and attributes (so sibling lookup and
+    ``json-key`` flags still work) and carries the converted value in ``value``.
+    """
+
+
+class _DeferredElement(Element):
+    """
+    Placeholder for a child assembly that streaming XML output has not built yet.
+    Carries the JSON object and index node; it is expanded into a real element
+    only when the writer reaches it.
+    """
+
+
+# Characters emitted per chunk by OSCALConverter.iter_xml().
+_XML_CHUNK_SIZE = 65536
+
+
+def _escape_cdata(text: str) -> str:
+    """Escape XML character data exactly as ``ElementTree`` serialization does."""
+    if "&" in text:
+        text = text.replace("&", "&amp;")
+    if "<" in text:
+        text = text.replace("<", "&lt;")
+    if ">" in text:
+        text = text.replace(">", "&gt;")
+    return text
+
+
+def _escape_attrib(text: str) -> str:
+    """Escape an XML attribute value exactly as ``ElementTree`` serialization does."""
+    text = _escape_cdata(text)
+    if '"' in text:
+        text = text.replace('"', "&quot;")
+    if "\r" in text:
+        text = text.replace("\r", "&#13;")
+    if "\n" in text:
+        text = text.replace("\n", "&#10;")
+    if "\t" in text:
+        text = text.replace("\t", "&#09;")
+    return text
+
+
+# ---------------------------------------------------------------------------
+# Compiled conversion plans
+# ---------------------------------------------------------------------------
+# Each index node is compiled once into a _NodePlan holding everything the
+# converter needs per element: flag names with bound cast functions, field
+# value handling and the ordered child dispatch table shared by both
+# directions.  Plans live in a _ConversionPlans per (version, model) so every
+# converter built from the same metaschema index reuses them.
+
+# Child dispatch kinds (``_NodePlan.children`` entries are ``(kind, spec)``)
+_CHILD     = "child"
+_UNWRAPPED = "unwrapped"
+_ANY       = "any"
+
+
+class _ChildSpec:
+    """How one modeled child (a definition reference or choice alternative) converts."""
+    __slots__ = (
+        "node", "use_name", "group_as", "grouped", "json_key_flag", "by_key",
+        "singleton_or_array", "xml_list", "json_list", "json_name",
+        "datatype", "is_markup", "tag", "group_tag",
+    )
+
+    def __init__(self, node: dict, cardinality: dict | None, namespace: str) -> None:
+        self.node          = node
+        self.use_name      = node.get("use-name", "")
+        self.group_as      = node.get("group-as") or ""
+        self.grouped       = node.get("group-as-in-xml") == "GROUPED" and bool(self.group_as)
+        group_in_json      = node.get("group-as-in-json") or ""
+        max_occurs         = (cardinality or node).get("max-occurs", "1")
+        self.json_key_flag = node.get("json-key") or ""
+        self.by_key        = group_in_json == "BY_KEY" and bool(self.json_key_flag)
+        self.singleton_or_array = group_in_json == "SINGLETON_OR_ARRAY"
+        self.xml_list      = max_occurs == "unbounded" or group_in_json == "ARRAY"
+        self.json_list     = max_occurs == "unbounded" or group_in_json in ("ARRAY", "SINGLETON_OR_ARRAY")
+        self.json_name     = self.group_as or self.use_name
+        self.datatype      = node.get("datatype", "string")
+        self.is_markup     = self.datatype in _MARKUP_TYPES
+        self.tag           = f"{{{namespace}}}{self.use_name}"
+        self.group_tag     = f"{{{namespace}}}{self.group_as}"
+
+
+class _NodePlan:
+    """Compiled conversion state for one resolved index node."""
+    __slots__ = (
+        "node", "tag", "is_assembly", "is_field", "flags", "datatype", "is_markup",
+        "cast", "jvk", "jvkf", "children", "xml_child_table",
+    )
+
+    def __init__(self, node: dict, plans: "_ConversionPlans") -> None:
+        ns = plans.namespace
+        children = [c for c in node.get("children") or [] if c]
+        stype = node.get("structure-type", "")
+        self.node        = node
+        self.tag         = node.get("use-name") or plans.model
+        self.is_assembly = stype == "assembly"
+        self.is_field    = stype == "field"
+        self.flags: tuple[tuple[str, object], ...] = tuple(
+            (c.get("use-name", ""), _CASTERS.get(c.get("datatype", "string")))
+            for c in children if c.get("structure-type") == "flag"
+        )
+        self.datatype  = node.get("datatype", "string")
+        self.is_markup = self.datatype in _MARKUP_TYPES
+        self.cast      = _CASTERS.get(self.datatype)
+        self.jvk       = node.get("json-value-key") or ""
+        self.jvkf      = node.get("json-value-key-flag") or ""
+
+        # OSCAL XML names of wrapped children: anything else inside the element
+        # is inline markup belonging to an unwrapped (prose) field.
+        known_xml_names: set[str] = set()
+        for cn in children:
+            if cn.get("wrapped-in-xml") is False:
+                continue
+            alts = [a for a in cn.get("children") or [] if a] if cn.get("structure-type") == "choice" else [cn]
+            for alt in alts:
+                known_xml_names.update(n for n in (alt.get("use-name", ""), alt.get("group-as", "")) if n)
+        # Names an ``any`` child must leave alone when collecting _unmodeled content.
+        any_known: set[str] = set()
+        for cn in children:
+            cn_stype = cn.get("structure-type")
+            if cn_stype == "any":
+                continue
+            alts = [a for a in cn.get("children") or [] if a] if cn_stype == "choice" else [cn]
+            for alt in alts:
+                any_known.add(alt.get("use-name", ""))
+                if alt.get("group-as"):
+                    any_known.add(alt["group-as"])
+        any_known.update(name for name, _ in self.flags)
+
+        self.children: list[tuple[str, object]] = []
+        self.xml_child_table: dict[str, tuple] = {}
+        for cn in children:
+            cn_stype = cn.get("structure-type", "")
+            if cn.get("wrapped-in-xml") is False:
+                self.children.append((_UNWRAPPED, (
+                    cn.get("use-name", ""), cn.get("datatype", "string"), frozenset(known_xml_names),
+                )))
+                continue
+            if cn_stype == "any":
+                self.children.append((_ANY, frozenset(any_known)))
+                continue
+            if cn_stype == "choice":
+                specs = [(alt, None) for alt in cn.get("children") or [] if alt]
+            elif cn_stype == "recursive":
+                specs = [(plans.resolve(cn), cn)]
+            else:
+                specs = [(cn, None)]
+            for spec_nd, card in specs:
+                spec = _ChildSpec(spec_nd, card, ns)
+                self.children.append((_CHILD, spec))
+                # Streaming lookup by XML child name (flags never appear as elements).
+                if cn_stype != "flag":
+                    xml_name = spec.group_as if spec.grouped else spec.use_name
+                    self.xml_child_table.setdefault(xml_name, (spec_nd, card, spec.grouped))
+
+
+class _ConversionPlans:
+    """Definition index and memoized node plans for one metaschema model index."""
+
+    def __init__(self, model_index: dict) -> None:
+        self.root_node: dict = model_index.get("nodes") or {}
+        self.model     = model_index.get("oscal_model", "")
+        self.namespace = model_index.get("oscal_namespace") or OSCAL_XML_NAMESPACE
+        self.defs: dict[str, dict] = {}
+        self._plans: dict[int, _NodePlan] = {}
+        # XML tag → local name, so each distinct tag is split only once
+        self.local_names: dict[str, str] = {}
+        self._index_defs(self.root_node)
+
+    def _index_defs(self, node: dict | None) -> None:
+        """Walk the node tree and record the first occurrence of each named definition."""
+        if not node or node.get("structure-type") == "recursive":
+            return
+        name  = node.get("name", "")
+        stype = node.get("structure-type", "")
+        if name and stype in ("assembly", "field") and name not in self.defs:
+            self.defs[name] = node
+        for child in node.get("children") or []:
+            if child and child.get("structure-type") == "flag":
+                fn = child.get("name", "")
+                if fn and fn not in self.defs:
+                    self.defs[fn] = child
+            else:
+                self._index_defs(child)
+
+    def resolve(self, node: dict) -> dict:
+        """Return the full definition node for a recursive stub."""
+        if node.get("structure-type") == "recursive":
+            return self.defs.get(node.get("name", ""), node)
+        return node
+
+    def plan(self, node: dict) -> _NodePlan:
+        """Return the compiled plan for *node* (recursive stubs use their definition)."""
+        plan = self._plans.get(id(node))
+        if plan is None:
+            resolved = self.resolve(node)
+            plan = self._plans.get(id(resolved))
+            if plan is None:
+                plan = _NodePlan(resolved, self)
+                self._plans[id(resolved)] = plan
+            self._plans[id(node)] = plan
+        return plan
+
+
+# (oscal_version, oscal_model) → plans compiled for that metaschema index
+_conversion_plan_cache: dict[tuple[str, str], _ConversionPlans] = {}
+
+
+def _conversion_plans(model_index: dict) -> _ConversionPlans:
+    """Return the shared plans for *model_index*, rebuilding them if the index changed."""
+    key = (model_index.get("oscal_version", ""), model_index.get("oscal_model", ""))
+    plans = _conversion_plan_cache.get(key)
+    if plans is None or plans.root_node is not model_index.get("nodes"):
+        plans = _ConversionPlans(model_index)
+        _conversion_plan_cache[key] = plans
+    return plans
+
+
 # ---------------------------------------------------------------------------
 # Converter
 # ---------------------------------------------------------------------------
@@ -494,9 +1186,10 @@ class OSCALConverter:
         self.version     = model_index.get("oscal_version", "")
         self.namespace   = model_index.get("oscal_namespace") or OSCAL_XML_NAMESPACE
         self.schema_uri  = model_index.get("json_base_uri", "")
-        self.root_node: dict = model_index.get("nodes") or {}
-        self._defs: dict[str, dict] = {}
-        self._index_defs(self.root_node)
+        self._plans      = _conversion_plans(model_index)
+        self.root_node: dict = self._plans.root_node
+        self._defs: dict[str, dict] = self._plans.defs
+        self._local_names = self._plans.local_names
 
     @classmethod
     def from_support(cls, model: str, version: str, support=None) -> "OSCALConverter | None":
@@ -551,12 +1244,107 @@ class OSCALConverter:
 
         Returns the JSON string, or ``None`` on parse/conversion error.
         """
+        body = self.xml_to_dict(xml_content)
+        if body is None:
+            return None
+        return json.dumps(body, indent=2, ensure_ascii=False)
+
+    def xml_to_dict(self, source: Element | ET.ElementTree | bytes | str) -> dict | None:
+        """
+        Convert an OSCAL XML document straight to its OSCAL JSON dict.
+
+        Accepts an already-parsed ``Element``/``ElementTree`` (walked in place, no
+        re-serialization) or the raw document as ``bytes``/``str`` (parsed once).
+        The result equals ``json.loads(self.xml_to_json(...))`` without the
+        intermediate JSON string.
+
+        Returns the dict (``{"$schema": ..., <root>: {...}}``), or ``None`` on
+        parse/conversion error.
+        """
+        if isinstance(source, ET.ElementTree):
+            root = source.getroot()
+        elif isinstance(source, (bytes, str)):
+            try:
+                root = ET.fromstring(source.encode("utf-8") if isinstance(source, str) else source)
+            except ET.ParseError as exc:
+                logger.error(f"XML parse error: {exc}")
+                return None
+        else:
+            root = source
+        if root is None:
+            logger.error("No XML root element to convert.")
+            return None
+        return self._xml_body(root)
+
+    def iterparse_to_dict(self, source) -> dict | None:
+        """
+        Convert an OSCAL XML document to its JSON dict while it is being parsed.
+
+        Intended for very large documents (assessment results, POA&Ms). The document
+        is read with ``iterparse``; as soon as each repeated assembly (e.g.
+        ``observation``, ``finding``, ``risk``, ``poam-item``, ``group``) is complete
+        it is converted with the same node handling as :meth:`xml_to_dict` and its
+        element subtree is dropped, so peak memory stays close to the size of the
+        output dict rather than the full ElementTree.  Nested repeated assemblies
+        (observations inside a ``result``) are converted first and carried into
+        their parent's conversion as already-converted values.
+
+        Parameters
+        ----------
+        source
+            A file path, a binary file object, or the document as ``bytes``.
+
+        Returns the same dict as :meth:`xml_to_dict`, or ``None`` on parse/conversion
+        error.
+        """
+        if isinstance(source, bytes):
+            source = io.BytesIO(source)
+
+        # One frame per open element: [element, index node, cardinality node,
+        # is GROUPED wrapper, is converted on its own]
+        stack: list[list] = []
+        root = None
         try:
-            root = ET.fromstring(xml_content.encode("utf-8"))
+            for event, elem in ET.iterparse(source, events=("start", "end")):
+                if event == "start":
+                    if root is None:
+                        root = elem
+                        stack.append([elem, self.root_node, None, False, False])
+                        continue
+                    _, pnode, pcard, p_wrapper, _ = stack[-1]
+                    node = card = None
+                    is_wrapper = streamed = False
+                    if pnode is not None:
+                        node, card, is_wrapper = self._xml_child_spec(pnode, pcard, p_wrapper, _local(elem.tag))
+                        streamed = node is not None and not is_wrapper and self._is_streamable(node, card)
+                    stack.append([elem, node, card, is_wrapper, streamed])
+                    continue
+
+                _, node, _, _, streamed = stack.pop()
+                if streamed:
+                    stand_in = _ConvertedElement(elem.tag, dict(elem.attrib))
+                    stand_in.value = self._elem_to_dict(elem, node)
+                    # The parser reads ahead, so later siblings may already be attached.
+                    parent = stack[-1][0]
+                    for i in range(len(parent) - 1, -1, -1):
+                        if parent[i] is elem:
+                            parent[i] = stand_in
+                            break
+                    elem.clear()
         except ET.ParseError as exc:
             logger.error(f"XML parse error: {exc}")
             return None
+        except Exception as exc:
+            logger.exception(f"XML→JSON conversion failed: {exc}")
+            return None
 
+        if root is None:
+            logger.error("No XML root element to convert.")
+            return None
+        return self._xml_body(root)
+
+    def _xml_body(self, root: Element) -> dict | None:
+        """Convert a root element to the top-level JSON dict (``$schema`` + root key)."""
         root_name = _local(root.tag)
         expected  = self.root_node.get("use-name") or self.model
         if root_name != expected:
@@ -567,7 +1355,7 @@ class OSCALConverter:
             if self.schema_uri and self.version:
                 body["$schema"] = f"{self.schema_uri}/{self.version}/json/schema"
             body[root_name] = self._elem_to_dict(root, self.root_node)
-            return json.dumps(body, indent=2, ensure_ascii=False)
+            return body
         except Exception as exc:
             logger.exception(f"XML→JSON conversion failed: {exc}")
             return None
@@ -606,31 +1394,142 @@ class OSCALConverter:
             logger.exception(f"JSON→XML conversion failed: {exc}")
             return None
 
-    # ------------------------------------------------------------------
-    # Definition index (for resolving recursive nodes)
-    # ------------------------------------------------------------------
+    def iter_xml(
+        self,
+        doc: dict,
+        pretty_print: bool = True,
+        xml_declaration: bool = False,
+    ) -> Iterator[str]:
+        """
+        Serialize an OSCAL JSON document dict to XML incrementally.
 
-    def _index_defs(self, node: dict | None) -> None:
-        """Walk the node tree and record the first occurrence of each named definition."""
-        if not node or node.get("structure-type") == "recursive":
+        Driven by the same metaschema node handling as :meth:`json_to_xml`, but
+        each child assembly is built only when the writer reaches it and is
+        released once written, so memory stays bounded by the depth of the
+        document rather than its size. With ``pretty_print`` the output is
+        indented exactly as ``ElementTree.indent`` would indent the full tree.
+
+        Parameters
+        ----------
+        doc
+            The document dict, e.g. ``{"$schema": ..., "catalog": {...}}``.
+        pretty_print
+            Indent the output (two spaces per level).
+        xml_declaration
+            Start the output with an ``<?xml ...?>`` declaration.
+
+        Yields ``str`` chunks of roughly ``_XML_CHUNK_SIZE`` characters. Raises
+        ``ValueError`` when *doc* does not hold exactly one root object.
+        """
+        roots = [k for k in doc if not k.startswith("_") and k != "$schema"]
+        if len(roots) != 1 or not isinstance(doc[roots[0]], dict):
+            raise ValueError(f"Expected one root object in JSON, found: {list(doc.keys())}")
+
+        root = _DeferredElement(f"{{{self.namespace}}}{roots[0]}")
+        root.json_obj, root.node = doc[roots[0]], self.root_node
+        buf: list[str] = ['<?xml version="1.0" encoding="UTF-8"?>\n'] if xml_declaration else []
+        size = 0
+        for part in self._iter_elem(root, 0, "  " if pretty_print else "", None):
+            buf.append(part)
+            size += len(part)
+            if size >= _XML_CHUNK_SIZE:
+                yield "".join(buf)
+                buf, size = [], 0
+        if xml_declaration:
+            buf.append("\n")
+        if buf:
+            yield "".join(buf)
+
+    def write_xml(self, doc: dict, fh, pretty_print: bool = True, xml_declaration: bool = False) -> None:
+        """
+        Write an OSCAL JSON document dict to the text file handle *fh* as XML.
+
+        See :meth:`iter_xml` for the parameters; nothing is held in memory beyond
+        the current chunk and the open element path.
+        """
+        for chunk in self.iter_xml(doc, pretty_print=pretty_print, xml_declaration=xml_declaration):
+            fh.write(chunk)
+
+    def _iter_elem(self, elem: Element, level: int, space: str, default_ns: str | None) -> Iterator[str]:
+        """
+        Yield the serialized form of *elem* (without its tail), expanding deferred
+        child assemblies on the way. ``space`` is the indent unit ("" for none) and
+        ``default_ns`` the default namespace in scope at this point.
+        """
+        if isinstance(elem, _DeferredElement):
+            elem = self._dict_to_elem(elem.json_obj, elem.node, _local(elem.tag), shallow=True)
+
+        ns, _, local = elem.tag[1:].partition("}") if elem.tag.startswith("{") else ("", "", elem.tag)
+        if ns != self.namespace or any(k.startswith("{") for k in elem.attrib):
+            # Foreign content (e.g. re-emitted unmodeled extensions): let ElementTree
+            # serialize it with its own namespace declarations.
+            if space:
+                ET.indent(elem, space=space, level=level)
+            tail, elem.tail = elem.tail, None
+            yield ET.tostring(elem, encoding="unicode")
+            elem.tail = tail
             return
-        name  = node.get("name", "")
-        stype = node.get("structure-type", "")
-        if name and stype in ("assembly", "field") and name not in self._defs:
-            self._defs[name] = node
-        for child in node.get("children") or []:
-            if child and child.get("structure-type") == "flag":
-                fn = child.get("name", "")
-                if fn and fn not in self._defs:
-                    self._defs[fn] = child
-            else:
-                self._index_defs(child)
+
+        start = f"<{local}"
+        if ns != default_ns:
+            start += f' xmlns="{_escape_attrib(ns)}"'
+        for key, val in elem.attrib.items():
+            start += f' {key}="{_escape_attrib(val)}"'
+
+        count = len(elem)
+        text = elem.text
+        if space and count and (not text or not text.strip()):
+            text = "\n" + space * (level + 1)
+        if not text and not count:
+            yield start + " />"
+            return
+        yield start + ">"
+        if text:
+            yield _escape_cdata(text)
+        for i, child in enumerate(elem):
+            yield from self._iter_elem(child, level + 1, space, ns)
+            tail = child.tail
+            if space and (not tail or not tail.strip()):
+                tail = "\n" + space * (level + 1 if i < count - 1 else level)
+            if tail:
+                yield _escape_cdata(tail)
+        yield f"</{local}>"
+
+    # ------------------------------------------------------------------
+    # Compiled plans (for resolving recursive nodes and per-node dispatch)
+    # ------------------------------------------------------------------
 
     def _resolve(self, node: dict) -> dict:
         """Return the full definition node for a recursive stub."""
-        if node.get("structure-type") == "recursive":
-            return self._defs.get(node.get("name", ""), node)
-        return node
+        return self._plans.resolve(node)
+
+    def _local(self, tag: str) -> str:
+        """``_local(tag)``, memoized per distinct tag."""
+        local = self._local_names.get(tag)
+        if local is None:
+            local = self._local_names[tag] = _local(tag)
+        return local
+
+    def _xml_child_spec(self, node: dict, cardinality: dict | None, is_wrapper: bool, name: str) -> tuple:
+        """
+        Return ``(child node, cardinality node, is_wrapper)`` for an XML child
+        element named *name* under an element described by *node*.
+
+        When *is_wrapper* is True the parent is a GROUPED wrapper element and
+        *node*/*cardinality* describe its items. Returns ``(None, None, False)``
+        for markup, unmodeled content and anything else the index does not
+        describe as a modeled child.
+        """
+        if is_wrapper:
+            if node.get("use-name", "") == name:
+                return node, cardinality, False
+            return None, None, False
+        return self._plans.plan(node).xml_child_table.get(name, (None, None, False))
+
+    def _is_streamable(self, node: dict, cardinality: dict | None) -> bool:
+        """True when *node* is a repeatable assembly that can be converted on its own."""
+        return (self._plans.plan(node).is_assembly
+                and (cardinality or node).get("max-occurs", "1") != "1")
 
     # ------------------------------------------------------------------
     # XML → JSON
@@ -643,104 +1542,66 @@ class OSCALConverter:
         Returns a dict for assemblies and complex fields, or a scalar for
         simple fields (no flags, plain text value).
         """
-        node  = self._resolve(node)
-        stype = node.get("structure-type", "")
+        if isinstance(element, _ConvertedElement):
+            return element.value
+        plan = self._plans.plan(node)
         result: dict = {}
 
         # 1. Flags: XML attributes → JSON properties (in index-defined order)
-        #    Build a local-name lookup of all attributes present on this element
-        #    so we can iterate the index sequence rather than attribute order.
-        attrib_by_local: dict[str, str] = {_local(k): v for k, v in element.attrib.items()}
-        for flag_nd in [c for c in node.get("children") or [] if c and c.get("structure-type") == "flag"]:
-            ln = flag_nd.get("use-name", "")
-            if ln in attrib_by_local:
-                result[ln] = _cast(attrib_by_local[ln], flag_nd.get("datatype", "string"))
+        attrib = element.attrib
+        if attrib and plan.flags:
+            if any(k[0] == "{" for k in attrib):
+                attrib = {self._local(k): v for k, v in attrib.items()}
+            for ln, cast in plan.flags:
+                if ln in attrib:
+                    result[ln] = cast(attrib[ln]) if cast is not None else attrib[ln]
 
         # 2. Field value: XML text/markup content → JSON value
-        if stype == "field":
-            datatype = node.get("datatype", "string")
-            jvk      = node.get("json-value-key") or ""
-            jvkf     = node.get("json-value-key-flag") or ""
-
-            text_val = (
-                _markup_to_md(element, datatype)
-                if datatype in _MARKUP_TYPES
-                else (element.text or "").strip()
-            )
+        if plan.is_field:
+            if plan.is_markup:
+                text_val = typed_val = _markup_to_md(element, plan.datatype)
+            else:
+                text_val = (element.text or "").strip()
+                typed_val = plan.cast(text_val) if plan.cast is not None and text_val else text_val
 
-            if jvk:
+            if plan.jvk:
                 if text_val:
-                    typed_val = text_val if datatype in _MARKUP_TYPES else _cast(text_val, datatype)
                     if not result:  # No flags — collapse to plain scalar per OSCAL JSON convention
                         return typed_val
-                    result[jvk] = typed_val
-            elif jvkf:
+                    result[plan.jvk] = typed_val
+            elif plan.jvkf:
                 # One flag's value becomes the JSON object key; its text is the value
-                key_val = result.pop(jvkf, "")
+                key_val = result.pop(plan.jvkf, "")
                 if text_val:
-                    result[key_val] = text_val if datatype in _MARKUP_TYPES else _cast(text_val, datatype)
+                    result[key_val] = typed_val
             elif text_val:
                 if not result:
                     # Simple field with no flags: return plain scalar
-                    return text_val if datatype in _MARKUP_TYPES else _cast(text_val, datatype)
-                result["STRVALUE"] = text_val if datatype in _MARKUP_TYPES else _cast(text_val, datatype)
+                    return typed_val
+                result["STRVALUE"] = typed_val
 
         # 3. Children: recurse into child elements
-        self._xml_children(element, node, result)
+        self._xml_children(element, plan, result)
         return result
 
-    def _xml_children(self, element: Element, node: dict, result: dict) -> None:
-        """Process all child nodes from the index against element's XML children."""
-        # Pre-compute the set of OSCAL XML element names used by wrapped children.
-        # This lets _xml_unwrapped_field identify which children carry inline markup
-        # (prose) versus structured OSCAL content.
-        known_xml_names: set[str] = set()
-        for cn in node.get("children") or []:
-            if not cn or cn.get("wrapped-in-xml") is False:
-                continue
-            stype_cn = cn.get("structure-type", "")
-            if stype_cn == "choice":
-                for alt in cn.get("children") or []:
-                    if alt:
-                        un = alt.get("use-name", "")
-                        ga = alt.get("group-as", "")
-                        if un:
-                            known_xml_names.add(un)
-                        if ga:
-                            known_xml_names.add(ga)
-            else:
-                un = cn.get("use-name", "")
-                ga = cn.get("group-as", "")
-                if un:
-                    known_xml_names.add(un)
-                if ga:
-                    known_xml_names.add(ga)
-
-        for child_nd in node.get("children") or []:
-            if not child_nd:
-                continue
-            stype = child_nd.get("structure-type", "")
-
-            if child_nd.get("wrapped-in-xml") is False:
-                self._xml_unwrapped_field(element, child_nd, result, known_xml_names)
-            elif stype == "choice":
-                for alt in child_nd.get("children") or []:
-                    if alt:
-                        self._xml_child(element, alt, result)
-            elif stype == "any":
-                self._xml_any(element, node, result)
-            elif stype == "recursive":
-                self._xml_child(element, self._resolve(child_nd), result, cardinality=child_nd)
+    def _xml_children(self, element: Element, plan: _NodePlan, result: dict) -> None:
+        """Process all child nodes from the plan against element's XML children."""
+        by_name: dict[str, list[Element]] | None = None
+        for kind, spec in plan.children:
+            if kind is _CHILD:
+                if by_name is None:
+                    # Group the XML children by local name once per element.
+                    by_name = {}
+                    for child in element:
+                        by_name.setdefault(self._local(child.tag), []).append(child)
+                if by_name:
+                    self._xml_child(by_name, spec, result)
+            elif kind is _UNWRAPPED:
+                self._xml_unwrapped_field(element, spec, result)
             else:
-                self._xml_child(element, child_nd, result)
+                self._xml_any(element, spec, result)
 
-    def _xml_unwrapped_field(
-        self,
-        element: Element,
-        child_nd: dict,
-        result: dict,
-        known_xml_names: set,
-    ) -> None:
+    def _xml_unwrapped_field(self, element: Element, spec: tuple, result: dict) -> None:
         """
         Extract a field whose content is inline markup inside the parent element.
 
@@ -748,11 +1609,10 @@ class OSCALConverter:
         (e.g. ``prose`` in ``<part>``, ``<guideline>``) appear as block-level HTML
         children (``<p>``, ``<ul>``, ``<ol>``, etc.) mixed directly inside the parent
         element rather than as a dedicated child element.  This method collects those
-        markup children — those whose local tag name is not in *known_xml_names* —
-        and converts them to a Markdown string.
+        markup children — those whose local tag name is not one of the parent's
+        known OSCAL child names — and converts them to a Markdown string.
         """
-        use_name = child_nd.get("use-name", "")
-        datatype = child_nd.get("datatype", "string")
+        use_name, datatype, known_xml_names = spec
 
         # Build a synthetic element holding only the markup children.
         # ET.append does not remove children from the original element, so sharing
@@ -760,7 +1620,7 @@ class OSCALConverter:
         prose_elem = ET.Element("_prose")
         prose_elem.text = element.text  # text before the first child element
         for child in element:
-            if _local(child.tag) not in known_xml_names:
+            if self._local(child.tag) not in known_xml_names:
                 prose_elem.append(child)
 
         md_text = (
@@ -771,83 +1631,47 @@ class OSCALConverter:
         if md_text:
             result[use_name] = md_text
 
-    def _xml_child(
-        self,
-        parent: Element,
-        child_nd: dict,
-        result: dict,
-        cardinality: dict | None = None,
-    ) -> None:
-        """
-        Locate XML elements matching one index child node and add them to result.
-
-        ``cardinality`` overrides max-occurs when the caller is a resolved
-        recursive stub whose reference carries different cardinality than the
-        definition itself.
-        """
-        use_name     = child_nd.get("use-name", "")
-        group_as     = child_nd.get("group-as") or ""
-        group_in_xml = child_nd.get("group-as-in-xml") or ""
-        group_in_json= child_nd.get("group-as-in-json") or ""
-        json_key_flag= child_nd.get("json-key") or ""
-        max_occurs   = (cardinality or child_nd).get("max-occurs", "1")
-
+    def _xml_child(self, by_name: dict[str, list[Element]], spec: _ChildSpec, result: dict) -> None:
+        """Add the XML elements matching one compiled child spec to result."""
         # Locate the XML source elements
-        if group_in_xml == "GROUPED" and group_as:
-            wrapper = next((e for e in parent if _local(e.tag) == group_as), None)
-            if wrapper is None:
+        if spec.grouped:
+            wrappers = by_name.get(spec.group_as)
+            if not wrappers:
                 return
-            elems = [e for e in wrapper if _local(e.tag) == use_name]
+            elems = [e for e in wrappers[0] if self._local(e.tag) == spec.use_name]
         else:
-            elems = [e for e in parent if _local(e.tag) == use_name]
+            elems = by_name.get(spec.use_name)
 
         if not elems:
             return
 
-        json_name = group_as or use_name
-
-        if group_in_json == "BY_KEY" and json_key_flag:
+        child_nd = spec.node
+        if spec.by_key:
+            json_key_flag = spec.json_key_flag
             obj: dict = {}
             for elem in elems:
-                key = elem.get(json_key_flag) or _local(elem.tag)
+                key = elem.get(json_key_flag) or self._local(elem.tag)
                 sub = self._elem_to_dict(elem, child_nd)
                 if isinstance(sub, dict):
                     sub.pop(json_key_flag, None)
                 obj[key] = sub
-            result[json_name] = obj
+            result[spec.json_name] = obj
 
-        elif group_in_json == "SINGLETON_OR_ARRAY":
+        elif spec.singleton_or_array:
             converted = [self._elem_to_dict(e, child_nd) for e in elems]
-            result[json_name] = converted[0] if len(converted) == 1 else converted
+            result[spec.json_name] = converted[0] if len(converted) == 1 else converted
 
-        elif max_occurs == "unbounded" or group_in_json == "ARRAY":
-            result[json_name] = [self._elem_to_dict(e, child_nd) for e in elems]
+        elif spec.xml_list:
+            result[spec.json_name] = [self._elem_to_dict(e, child_nd) for e in elems]
 
         else:
-            result[json_name] = self._elem_to_dict(elems[0], child_nd)
+            result[spec.json_name] = self._elem_to_dict(elems[0], child_nd)
 
-    def _xml_any(self, element: Element, node: dict, result: dict) -> None:
+    def _xml_any(self, element: Element, known: frozenset, result: dict) -> None:
         """Collect child XML elements not described by the model into _unmodeled."""
-        known: set[str] = set()
-        for cn in node.get("children") or []:
-            if not cn or cn.get("structure-type") == "any":
-                continue
-            if cn.get("structure-type") == "choice":
-                for alt in cn.get("children") or []:
-                    if alt:
-                        known.add(alt.get("use-name", ""))
-                        if alt.get("group-as"):
-                            known.add(alt["group-as"])
-            else:
-                known.add(cn.get("use-name", ""))
-                if cn.get("group-as"):
-                    known.add(cn["group-as"])
-        for fn in [c for c in node.get("children") or [] if c and c.get("structure-type") == "flag"]:
-            known.add(fn.get("use-name", ""))
-
         unmodeled: dict = {}
         for child in element:
-            ln = _local(child.tag)
+            ln = self._local(child.tag)
             if ln not in known:
                 unmodeled.setdefault(ln, [])
                 unmodeled[ln].append(ET.tostring(child, encoding="unicode"))
@@ -863,30 +1687,34 @@ class OSCALConverter:
         json_obj: dict,
         node: dict,
         tag_override: str | None = None,
+        shallow: bool = False,
     ) -> Element:
-        """Convert a JSON dict to an XML Element given its index node."""
-        node  = self._resolve(node)
-        tag   = tag_override or node.get("use-name") or self.model
-        stype = node.get("structure-type", "")
+        """
+        Convert a JSON dict to an XML Element given its index node.
+
+        With ``shallow`` only this element is built: child objects become
+        ``_DeferredElement`` placeholders for the streaming writer to expand.
+        """
+        plan  = self._plans.plan(node)
+        tag   = tag_override or plan.tag
         elem  = Element(f"{{{self.namespace}}}{tag}")
         remaining = dict(json_obj)
 
         # 1. Flags → XML attributes
-        for flag_nd in [c for c in node.get("children") or [] if c and c.get("structure-type") == "flag"]:
-            fname = flag_nd.get("use-name", "")
+        for fname, _ in plan.flags:
             if fname in remaining:
                 val = remaining.pop(fname)
                 elem.set(fname, "true" if val is True else "false" if val is False else str(val))
 
         # 2. Field value → XML text/markup content
-        if stype == "field":
-            datatype = node.get("datatype", "string")
-            jvk      = node.get("json-value-key") or ""
-            jvkf     = node.get("json-value-key-flag") or ""
+        if plan.is_field:
+            datatype = plan.datatype
+            jvk      = plan.jvk
+            jvkf     = plan.jvkf
 
             if jvk and jvk in remaining:
                 val = remaining.pop(jvk)
-                if datatype in _MARKUP_TYPES:
+                if plan.is_markup:
                     _md_to_xml(str(val), elem, datatype, self.namespace)
                 else:
                     elem.text = str(val)
@@ -895,7 +1723,7 @@ class OSCALConverter:
                 # The first remaining key is the flag value; its value is the text
                 for k, v in list(remaining.items()):
                     elem.set(jvkf, k)
-                    if datatype in _MARKUP_TYPES:
+                    if plan.is_markup:
                         _md_to_xml(str(v), elem, datatype, self.namespace)
                     else:
                         elem.text = str(v)
@@ -906,39 +1734,27 @@ class OSCALConverter:
                 elem.text = str(remaining.pop("STRVALUE"))
 
         # 3. Children → XML sub-elements (in index order)
-        self._json_children(remaining, node, elem)
+        self._json_children(remaining, plan, elem, shallow)
 
         if remaining:
             logger.debug(f"Unprocessed JSON keys for <{tag}>: {list(remaining.keys())}")
 
         return elem
 
-    def _json_children(self, remaining: dict, node: dict, parent: Element) -> None:
-        """Emit XML child elements from remaining JSON keys, guided by the index."""
-        for child_nd in node.get("children") or []:
-            if not child_nd:
-                continue
-            stype = child_nd.get("structure-type", "")
-
-            if child_nd.get("wrapped-in-xml") is False:
-                self._json_unwrapped_field(remaining, child_nd, parent)
-            elif stype == "choice":
-                for alt in child_nd.get("children") or []:
-                    if alt:
-                        self._json_child(remaining, alt, parent)
-            elif stype == "any":
-                self._json_any(remaining, parent)
-            elif stype == "recursive":
-                self._json_child(remaining, self._resolve(child_nd), parent, cardinality=child_nd)
+    def _json_children(self, remaining: dict, plan: _NodePlan, parent: Element, shallow: bool = False) -> None:
+        """Emit XML child elements from remaining JSON keys, guided by the plan."""
+        for kind, spec in plan.children:
+            if not remaining:
+                return
+            if kind is _CHILD:
+                if spec.json_name in remaining:
+                    self._json_child(remaining, spec, parent, shallow=shallow)
+            elif kind is _UNWRAPPED:
+                self._json_unwrapped_field(remaining, spec, parent)
             else:
-                self._json_child(remaining, child_nd, parent)
+                self._json_any(remaining, parent)
 
-    def _json_unwrapped_field(
-        self,
-        remaining: dict,
-        child_nd: dict,
-        parent: Element,
-    ) -> None:
+    def _json_unwrapped_field(self, remaining: dict, spec: tuple, parent: Element) -> None:
         """
         Emit inline markup content for a field with ``wrapped-in-xml: false``.
 
@@ -946,8 +1762,7 @@ class OSCALConverter:
         XML wrapper element.  The Markdown is converted to block-level HTML elements
         and appended directly inside *parent*.
         """
-        use_name = child_nd.get("use-name", "")
-        datatype = child_nd.get("datatype", "string")
+        use_name, datatype, _ = spec
 
         if use_name not in remaining:
             return
@@ -964,65 +1779,63 @@ class OSCALConverter:
     def _json_child(
         self,
         remaining: dict,
-        child_nd: dict,
+        spec: _ChildSpec,
         parent: Element,
-        cardinality: dict | None = None,
+        shallow: bool = False,
     ) -> None:
-        """Emit XML element(s) for one index child node from remaining JSON keys."""
-        use_name     = child_nd.get("use-name", "")
-        group_as     = child_nd.get("group-as") or ""
-        group_in_xml = child_nd.get("group-as-in-xml") or ""
-        group_in_json= child_nd.get("group-as-in-json") or ""
-        json_key_flag= child_nd.get("json-key") or ""
-        max_occurs   = (cardinality or child_nd).get("max-occurs", "1")
-        ns           = self.namespace
-        json_name    = group_as or use_name
-
-        if json_name not in remaining:
-            return
-        json_val = remaining.pop(json_name)
+        """Emit XML element(s) for one compiled child spec from remaining JSON keys."""
+        json_val = remaining.pop(spec.json_name)
 
         def container() -> Element:
             """Return the element to append children to, creating a wrapper if needed."""
-            if group_in_xml == "GROUPED" and group_as:
-                return SubElement(parent, f"{{{ns}}}{group_as}")
+            if spec.grouped:
+                return SubElement(parent, spec.group_tag)
             return parent
 
-        if group_in_json == "BY_KEY" and json_key_flag:
+        child_nd = spec.node
+        use_name = spec.use_name
+        if spec.by_key:
             c = container()
             if isinstance(json_val, dict):
+                json_key_flag = spec.json_key_flag
                 for key, obj in json_val.items():
                     child_obj = dict(obj) if isinstance(obj, dict) else {"STRVALUE": str(obj)}
                     child_obj[json_key_flag] = key
-                    c.append(self._dict_to_elem(child_obj, child_nd, use_name))
+                    c.append(self._child_elem(child_obj, child_nd, use_name, shallow))
 
-        elif max_occurs == "unbounded" or group_in_json in ("ARRAY", "SINGLETON_OR_ARRAY"):
+        elif spec.json_list:
             items = json_val if isinstance(json_val, list) else [json_val]
             c = container()
-            datatype = child_nd.get("datatype", "string")
             for item in items:
                 if isinstance(item, dict):
-                    c.append(self._dict_to_elem(item, child_nd, use_name))
+                    c.append(self._child_elem(item, child_nd, use_name, shallow))
                 else:
-                    child_elem = Element(f"{{{ns}}}{use_name}")
-                    if datatype in _MARKUP_TYPES:
-                        _md_to_xml(str(item), child_elem, datatype, self.namespace)
+                    child_elem = Element(spec.tag)
+                    if spec.is_markup:
+                        _md_to_xml(str(item), child_elem, spec.datatype, self.namespace)
                     else:
                         child_elem.text = str(item)
                     c.append(child_elem)
 
         else:
             if isinstance(json_val, dict):
-                parent.append(self._dict_to_elem(json_val, child_nd, use_name))
+                parent.append(self._child_elem(json_val, child_nd, use_name, shallow))
             else:
-                child_elem = Element(f"{{{ns}}}{use_name}")
-                datatype = child_nd.get("datatype", "string")
-                if datatype in _MARKUP_TYPES:
-                    _md_to_xml(str(json_val), child_elem, datatype, self.namespace)
+                child_elem = Element(spec.tag)
+                if spec.is_markup:
+                    _md_to_xml(str(json_val), child_elem, spec.datatype, self.namespace)
                 else:
                     child_elem.text = str(json_val)
                 parent.append(child_elem)
 
+    def _child_elem(self, json_obj: dict, node: dict, tag: str, shallow: bool) -> Element:
+        """Build a child element, or a deferred placeholder for it when ``shallow``."""
+        if not shallow:
+            return self._dict_to_elem(json_obj, node, tag)
+        placeholder = _DeferredElement(f"{{{self.namespace}}}{tag}")
+        placeholder.json_obj, placeholder.node = json_obj, node
+        return placeholder
+
     def _json_any(self, remaining: dict, parent: Element) -> None:
         """Re-emit unmodeled content stored under the _unmodeled key."""
         unmodeled = remaining.pop("_unmodeled", None)
@@ -1037,7 +1850,7 @@ class OSCALConverter:
 
 
 # ---------------------------------------------------------------------------
-# OSCALPath – XPath-like query engine for OSCAL JSON
+# Path expressions – parser shared by OSCALPath and NativePath
 # ---------------------------------------------------------------------------
 
 class _PathStep:
@@ -1185,57 +1998,1164 @@ def _opath_parse(path: str) -> list[_PathStep]:
     return steps
 
 
-class OSCALPath:
+# ---------------------------------------------------------------------------
+# Compiled path queries
+# ---------------------------------------------------------------------------
+#
+# A path string is parsed once and compiled into a tuple of *selectors*: one
+# closure per step that maps a single context value to the candidates the
+# step selects, with its axis, name, metaschema container handling and
+# predicates already bound.  Evaluation then just chains the selectors, with
+# no per-value dispatch on the axis string.  Selectors may return live lists
+# from the document; callers copy them into their own result lists.
+#
+# Compiled queries are kept in a process-wide LRU keyed by ``(scope, path)``,
+# where the scope is the shared OSCALPath index of a model (so every
+# OSCALPath built for the same model index reuses them) or the NativePath
+# class.
+#
+# The planner also recognises a leading ``//name[@id='v']`` (or ``@uuid``)
+# step; given an :class:`IdIndex` of the queried document, that step is
+# answered from the index instead of a walk over the whole tree.
+
+class QueryCacheInfo(NamedTuple):
+    """Counters for the compiled path-query cache (see ``query_cache_info``)."""
+    hits: int
+    misses: int
+    entries: int
+    max_entries: int
+
+
+class _QueryCache:
+    """Bounded LRU of compiled path queries keyed by ``(scope, path)``.  Shared by all threads."""
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, _CompiledQuery] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> "_CompiledQuery | None":
+        with self._lock:
+            compiled = self._entries.get(key)
+            if compiled is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return compiled
+
+    def put(self, key: tuple, compiled: "_CompiledQuery") -> None:
+        with self._lock:
+            self._entries[key] = compiled
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def info(self) -> QueryCacheInfo:
+        with self._lock:
+            return QueryCacheInfo(self._hits, self._misses, len(self._entries), self.max_entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+_QUERY_CACHE_MAX_ENTRIES = 4096
+_query_cache = _QueryCache(_QUERY_CACHE_MAX_ENTRIES)
+
+
+def query_cache_info() -> QueryCacheInfo:
+    """Return hit/miss and size counters for the compiled path-query cache."""
+    return _query_cache.info()
+
+
+def clear_query_cache() -> None:
+    """Empty the compiled path-query cache and reset its counters."""
+    _query_cache.clear()
+
+
+class _CompiledQuery:
     """
-    XPath-like query engine for OSCAL JSON data.
+    Compiled form of one path: eager selectors for :func:`_evaluate`, lazy
+    pipelines for :func:`_iterate`, and optional id/uuid and prop index plans
+    for the first step.
+    """
+    __slots__ = ("steps", "rest", "lookup", "prop_lookup", "stream", "stream_rest", "fanout")
+
+    def __init__(self, steps: tuple, lazy_steps: tuple, lookup: "_IdLookup | None",
+                 prop_lookup: "_PropLookup | None", fanout: "tuple | None") -> None:
+        self.steps = steps
+        self.rest = steps[1:]   # steps after the one answered by a lookup or *fanout*
+        self.lookup = lookup
+        self.prop_lookup = prop_lookup
+        self.stream = _pipeline(lazy_steps)
+        self.stream_rest = _pipeline(lazy_steps[1:])
+        # (filtered child selector, skip keys, target keys) of a leading
+        # descendant step, for the shared walk of _evaluate_many; None otherwise
+        self.fanout = fanout
+
+
+def _compiled_query(scope, path: str, engine) -> _CompiledQuery:
+    """Return the compiled form of *path* for *engine*, compiling and caching it on a miss."""
+    key = (scope, path)
+    compiled = _query_cache.get(key)
+    if compiled is None:
+        steps = _opath_parse(path)
+        compiled = _CompiledQuery(*_compile_steps(steps, engine._compile_axis),
+                                  _plan_id_lookup(steps, engine), _plan_prop_lookup(steps, engine),
+                                  _plan_fanout(steps, engine))
+        _query_cache.put(key, compiled)
+    return compiled
+
+
+def _planned_first(compiled: _CompiledQuery, data, id_index: "IdIndex | None",
+                   prop_index: "PropIndex | None") -> list | None:
+    """Answer the first step of *compiled* from an index covering *data*, or return ``None`` to walk."""
+    if compiled.lookup is not None and id_index is not None and id_index.root is data:
+        return compiled.lookup.select(id_index)
+    if compiled.prop_lookup is not None and prop_index is not None and prop_index.root is data:
+        return compiled.prop_lookup.select(prop_index)
+    return None
+
+
+def _evaluate(compiled: _CompiledQuery, data, id_index: "IdIndex | None",
+              prop_index: "PropIndex | None" = None) -> list:
+    """Run *compiled* against *data*, answering a planned first step from an index when one covers *data*."""
+    first = _planned_first(compiled, data, id_index, prop_index)
+    if first is not None:
+        return _run_steps(compiled.rest, first)
+    return _run_steps(compiled.steps, [data])
+
+
+def _evaluate_many(engine, paths: dict[str, str], data, id_index: "IdIndex | None",
+                   prop_index: "PropIndex | None" = None) -> dict[str, list]:
+    """
+    Evaluate several paths against *data* at once; the result for each name
+    equals ``_evaluate`` of its path.
+
+    Paths answered by an index use it.  Paths starting with a descendant
+    step share a single walk of *data* (see :func:`_walk_shared`); the rest
+    are evaluated one by one, as they do not walk the document.  Repeated
+    paths are evaluated once.
+    """
+    results: dict[str, list] = {}
+    shared: list[tuple[str, _CompiledQuery]] = []
+    for path in dict.fromkeys(paths.values()):
+        compiled = engine._compiled(path)
+        first = _planned_first(compiled, data, id_index, prop_index)
+        if first is not None:
+            results[path] = _run_steps(compiled.rest, first)
+        elif compiled.fanout is not None:
+            shared.append((path, compiled))
+        else:
+            results[path] = _run_steps(compiled.steps, [data])
+    if shared:
+        firsts = _walk_shared([compiled.fanout for _, compiled in shared], data)
+        for (path, compiled), first in zip(shared, firsts):
+            results[path] = _run_steps(compiled.rest, first)
+    return {name: list(results[path]) for name, path in paths.items()}
 
-    Uses the metaschema index to translate XML path steps into the correct JSON
-    navigation — resolving element names to their JSON keys, and handling the
-    different container types (ARRAY, BY_KEY, SINGLETON_OR_ARRAY, scalar).
+
+def _walk_shared(fanouts: list[tuple], root) -> list[list]:
+    """
+    Run several leading descendant steps in one walk of *root*.
+
+    Each fanout is ``(select, skip_keys, target_keys)``.  A subtree is
+    entered while at least one step still needs it, and each step collects
+    only within the subtrees its own walk would visit, so every result list
+    equals that step's own descendant selection, in the same order.  At each
+    dict only the steps whose target keys it holds run their selector.
+    """
+    outs: list[list] = [[] for _ in fanouts]
+    selects = [select for select, _, _ in fanouts]
+    skips = [skip_keys for _, skip_keys, _ in fanouts]
+    any_skip = frozenset().union(*skips)
+    by_target: dict[str, list[int]] = {}
+    for i, (_, _, targets) in enumerate(fanouts):
+        for key in targets:
+            by_target.setdefault(key, []).append(i)
+
+    def visit(val, active: list[int]) -> None:
+        if isinstance(val, dict):
+            hit = [i for k in val if k in by_target for i in by_target[k]]
+            if hit:
+                hit_set = set(hit)
+                for i in active:
+                    if i in hit_set:
+                        outs[i].extend(selects[i](val))
+            for k, v in val.items():
+                if isinstance(v, (dict, list)):
+                    if k in any_skip:
+                        sub = [i for i in active if k not in skips[i]]
+                        if sub:
+                            visit(v, sub)
+                    else:
+                        visit(v, active)
+        elif isinstance(val, list):
+            # Child selectors match nothing on a list; just descend
+            for item in val:
+                if isinstance(item, (dict, list)):
+                    visit(item, active)
+
+    visit(root, list(range(len(fanouts))))
+    return outs
+
+
+def _iterate(compiled: _CompiledQuery, data, id_index: "IdIndex | None",
+             prop_index: "PropIndex | None" = None) -> Iterator:
+    """Lazy counterpart of :func:`_evaluate`: yield matches in the same order, one at a time."""
+    first = _planned_first(compiled, data, id_index, prop_index)
+    if first is not None:
+        return iter(compiled.stream_rest(first))
+    return iter(compiled.stream((data,)))
+
+
+def _compile_steps(steps: list[_PathStep], compile_axis) -> tuple[tuple, tuple]:
+    """
+    Compile *steps* into eager selectors (returning lists) and lazy ones.
+
+    The two differ only for the descendant axis, whose lazy selector is a
+    generator, and for predicate filtering, which the lazy form applies as
+    candidates are produced.
+    """
+    eager, lazy = [], []
+    for step in steps:
+        tests = tuple(_compile_pred(pred, compile_axis) for pred in step.predicates)
+        eager.append(_filtered(compile_axis(step.axis, step.name), tests, False))
+        lazy.append(_filtered(compile_axis(step.axis, step.name, lazy=True), tests, True))
+    return tuple(eager), tuple(lazy)
+
+
+def _filtered(select, tests: tuple, lazy: bool):
+    """Apply a step's predicate *tests* (AND semantics) to the candidates of *select*."""
+    if not tests:
+        return select
+    if len(tests) == 1:
+        test = tests[0]
+        if lazy:
+            return lambda val: (c for c in select(val) if test(c))
+        return lambda val: [c for c in select(val) if test(c)]
+    if lazy:
+        return lambda val: (c for c in select(val) if all(t(c) for t in tests))
+    return lambda val: [c for c in select(val) if all(t(c) for t in tests)]
+
+
+def _pipeline(selectors: tuple):
+    """
+    Chain lazy *selectors* into a function from an iterable of context values
+    to an iterable of matches.  Matches come out depth-first, which is the
+    same order the eager step-by-step evaluation produces.
+    """
+    run = _identity
+    for select in reversed(selectors):
+        run = _stage(select, run)
+    return run
+
+
+def _identity(vals):
+    return vals
+
+
+def _stage(select, inner):
+    def run(vals):
+        for val in vals:
+            yield from inner(select(val))
+    return run
+
+
+def _compile_pred(pred: _PathPred, compile_axis):
+    """Compile a predicate into a ``value -> bool`` test that stops at the first match."""
+    _, lazy = _compile_steps(pred.lhs, compile_axis)
+    if len(lazy) == 1:
+        # A single step needs no pipeline: its selector already yields the values
+        matches = lazy[0]
+    else:
+        run = _pipeline(lazy)
+
+        def matches(val):
+            return run((val,))
+    negated = pred.negated
+    compare = _compile_compare(pred.op, pred.rhs)
+    if compare is None:
+        # Existence check
+        return lambda val: _nonempty(matches(val)) != negated
+    return lambda val: any(map(compare, matches(val))) != negated
+
+
+def _nonempty(values) -> bool:
+    for _ in values:
+        return True
+    return False
+
+
+_ORDERINGS = {"<": operator.lt, ">": operator.gt, "<=": operator.le, ">=": operator.ge}
+
+
+def _compile_compare(op: str, rhs: "str | None"):
+    """
+    Return a ``value -> bool`` comparison against the literal *rhs*, or ``None``
+    for an existence predicate (no operator).
+
+    ``=`` and ``!=`` compare string forms; the ordering operators compare
+    numerically when both sides parse as floats, otherwise as strings.
+    """
+    if not op:
+        return None
+    if rhs is None:
+        return lambda val: False
+    if op == "=":
+        return lambda val: (val if isinstance(val, str) else str(val)) == rhs
+    if op == "!=":
+        return lambda val: (val if isinstance(val, str) else str(val)) != rhs
+    order = _ORDERINGS.get(op)
+    if order is None:
+        return lambda val: False
+    try:
+        rhs_num: float | None = float(rhs)
+    except ValueError:
+        rhs_num = None
+
+    def compare(val) -> bool:
+        s = val if isinstance(val, str) else str(val)
+        if rhs_num is not None:
+            try:
+                return order(float(s), rhs_num)
+            except (ValueError, TypeError):
+                pass
+        return order(s, rhs)
+
+    return compare
+
+
+def _run_steps(compiled: tuple, ctx: list) -> list:
+    """Apply compiled selectors in turn, each to every value of the current context."""
+    for select in compiled:
+        if not ctx:
+            break
+        out: list = []
+        for val in ctx:
+            out.extend(select(val))
+        ctx = out
+    return ctx
+
+
+def _extended(path: tuple | None, *steps) -> tuple | None:
+    return None if path is None else path + steps
+
+
+def _json_key(trail: tuple) -> str | None:
+    """The JSON key the last node of *trail* sits under (directly or as a list item), if any."""
+    if len(trail) < 2:
+        return None
+    parent = trail[-2]
+    if isinstance(parent, list):
+        if len(trail) < 3 or not isinstance(trail[-3], dict):
+            return None
+        holder, child = trail[-3], parent
+    else:
+        holder, child = parent, trail[-1]
+    return next((k for k, v in holder.items() if v is child), None)
+
+
+class _DocumentOrder:
+    """
+    Current paths and sibling positions of index entries, for one lookup.
+
+    :class:`IdIndex` and :class:`PropIndex` record the dict keys and list
+    indices leading to each entry (its *path*) as they walk the document.
+    Edits can shift list indices, so :meth:`path` checks a recorded path
+    against the entry's *trail* of nodes and re-derives the steps that no
+    longer hold, scanning each container at most once.  The document must
+    not change while an instance is in use.
+    """
+    __slots__ = ("_steps", "_ordinals")
+
+    def __init__(self) -> None:
+        # id(container) → {id(child): dict key or list index}
+        self._steps: dict[int, dict[int, object]] = {}
+        # id(dict) → {key: position among the dict's keys}
+        self._ordinals: dict[int, dict[str, int]] = {}
+
+    def path(self, trail: tuple, recorded: tuple | None) -> tuple:
+        """Return the dict keys and list indices leading along *trail*, reusing *recorded* where it holds."""
+        if recorded is None or len(recorded) != len(trail) - 1:
+            return tuple(self._step(parent, child) for parent, child in zip(trail, trail[1:]))
+        path = None
+        for i, (parent, step, child) in enumerate(zip(trail, recorded, trail[1:])):
+            try:
+                if parent[step] is child:
+                    continue
+            except (LookupError, TypeError):
+                pass
+            if path is None:
+                path = list(recorded)
+            path[i] = self._step(parent, child)
+        return recorded if path is None else tuple(path)
+
+    def position(self, trail: tuple, path: tuple) -> tuple:
+        """
+        Return the position of each step of *path* among its siblings (the
+        list index, or the key's place in its dict); positions compare in
+        document order.
+        """
+        out = []
+        for parent, step in zip(trail, path):
+            if isinstance(parent, dict):
+                ordinals = self._ordinals.get(id(parent))
+                if ordinals is None:
+                    ordinals = self._ordinals[id(parent)] = {k: i for i, k in enumerate(parent)}
+                out.append(ordinals.get(step, -1))
+            else:
+                out.append(step)
+        return tuple(out)
+
+    def _step(self, parent, child):
+        steps = self._steps.get(id(parent))
+        if steps is None:
+            steps = self._steps[id(parent)] = {}
+            for k, v in parent.items() if isinstance(parent, dict) else enumerate(parent):
+                if isinstance(v, (dict, list)):
+                    steps.setdefault(id(v), k)
+        return steps.get(id(child), None if isinstance(parent, dict) else -1)
+
+
+class IdIndexEntry(NamedTuple):
+    """A node carrying an ``id`` or ``uuid`` flag (see :class:`IdIndex`)."""
+    node: dict
+    parent: "dict | list"   # container holding the node
+    path: tuple             # JSON path from the document root (keys and list positions)
+    key: str                # JSON key the node sits under, e.g. ``"controls"``
+
+
+class _IdRecord:
+    """One indexed ``attr`` value of a node, with the nodes leading to it from the root."""
+    __slots__ = ("attr", "value", "node", "trail", "key", "path", "checked")
+
+    def __init__(self, attr: str, value: str, node: dict, trail: tuple, key: str,
+                 path: tuple | None, checked: int) -> None:
+        self.attr = attr
+        self.value = value
+        self.node = node
+        self.trail = trail      # nodes from the document root down to *node*
+        self.key = key
+        self.path = path        # keys and list indices leading along *trail*; None until derived
+        self.checked = checked  # the index's edit count when *path* was last known to hold
+
+
+class IdIndex:
+    """
+    Index of a JSON document's nodes by their ``id`` and ``uuid`` values.
+
+    Built lazily on the first lookup with one walk of *root*; afterwards a
+    lookup is a dict access.  Like :class:`PropIndex`, the index can follow
+    edits: :meth:`update` patches it after a value in the document is
+    replaced, inserted or removed, and :meth:`discard` drops a removed
+    subtree.  An owner that changes its content any other way discards it
+    (see :attr:`OSCAL.content_version <oscal.oscal_content.OSCAL.content_version>`).
+
+    Passed as ``id_index`` to :meth:`OSCALPath.query` / :meth:`NativePath.query`,
+    it lets a leading ``//name[@id='v']`` or ``//name[@uuid='v']`` step skip
+    the descendant walk.  Results are identical to the walk: candidates are
+    re-checked against every predicate of the step and returned in document
+    order.
 
     Parameters
     ----------
-    model_index
-        Model-specific metaschema index dict (the value at
-        ``full_index["oscal_models"][model_name]``).  The same dict accepted
-        by :class:`OSCALConverter`.
+    root
+        The parsed JSON document (normally ``{"catalog": {...}}``).
+    """
 
-    Examples
-    --------
-    ::
+    KEYS: tuple[str, ...] = ("id", "uuid")
+    _SKIP_KEYS: frozenset[str] = frozenset({"$schema", "_unmodeled"})
 
-        path = OSCALPath(catalog_model_index)
+    def __init__(self, root) -> None:
+        self.root = root
+        # attr → value → records; None until built
+        self._entries: dict[str, dict[str, list[_IdRecord]]] | None = None
+        # id(node) → (node, its records)
+        self._nodes: dict[int, tuple[dict, list[_IdRecord]]] = {}
+        # (attr, value) pairs whose records were appended out of document order
+        self._unsorted: set[tuple[str, str]] = set()
+        # patches applied so far; recorded paths checked since the last one still hold
+        self._edits = 0
+
+    # -- lookups -------------------------------------------------------------
+
+    def lookup(self, attr: str, value: str) -> list[IdIndexEntry]:
+        """Return the entries whose *attr* (``"id"`` or ``"uuid"``) equals *value*, in document order."""
+        order = _DocumentOrder()
+        return [IdIndexEntry(record.node, record.trail[-2], self._path(record, order), record.key)
+                for record in self._records(attr, value, order)]
+
+    def _records(self, attr: str, value: str, order: _DocumentOrder) -> list[_IdRecord]:
+        self._ensure()
+        records = self._entries.get(attr, {}).get(value, [])
+        if (attr, value) in self._unsorted:
+            records.sort(key=lambda record: self._rank(record, order))
+            self._unsorted.discard((attr, value))
+        return records
+
+    def _path(self, record: _IdRecord, order: _DocumentOrder) -> tuple:
+        """Current path from the root to *record*'s node (see :class:`_DocumentOrder`)."""
+        if record.checked != self._edits:
+            record.path = order.path(record.trail, record.path)
+            record.checked = self._edits
+        return record.path
+
+    def _rank(self, record: _IdRecord, order: _DocumentOrder) -> tuple:
+        # The walk reaches a node through the dict holding its key: order by
+        # that dict, then the key, then the list position
+        position = order.position(record.trail, self._path(record, order))
+        depth = len(position) - (2 if isinstance(record.trail[-2], list) else 1)
+        return position[:depth], position[depth:]
+
+    # -- maintenance ---------------------------------------------------------
+
+    def update(self, trail: tuple, old, new) -> None:
+        """
+        Patch the index after the value *old* held by the last node of *trail*
+        was replaced by *new* (either may be ``None`` for an insert or delete).
 
-        # Descendant search with attribute predicate
-        controls = path.query("//control[@id='ac-2.2']", doc)
+        *trail* lists the nodes from the document root down to the dict or
+        list that was written to.
+        """
+        if self._entries is None:
+            return
+        self._edits += 1
+        if isinstance(old, (dict, list)):
+            self.discard(old)
+        holder = trail[-1]
+        if not isinstance(new, (dict, list)):
+            if isinstance(holder, dict):
+                # A scalar write: the holder's own id or uuid may have changed
+                self._drop(holder)
+                self._add(holder, trail, _json_key(trail), None, False)
+            return
+        new_trail = trail + (new,)
+        key = _json_key(new_trail)
+        if key is not None:
+            if isinstance(new, dict):
+                self._add(new, new_trail, key, None, False)
+            elif isinstance(holder, dict):
+                for item in new:
+                    if isinstance(item, dict):
+                        self._add(item, new_trail + (item,), key, None, False)
+        if key not in self._SKIP_KEYS:
+            self._visit(new, new_trail, None, False)
+
+    def discard(self, subtree) -> None:
+        """Drop every node found in *subtree*, which has been removed from the document."""
+        if self._entries is None:
+            return
+        self._edits += 1
+
+        def visit(val) -> None:
+            if isinstance(val, dict):
+                self._drop(val)
+                for v in val.values():
+                    if isinstance(v, (dict, list)):
+                        visit(v)
+            elif isinstance(val, list):
+                for item in val:
+                    if isinstance(item, (dict, list)):
+                        visit(item)
+
+        visit(subtree)
+
+    def _ensure(self) -> None:
+        if self._entries is None:
+            self._entries = {attr: {} for attr in self.KEYS}
+            self._visit(self.root, (self.root,), (), True)
+
+    def _visit(self, val, trail: tuple, path: tuple | None, in_order: bool) -> None:
+        """Index the nodes beneath *val*, reached through *trail* and *path* (``None`` if unknown)."""
+        skip_keys = self._SKIP_KEYS
+        add = self._add
+
+        # Visits dicts in the same order as the descendant axis, so a full
+        # build appends each value's records in document order.
+        def visit(val, trail: tuple, path: tuple | None) -> None:
+            if isinstance(val, dict):
+                for k, v in val.items():
+                    if isinstance(v, dict):
+                        add(v, trail + (v,), k, _extended(path, k), in_order)
+                    elif isinstance(v, list):
+                        for i, item in enumerate(v):
+                            if isinstance(item, dict):
+                                add(item, trail + (v, item), k, _extended(path, k, i), in_order)
+                    if k not in skip_keys and isinstance(v, (dict, list)):
+                        visit(v, trail + (v,), _extended(path, k))
+            elif isinstance(val, list):
+                for i, item in enumerate(val):
+                    if isinstance(item, (dict, list)):
+                        visit(item, trail + (item,), _extended(path, i))
+
+        visit(val, trail, path)
+
+    def _add(self, node: dict, trail: tuple, key: str | None, path: tuple | None, in_order: bool) -> None:
+        if key is None:
+            return
+        for attr in self.KEYS:
+            if attr in node:
+                value = node[attr]
+                value = value if isinstance(value, str) else str(value)
+                record = _IdRecord(attr, value, node, trail, key, path, self._edits if path is not None else -1)
+                records = self._entries[attr].setdefault(value, [])
+                if records and not in_order:
+                    self._unsorted.add((attr, value))
+                records.append(record)
+                self._nodes.setdefault(id(node), (node, []))[1].append(record)
+
+    def _drop(self, node: dict) -> None:
+        known = self._nodes.get(id(node))
+        if known is None or known[0] is not node:
+            return
+        del self._nodes[id(node)]
+        for record in known[1]:
+            values = self._entries[record.attr]
+            remaining = [r for r in values.get(record.value, ()) if r is not record]
+            if remaining:
+                values[record.value] = remaining
+            else:
+                values.pop(record.value, None)
 
-        # Absolute path
-        title = path.query_one("/*/metadata/title", doc)
 
-        # Relative path from a sub-dict
-        ver = path.query_one("oscal-version", doc["catalog"]["metadata"])
+class _IdLookup:
+    """
+    Planned rewrite of a leading ``//name[@id='v']`` step into an :class:`IdIndex` lookup.
 
-        # Path expression inside a predicate
-        labelled = path.query("//part[prop[@name='label']]", doc)
+    *shapes* maps ``(json_key, in_list)`` — where a node matching the step's
+    name can sit — to the rank of the name's spec, which orders matches under
+    the same parent as the child axis would.  Entries beneath a *pruned* key
+    are dropped, since the descendant walk would not have entered it.
+    """
+    __slots__ = ("attr", "value", "shapes", "pruned", "tests")
+
+    def __init__(self, attr: str, value: str, shapes: dict, pruned: frozenset[str], tests: tuple) -> None:
+        self.attr = attr
+        self.value = value
+        self.shapes = shapes
+        self.pruned = pruned
+        self.tests = tests
+
+    def select(self, index: IdIndex) -> list:
+        order = _DocumentOrder()
+        hits = []
+        pruned = self.pruned
+        for record in index._records(self.attr, self.value, order):
+            in_list = isinstance(record.trail[-2], list)
+            spec_rank = self.shapes.get((record.key, in_list))
+            if spec_rank is None:
+                continue
+            path = index._path(record, order)
+            # Steps down to the dict whose child step selects the node
+            depth = len(path) - (2 if in_list else 1)
+            if pruned and not pruned.isdisjoint(path[:depth]):
+                continue
+            hits.append((record, depth, spec_rank, path[-1] if in_list else 0))
+        if len(hits) > 1:
+            hits.sort(key=lambda hit: (order.position(hit[0].trail[:hit[1] + 1], hit[0].path[:hit[1]]),
+                                       hit[2], hit[3]))
+        tests = self.tests
+        return [hit[0].node for hit in hits if all(t(hit[0].node) for t in tests)]
 
-        # Multiple predicates
-        specific = path.query("//param[@id='ac-1_prm_1'][select]", doc)
+
+class PropIndexEntry(NamedTuple):
+    """A prop and the node whose ``props`` hold it (see :class:`PropIndex`)."""
+    owner: dict
+    prop: dict
+    trail: tuple        # nodes from the document root down to *owner*
+    position: int = 0   # index of *prop* in the owner's ``props``
+
+
+class PropIndex:
+    """
+    Index of a JSON document's ``props`` by namespace and name.
+
+    Maps ``(ns, name)`` — an absent ``ns`` is the OSCAL namespace — to every
+    prop with that name and the node (*owner*) whose ``props`` hold it, and
+    each owner to its own props grouped the same way.  Built lazily on the
+    first lookup with one walk of *root*.
+
+    The index can follow edits: :meth:`update` patches it after a value in
+    the document is replaced, inserted or removed, and :meth:`discard` drops
+    a removed subtree.  Lookups return entries in document order.
+
+    Passed as ``prop_index`` to :meth:`OSCALPath.query` /
+    :meth:`NativePath.query`, it answers a leading ``//name[prop[@name='v']]``
+    or ``//name[prop/@name='v']`` step (``props[name='v']`` for
+    :class:`NativePath`) from the owners of props named ``v``, without a
+    descendant walk.  Candidates are re-checked against every predicate of
+    the step, so results equal the walk's.
+
+    Parameters
+    ----------
+    root
+        The parsed JSON document (normally ``{"catalog": {...}}``).
     """
 
+    DEFAULT_NS = "http://csrc.nist.gov/ns/oscal"
     _SKIP_KEYS: frozenset[str] = frozenset({"$schema", "_unmodeled"})
 
-    def __init__(self, model_index: dict) -> None:
-        self.root_node: dict = model_index.get("nodes") or {}
-        self._defs: dict[str, dict] = {}
-        # xml_name → list of spec dicts
-        self._name_map: dict[str, list[dict]] = {}
-        self._build_index(self.root_node, frozenset())
+    def __init__(self, root) -> None:
+        self.root = root
+        # (ns, name) → entries; None until built
+        self._entries: dict[tuple[str, str], list[PropIndexEntry]] | None = None
+        # id(owner) → (owner, its props, {(ns, name) → entries of that owner})
+        self._owners: dict[int, tuple[dict, object, dict[tuple[str, str], list[PropIndexEntry]]]] = {}
+        # id(owner) → (path from the root to the owner or None until derived,
+        #              the edit count when it was last known to hold)
+        self._paths: dict[int, tuple[tuple | None, int]] = {}
+        # patches applied so far
+        self._edits = 0
+        # name → the namespaces it has been seen with
+        self._namespaces: dict[str, set[str]] = {}
+        # keys whose entries were appended out of document order
+        self._unsorted: set[tuple[str, str]] = set()
+
+    # -- lookups -------------------------------------------------------------
+
+    def lookup(self, name: str, ns: "str | None" = DEFAULT_NS, class_: "str | None" = None) -> list[PropIndexEntry]:
+        """
+        Return the entries for props named *name* in namespace *ns* (any
+        namespace when ``None``), optionally only those with ``class`` equal
+        to *class_*, in document order.
+        """
+        self._ensure()
+        entries = self._named(name) if ns is None else self._sorted((ns, name))
+        return [entry for entry in entries
+                if entry.prop["name"] == name and (class_ is None or entry.prop.get("class") == class_)]
 
-    # ------------------------------------------------------------------
-    # Index building
-    # ------------------------------------------------------------------
+    def owned(self, owner: dict, name: str, ns: str = DEFAULT_NS) -> list[dict] | None:
+        """
+        Return *owner*'s props named *name* in *ns*, in list order, or
+        ``None`` when *owner* is not a node of the indexed document.
+        """
+        self._ensure()
+        known = self._owners.get(id(owner))
+        if known is None or known[0] is not owner:
+            # Every owner holding props is indexed, so an unknown one is outside the document
+            return None if "props" in owner else []
+        return [entry.prop for entry in known[2].get((ns, name), ()) if entry.prop["name"] == name]
+
+    def _named(self, name: str) -> list[PropIndexEntry]:
+        """Entries for *name* in every namespace, in document order."""
+        keys = [(ns, name) for ns in self._namespaces.get(name, ())]
+        if len(keys) == 1:
+            return self._sorted(keys[0])
+        entries = [entry for key in keys for entry in self._sorted(key)]
+        order = _DocumentOrder()
+        entries.sort(key=lambda entry: self._rank(entry, order))
+        return entries
+
+    def _sorted(self, key: tuple[str, str]) -> list[PropIndexEntry]:
+        entries = self._entries.get(key, [])
+        if key in self._unsorted:
+            order = _DocumentOrder()
+            entries.sort(key=lambda entry: self._rank(entry, order))
+            self._unsorted.discard(key)
+        return entries
+
+    def _path(self, entry: PropIndexEntry, order: _DocumentOrder) -> tuple:
+        """Current path from the root to *entry*'s owner (see :class:`_DocumentOrder`)."""
+        path, checked = self._paths[id(entry.owner)]
+        if checked != self._edits:
+            path = order.path(entry.trail, path)
+            self._paths[id(entry.owner)] = (path, self._edits)
+        return path
+
+    def _rank(self, entry: PropIndexEntry, order: _DocumentOrder) -> tuple:
+        return order.position(entry.trail, self._path(entry, order)), entry.position
+
+    # -- maintenance ---------------------------------------------------------
+
+    def update(self, trail: tuple, old, new) -> None:
+        """
+        Patch the index after the value *old* held by the last node of *trail*
+        was replaced by *new* (either may be ``None`` for an insert or delete).
+
+        *trail* lists the nodes from the document root down to the dict or
+        list that was written to.
+        """
+        if self._entries is None:
+            return
+        self._edits += 1
+        if isinstance(old, (dict, list)):
+            self.discard(old)
+        # A write inside a props list, or to an owner's props, re-reads the owner
+        for depth in range(len(trail) - 1, -1, -1):
+            node = trail[depth]
+            if isinstance(node, dict) and (
+                    depth + 1 < len(trail) and node.get("props") is trail[depth + 1] or
+                    depth + 1 == len(trail) and (
+                        new is not None and node.get("props") is new or self._props_replaced(node))):
+                self._reindex(node, trail[:depth + 1])
+                return
+        if isinstance(new, (dict, list)):
+            self._add(new, trail + (new,), None)
+
+    def discard(self, subtree) -> None:
+        """Drop every owner found in *subtree*, which has been removed from the document."""
+        if self._entries is None:
+            return
+        self._edits += 1
+        dropped: set[int] = set()
+        keys: set[tuple[str, str]] = set()
+
+        def visit(val) -> None:
+            if isinstance(val, dict):
+                known = self._owners.get(id(val))
+                if known is not None and known[0] is val:
+                    del self._owners[id(val)]
+                    self._paths.pop(id(val), None)
+                    dropped.add(id(val))
+                    keys.update(known[2])
+                for v in val.values():
+                    if isinstance(v, (dict, list)):
+                        visit(v)
+            elif isinstance(val, list):
+                for item in val:
+                    if isinstance(item, (dict, list)):
+                        visit(item)
+
+        visit(subtree)
+        self._forget(dropped, keys)
+
+    def _ensure(self) -> None:
+        if self._entries is None:
+            self._entries = {}
+            self._add(self.root, (self.root,), (), in_order=True)
+
+    def _add(self, val, trail: tuple, path: tuple | None, in_order: bool = False) -> None:
+        """Index every owner in *val*, reached through *trail* (which ends at *val*) and *path*."""
+        skip_keys = self._SKIP_KEYS
+
+        def visit(val, trail: tuple, path: tuple | None) -> None:
+            if isinstance(val, dict):
+                if "props" in val:
+                    self._own(val, trail, path, in_order)
+                for k, v in val.items():
+                    if k not in skip_keys and isinstance(v, (dict, list)):
+                        visit(v, trail + (v,), _extended(path, k))
+            elif isinstance(val, list):
+                for i, item in enumerate(val):
+                    if isinstance(item, (dict, list)):
+                        visit(item, trail + (item,), _extended(path, i))
+
+        visit(val, trail, path)
+
+    def _own(self, owner: dict, trail: tuple, path: tuple | None, in_order: bool) -> None:
+        props = owner["props"]
+        groups: dict[tuple[str, str], list[PropIndexEntry]] = {}
+        for position, prop in enumerate(props if isinstance(props, list) else (props,)):
+            if not isinstance(prop, dict) or "name" not in prop:
+                continue
+            entry = PropIndexEntry(owner, prop, trail, position)
+            ns = prop.get("ns") or self.DEFAULT_NS
+            for name in self._names(prop["name"]):
+                key = (ns, name)
+                groups.setdefault(key, []).append(entry)
+                self._entries.setdefault(key, []).append(entry)
+                self._namespaces.setdefault(name, set()).add(ns)
+                if not in_order:
+                    self._unsorted.add(key)
+        self._owners[id(owner)] = (owner, props, groups)
+        self._paths[id(owner)] = (path, self._edits if path is not None else -1)
+
+    @staticmethod
+    def _names(name) -> list[str]:
+        # Keyed by string form, as ``=`` predicates compare; a list (invalid
+        # content) is also filed under each item so no predicate match is missed
+        names = [name if isinstance(name, str) else str(name)]
+        if isinstance(name, list):
+            names.extend(item if isinstance(item, str) else str(item) for item in name)
+        return list(dict.fromkeys(names))
+
+    def _props_replaced(self, node: dict) -> bool:
+        """True when *node*'s ``props`` is not the value the index last read for it."""
+        known = self._owners.get(id(node))
+        indexed = known[1] if known is not None and known[0] is node else None
+        return node.get("props") is not indexed
+
+    def _forget(self, dropped: set[int], keys) -> None:
+        """Remove the entries of the *dropped* owners (by id) from the lists of *keys*."""
+        for key in keys:
+            entries = self._entries.get(key)
+            if entries:
+                entries[:] = [entry for entry in entries if id(entry.owner) not in dropped]
+
+    def _reindex(self, owner: dict, trail: tuple) -> None:
+        recorded = self._paths.pop(id(owner), None)
+        known = self._owners.pop(id(owner), None)
+        if known is not None and known[0] is owner:
+            self._forget({id(owner)}, known[2])
+        if "props" in owner:
+            self._own(owner, trail, None, False)
+            if recorded is not None:
+                self._paths[id(owner)] = recorded
+
+
+class _PropLookup:
+    """
+    Planned rewrite of a leading ``//name[prop[@name='v']]`` step into a
+    :class:`PropIndex` lookup.
+
+    Candidates are the owners of props named ``v`` that sit where the
+    step's name can (*shapes*, as for :class:`_IdLookup`) and not beneath a
+    *skipped* key; they are ordered as the descendant walk would return
+    them and re-checked against every predicate of the step.
+    """
+    __slots__ = ("value", "shapes", "skipped", "tests")
+
+    def __init__(self, value: str, shapes: dict, skipped: frozenset[str], tests: tuple) -> None:
+        self.value = value
+        self.shapes = shapes
+        self.skipped = skipped
+        self.tests = tests
+
+    def select(self, index: PropIndex) -> list:
+        index._ensure()
+        order = _DocumentOrder()
+        # id(dict whose child step selects an owner) → (its position, beneath a skipped key)
+        parents: dict[int, tuple[tuple, bool]] = {}
+        hits = []
+        seen: set[int] = set()
+        for entry in index._named(self.value):
+            owner, trail = entry.owner, entry.trail
+            if id(owner) in seen or len(trail) < 2:
+                continue
+            seen.add(id(owner))
+            in_list = isinstance(trail[-2], list)
+            if in_list and (len(trail) < 3 or not isinstance(trail[-3], dict)):
+                continue
+            path = index._path(entry, order)
+            depth = len(path) - (2 if in_list else 1)
+            spec_rank = self.shapes.get((path[depth], in_list))
+            if spec_rank is None:
+                continue
+            parent = parents.get(id(trail[depth]))
+            if parent is None:
+                parent = parents[id(trail[depth])] = (order.position(trail[:depth + 1], path[:depth]),
+                                                      not self.skipped.isdisjoint(path[:depth]))
+            if parent[1]:
+                continue
+            hits.append((parent[0], spec_rank, path[-1] if in_list else 0, owner))
+        if len(hits) > 1:
+            hits.sort(key=operator.itemgetter(0, 1, 2))
+        tests = self.tests
+        return [hit[3] for hit in hits if all(t(hit[3]) for t in tests)]
+
+
+def _plan_fanout(steps: list[_PathStep], engine) -> tuple | None:
+    """
+    Return ``(filtered child selector, skip keys, target keys)`` for a leading
+    descendant step, else ``None``.  The selector matches nothing on a dict
+    holding none of the target keys.
+    """
+    if not steps or steps[0].axis != "descendant":
+        return None
+    first = steps[0]
+    child, skip_keys = engine._descendant_parts(first.name)
+    tests = tuple(_compile_pred(p, engine._compile_axis) for p in first.predicates)
+    return _filtered(child, tests, False), skip_keys, engine._target_keys(first.name)
+
+
+def _plan_id_lookup(steps: list[_PathStep], engine) -> _IdLookup | None:
+    """Plan an index lookup for a leading descendant step with an ``@id``/``@uuid`` equality predicate."""
+    if not steps or steps[0].axis != "descendant":
+        return None
+    first = steps[0]
+    for pred in first.predicates:
+        if pred.op != "=" or pred.negated or pred.rhs is None or len(pred.lhs) != 1:
+            continue
+        lhs = pred.lhs[0]
+        if lhs.axis in engine._ID_PREDICATE_AXES and lhs.name in IdIndex.KEYS and not lhs.predicates:
+            shapes = engine._index_shapes(first.name)
+            if shapes is None:
+                return None
+            tests = tuple(_compile_pred(p, engine._compile_axis) for p in first.predicates)
+            return _IdLookup(lhs.name, pred.rhs, shapes, engine._pruned_keys(first.name), tests)
+    return None
+
+
+def _plan_prop_lookup(steps: list[_PathStep], engine) -> _PropLookup | None:
+    """Plan a prop index lookup for a leading descendant step with a ``prop[@name='v']`` predicate."""
+    if not steps or steps[0].axis != "descendant":
+        return None
+    prop_step = engine._prop_step()
+    if prop_step is None:
+        return None
+    first = steps[0]
+    for pred in first.predicates:
+        value = _prop_name_value(pred, prop_step, engine._ID_PREDICATE_AXES)
+        if value is not None:
+            shapes = engine._index_shapes(first.name)
+            if shapes is None:
+                return None
+            # Every candidate owns a prop named ``value``; a predicate testing only that is implied
+            implied = pred if pred.op or len(pred.lhs[0].predicates) == 1 else None
+            tests = tuple(_compile_pred(p, engine._compile_axis) for p in first.predicates if p is not implied)
+            return _PropLookup(value, shapes, engine._SKIP_KEYS | engine._pruned_keys(first.name), tests)
+    return None
+
+
+def _prop_name_value(pred: _PathPred, prop_step: str, flag_axes: frozenset[str]) -> str | None:
+    """Return ``v`` when *pred* requires a child prop named ``v`` (``prop[@name='v']`` or ``prop/@name='v'``)."""
+    lhs = pred.lhs
+    if pred.negated or not lhs or lhs[0].axis != "child" or lhs[0].name != prop_step:
+        return None
+
+    def reads_name(step: _PathStep) -> bool:
+        return step.axis in flag_axes and step.name == "name" and not step.predicates
+
+    if not pred.op and len(lhs) == 1:
+        for inner in lhs[0].predicates:
+            if (inner.op == "=" and not inner.negated and inner.rhs is not None
+                    and len(inner.lhs) == 1 and reads_name(inner.lhs[0])):
+                return inner.rhs
+    elif pred.op == "=" and pred.rhs is not None and len(lhs) == 2 and not lhs[0].predicates \
+            and reads_name(lhs[1]):
+        return pred.rhs
+    return None
+
+
+def _select_self(val):
+    return (val,)
+
+
+def _select_nothing(val):
+    return ()
+
+
+def _key_selector(name: str):
+    """Select ``val[name]``, iterating the items when it is a list."""
+    def select(val):
+        if not isinstance(val, dict) or name not in val:
+            return ()
+        raw = val[name]
+        return raw if isinstance(raw, list) else (raw,)
+    return select
+
+
+def _attribute_selector(name: str):
+    def select(val):
+        if isinstance(val, dict) and name in val:
+            return (val[name],)
+        return ()
+    return select
+
+
+def _wildcard_selector(skip_keys: frozenset[str]):
+    """Select all direct children (values of a dict, or items of a list)."""
+    def select(val):
+        if isinstance(val, dict):
+            return [v for k, v in val.items() if k not in skip_keys]
+        if isinstance(val, list):
+            return val
+        return ()
+    return select
+
+
+def _descendant_selector(child, skip_keys: frozenset[str], lazy: bool = False):
+    """Apply the *child* selector at every depth, in document order (as a generator when *lazy*)."""
+    if lazy:
+        def walk(val):
+            yield from child(val)
+            if isinstance(val, dict):
+                for k, v in val.items():
+                    if k not in skip_keys and isinstance(v, (dict, list)):
+                        yield from walk(v)
+            elif isinstance(val, list):
+                for item in val:
+                    if isinstance(item, (dict, list)):
+                        yield from walk(item)
+        return walk
+
+    def collect(val, out: list) -> None:
+        out.extend(child(val))
+        if isinstance(val, dict):
+            for k, v in val.items():
+                if k not in skip_keys and isinstance(v, (dict, list)):
+                    collect(v, out)
+        elif isinstance(val, list):
+            for item in val:
+                if isinstance(item, (dict, list)):
+                    collect(item, out)
+
+    def select(val) -> list:
+        out: list = []
+        collect(val, out)
+        return out
+
+    return select
+
+
+def _container_extractor(container: str, key_flag: str):
+    """
+    Return a function selecting item(s) from a raw JSON value according to the
+    metaschema container type.
+
+    For BY_KEY groups the dict key is re-injected as a field (using the
+    ``json-key`` flag name) so that predicates like ``[@param-id='x']``
+    work even though the key was extracted from the item in JSON.
+    """
+    if container == "ARRAY":
+        return lambda raw: raw if isinstance(raw, list) else ()
+
+    if container == "BY_KEY":
+        def by_key(raw) -> list:
+            if not isinstance(raw, dict):
+                return []
+            items = []
+            for k, v in raw.items():
+                if isinstance(v, dict):
+                    # Re-inject the key so attribute predicates can match it
+                    items.append({key_flag: k, **v} if key_flag else v)
+                else:
+                    items.append({key_flag: k, "value": v} if key_flag else {"value": v})
+            return items
+        return by_key
 
-    def _build_index(self, node: dict | None, visited: frozenset) -> None:
+    if container == "SINGLETON_OR_ARRAY":
+        return lambda raw: raw if isinstance(raw, list) else (() if raw is None else (raw,))
+
+    # OBJECT or SCALAR
+    return lambda raw: () if raw is None else (raw,)
+
+
+# ---------------------------------------------------------------------------
+# OSCALPath – XPath-like query engine for OSCAL JSON
+# ---------------------------------------------------------------------------
+
+class _PathIndex:
+    """
+    XML element name → JSON navigation specs for one model index.
+
+    Built once per metaschema index and shared by every :class:`OSCALPath`
+    over it; also the scope under which their compiled queries are cached.
+
+    Also answers which JSON keys a descendant search for a name can skip:
+    a reachability table records, for every JSON key in the model, the keys
+    that can occur anywhere beneath a value stored under it.
+    """
+
+    def __init__(self, model_index: dict) -> None:
+        self.source = model_index.get("nodes")
+        self.root_node: dict = self.source or {}
+        self.defs: dict[str, dict] = {}
+        # xml_name → list of spec dicts
+        self.name_map: dict[str, list[dict]] = {}
+        self._build(self.root_node, frozenset())
+        # json key → keys reachable beneath it (None: unbounded); built on first use
+        self._reach: dict[str, frozenset[str] | None] | None = None
+        # xml name → json keys a descendant search for it need not enter
+        self._pruned: dict[str, frozenset[str]] = {}
+
+    def _build(self, node: dict | None, visited: frozenset) -> None:
         if not node:
             return
         stype = node.get("structure-type", "")
@@ -1243,8 +3163,8 @@ class OSCALPath:
             return
 
         name = node.get("name", "")
-        if name and stype in ("assembly", "field") and name not in self._defs:
-            self._defs[name] = node
+        if name and stype in ("assembly", "field") and name not in self.defs:
+            self.defs[name] = node
 
         node_id = id(node)
         if node_id in visited:
@@ -1254,7 +3174,7 @@ class OSCALPath:
         xml_name = node.get("use-name") or name
         if xml_name and stype not in ("", "choice", "any"):
             spec = self._make_spec(xml_name, node)
-            bucket = self._name_map.setdefault(xml_name, [])
+            bucket = self.name_map.setdefault(xml_name, [])
             if not any(s["json_key"] == spec["json_key"] for s in bucket):
                 bucket.append(spec)
 
@@ -1265,20 +3185,21 @@ class OSCALPath:
                 # Recurse into each alternative — they all live at the same level
                 for alt in child.get("children") or []:
                     if alt:
-                        self._build_index(self._resolve_def(alt), visited)
+                        self._build(self._resolve_def(alt), visited)
             else:
-                self._build_index(self._resolve_def(child), visited)
+                self._build(self._resolve_def(child), visited)
 
         for flag in [c for c in node.get("children") or [] if c and c.get("structure-type") == "flag"]:
             fn = flag.get("use-name") or flag.get("name", "")
             if fn:
-                bucket = self._name_map.setdefault(fn, [])
+                bucket = self.name_map.setdefault(fn, [])
                 spec = {"xml_name": fn, "json_key": fn, "container": "SCALAR",
                         "key_flag": "", "node": flag}
                 if not any(s["json_key"] == fn for s in bucket):
                     bucket.append(spec)
 
-    def _make_spec(self, xml_name: str, node: dict) -> dict:
+    @staticmethod
+    def _make_spec(xml_name: str, node: dict) -> dict:
         group_as   = node.get("group-as") or ""
         json_key   = group_as or xml_name
         group_json = node.get("group-as-in-json") or ""
@@ -1307,209 +3228,333 @@ class OSCALPath:
 
     def _resolve_def(self, node: dict) -> dict:
         if node.get("structure-type") == "recursive":
-            return self._defs.get(node.get("name", ""), node)
+            return self.defs.get(node.get("name", ""), node)
         return node
 
     # ------------------------------------------------------------------
-    # Public API
+    # Reachability
     # ------------------------------------------------------------------
 
-    def query(self, path: str, data) -> list:
+    def pruned_keys(self, name: str) -> frozenset[str]:
         """
-        Return a list of all JSON values matching *path* in *data*.
+        Return the JSON keys whose values cannot contain element *name* at
+        any depth, so a ``//name`` search need not descend into them.
 
-        *data* is normally the full parsed OSCAL JSON document
-        (``{"catalog": {...}}``) for absolute paths, or any sub-dict for
-        relative paths.  Scalar results (strings, numbers) are returned as-is.
+        Empty for names the index does not know (they are looked up by raw
+        key).  Keys from schema-invalid placements are pruned too: content
+        the metaschema does not allow under a key is not searched.
         """
-        steps = _opath_parse(path)
-        return self._eval_steps(steps, [data])
+        pruned = self._pruned.get(name)
+        if pruned is None:
+            specs = self.name_map.get(name)
+            if not specs:
+                pruned = frozenset()
+            else:
+                targets = {spec["json_key"] for spec in specs}
+                pruned = frozenset(key for key, reach in self._reachability().items()
+                                   if reach is not None and targets.isdisjoint(reach))
+            self._pruned[name] = pruned
+        return pruned
+
+    def _reachability(self) -> dict[str, frozenset[str] | None]:
+        if self._reach is None:
+            self._reach = self._build_reach()
+        return self._reach
+
+    def _build_reach(self) -> dict[str, frozenset[str] | None]:
+        # Direct edges: json key → keys that can appear in a value stored under
+        # it, unioned over every definition using that key.  _OPEN marks data-
+        # dependent keys (BY_KEY groups, json-value-key-flag fields, "any").
+        edges: dict[str, set[str]] = {}
+        seen: set[int] = set()
+        stack = [self.root_node]
+        while stack:
+            node = stack.pop()
+            if id(node) in seen:
+                continue
+            seen.add(id(node))
+            out = edges.setdefault(self._json_key(node), set())
+            if node.get("group-as-in-json") == "BY_KEY":
+                out.add(_OPEN)
+            if node.get("structure-type") == "field":
+                out.add(_OPEN if node.get("json-value-key-flag") else node.get("json-value-key") or "STRVALUE")
+            for child in self._member_nodes(node):
+                stype = child.get("structure-type", "")
+                if stype == "recursive":
+                    if child.get("path", "").rpartition("/")[2].startswith("@"):
+                        # A flag sharing its name with an ancestor definition
+                        stype = "flag"
+                    else:
+                        child = self._resolve_def(child)
+                        stype = child.get("structure-type", "")
+                if stype in ("any", "recursive"):
+                    out.add(_OPEN)
+                elif stype == "flag":
+                    out.add(child.get("use-name") or child.get("name", ""))
+                elif stype in ("assembly", "field"):
+                    out.add(self._json_key(child))
+                    stack.append(child)
+
+        # Transitive closure; small graphs (a few hundred keys), so a DFS per key
+        reach: dict[str, frozenset[str] | None] = {}
+        for key in edges:
+            found: set[str] = set()
+            todo = list(edges[key])
+            while todo:
+                k = todo.pop()
+                if k in found:
+                    continue
+                found.add(k)
+                todo.extend(edges.get(k, ()))
+            reach[key] = None if _OPEN in found else frozenset(found)
+        return reach
+
+    @staticmethod
+    def _member_nodes(node: dict):
+        """Yield the child nodes of *node*, flattening choices."""
+        for child in node.get("children") or []:
+            if not child:
+                continue
+            if child.get("structure-type") == "choice":
+                yield from (alt for alt in child.get("children") or [] if alt)
+            else:
+                yield child
 
-    def query_one(self, path: str, data, default=None):
-        """Return the first matching value, or *default* when nothing matches."""
-        results = self.query(path, data)
-        return results[0] if results else default
+    @staticmethod
+    def _json_key(node: dict) -> str:
+        return node.get("group-as") or node.get("use-name") or node.get("name", "")
 
-    # ------------------------------------------------------------------
-    # Step evaluation
-    # ------------------------------------------------------------------
 
-    def _eval_steps(self, steps: list[_PathStep], ctx: list) -> list:
-        for step in steps:
-            if not ctx:
-                break
-            ctx = self._eval_step(step, ctx)
-        return ctx
+# Reachability marker for JSON keys that depend on the data, not the schema
+_OPEN = "\0open"
 
-    def _eval_step(self, step: _PathStep, ctx: list) -> list:
-        axis, name, preds = step.axis, step.name, step.predicates
-        out: list = []
 
-        for val in ctx:
-            if axis == "self":
-                cands = [val]
-            elif axis == "child":
-                cands = list(self._child(val, name))
-            elif axis == "descendant":
-                cands = list(self._descendants(val, name))
-            elif axis == "attribute":
-                cands = list(self._attribute(val, name))
-            elif axis == "wildcard":
-                cands = list(self._wildcard(val))
-            elif axis == "text":
-                cands = list(self._text(val))
-            elif axis == "name_func":
-                # name() on a top-level dict: return the root model key
-                if isinstance(val, dict):
-                    cands = [k for k in val if not k.startswith("$") and not k.startswith("_")]
-                else:
-                    cands = []
-            else:
-                cands = []
+# (oscal_version, oscal_model) → path index built for that metaschema index
+_path_index_cache: dict[tuple[str, str], _PathIndex] = {}
 
-            # Apply predicates (all must hold — AND semantics)
-            for pred in preds:
-                cands = [c for c in cands if self._eval_pred(pred, c)]
 
-            out.extend(cands)
+def _path_index(model_index: dict) -> _PathIndex:
+    """Return the shared path index for *model_index*, rebuilding it if the index changed."""
+    key = (model_index.get("oscal_version", ""), model_index.get("oscal_model", ""))
+    index = _path_index_cache.get(key)
+    if index is None or index.source is not model_index.get("nodes"):
+        index = _PathIndex(model_index)
+        _path_index_cache[key] = index
+    return index
 
-        return out
 
-    # ------------------------------------------------------------------
-    # Navigation primitives
-    # ------------------------------------------------------------------
+class OSCALPath:
+    """
+    XPath-like query engine for OSCAL JSON data.
 
-    def _child(self, val, name: str):
-        """Yield JSON values that are direct children named *name* in XML terms."""
-        if not isinstance(val, dict):
-            return
-        specs = self._name_map.get(name)
-        if specs:
-            for spec in specs:
-                jk = spec["json_key"]
-                if jk in val:
-                    yield from self._extract(val[jk], spec)
-        else:
-            # No index entry — try the key directly (flags, $schema, etc.)
-            if name in val:
-                raw = val[name]
-                if isinstance(raw, list):
-                    yield from raw
-                else:
-                    yield raw
+    Uses the metaschema index to translate XML path steps into the correct JSON
+    navigation — resolving element names to their JSON keys, and handling the
+    different container types (ARRAY, BY_KEY, SINGLETON_OR_ARRAY, scalar).
 
-    def _descendants(self, val, name: str):
-        """Yield all values at any depth that match XML element name *name*."""
-        # Direct children first
-        yield from self._child(val, name)
-        # Recurse
-        if isinstance(val, dict):
-            for k, v in val.items():
-                if k in self._SKIP_KEYS:
-                    continue
-                if isinstance(v, (dict, list)):
-                    yield from self._descendants(v, name)
-        elif isinstance(val, list):
-            for item in val:
-                if isinstance(item, (dict, list)):
-                    yield from self._descendants(item, name)
+    Paths are compiled once and cached process-wide (see
+    :func:`query_cache_info`); instances built over the same model index share
+    both the name index and the compiled queries.
 
-    def _attribute(self, val, name: str):
-        """Yield the value of attribute/flag *name* from *val*."""
-        if isinstance(val, dict) and name in val:
-            yield val[name]
+    Parameters
+    ----------
+    model_index
+        Model-specific metaschema index dict (the value at
+        ``full_index["oscal_models"][model_name]``).  The same dict accepted
+        by :class:`OSCALConverter`.
 
-    def _wildcard(self, val):
-        """Yield all direct children of *val*."""
-        if isinstance(val, dict):
-            for k, v in val.items():
-                if k not in self._SKIP_KEYS:
-                    yield v
-        elif isinstance(val, list):
-            yield from val
+    Examples
+    --------
+    ::
 
-    def _text(self, val):
-        """Yield the scalar text/value of *val*."""
-        if isinstance(val, (str, int, float, bool)):
-            yield val
-        elif isinstance(val, dict):
-            # Fields with flags store their text under STRVALUE
-            for key in ("STRVALUE", "value"):
-                if key in val:
-                    yield val[key]
-                    return
+        path = OSCALPath(catalog_model_index)
+
+        # Descendant search with attribute predicate
+        controls = path.query("//control[@id='ac-2.2']", doc)
 
-    def _extract(self, raw, spec: dict):
+        # Absolute path
+        title = path.query_one("/*/metadata/title", doc)
+
+        # Relative path from a sub-dict
+        ver = path.query_one("oscal-version", doc["catalog"]["metadata"])
+
+        # Path expression inside a predicate
+        labelled = path.query("//part[prop[@name='label']]", doc)
+
+        # Multiple predicates
+        specific = path.query("//param[@id='ac-1_prm_1'][select]", doc)
+    """
+
+    _SKIP_KEYS: frozenset[str] = frozenset({"$schema", "_unmodeled"})
+
+    def __init__(self, model_index: dict) -> None:
+        self._index = _path_index(model_index)
+        self.root_node: dict = self._index.root_node
+        self._defs: dict[str, dict] = self._index.defs
+        # xml_name → list of spec dicts
+        self._name_map: dict[str, list[dict]] = self._index.name_map
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def query(self, path: str, data, id_index: IdIndex | None = None,
+              prop_index: PropIndex | None = None) -> list:
         """
-        Yield item(s) from a raw JSON value according to the metaschema container
-        type recorded in *spec*.
+        Return a list of all JSON values matching *path* in *data*.
+
+        *data* is normally the full parsed OSCAL JSON document
+        (``{"catalog": {...}}``) for absolute paths, or any sub-dict for
+        relative paths.  Scalar results (strings, numbers) are returned as-is.
 
-        For BY_KEY groups the dict key is re-injected as a field (using the
-        ``json-key`` flag name) so that predicates like ``[@param-id='x']``
-        work even though the key was extracted from the item in JSON.
+        *id_index*, an :class:`IdIndex` over *data*, answers a leading
+        ``//name[@id='v']`` / ``//name[@uuid='v']`` step without walking the
+        document; *prop_index*, a :class:`PropIndex` over *data*, does the
+        same for ``//name[prop[@name='v']]``.  Either is ignored when built
+        over a different root.
         """
-        container = spec["container"]
-        key_flag  = spec.get("key_flag", "")
+        return _evaluate(self._compiled(path), data, id_index, prop_index)
 
-        if container == "ARRAY":
-            if isinstance(raw, list):
-                yield from raw
+    def iter_query(self, path: str, data, id_index: IdIndex | None = None,
+                   prop_index: PropIndex | None = None) -> Iterator:
+        """
+        Yield the values matching *path* in *data* one at a time, in the same
+        order as :meth:`query`.
 
-        elif container == "BY_KEY":
-            if isinstance(raw, dict):
-                for k, v in raw.items():
-                    if isinstance(v, dict):
-                        # Re-inject the key so attribute predicates can match it
-                        yield {key_flag: k, **v} if key_flag else v
-                    else:
-                        yield {key_flag: k, "value": v} if key_flag else {"value": v}
+        Matches are produced lazily, so stopping early (``next()``,
+        ``itertools.islice``) skips the rest of the search.  *data* must not
+        be modified while the iterator is in use.
+        """
+        return _iterate(self._compiled(path), data, id_index, prop_index)
 
-        elif container == "SINGLETON_OR_ARRAY":
-            if isinstance(raw, list):
-                yield from raw
-            elif raw is not None:
-                yield raw
+    def query_one(self, path: str, data, default=None, id_index: IdIndex | None = None,
+                  prop_index: PropIndex | None = None):
+        """Return the first matching value, or *default* when nothing matches; stops at the first match."""
+        return next(self.iter_query(path, data, id_index, prop_index), default)
+
+    def query_many(self, paths: dict[str, str], data, id_index: IdIndex | None = None,
+                   prop_index: PropIndex | None = None) -> dict[str, list]:
+        """
+        Evaluate several paths against *data* together, returning
+        ``{name: results}`` for a ``{name: path}`` mapping.
 
-        else:  # OBJECT or SCALAR
-            if raw is not None:
-                yield raw
+        Each result list equals ``query(path, data, id_index, prop_index)``.
+        All paths that start with ``//`` are answered from one shared walk of
+        *data* instead of one walk each.
+        """
+        return _evaluate_many(self, paths, data, id_index, prop_index)
 
     # ------------------------------------------------------------------
-    # Predicate evaluation
+    # Compilation
     # ------------------------------------------------------------------
 
-    def _eval_pred(self, pred: _PathPred, val) -> bool:
-        lhs_vals = self._eval_steps(pred.lhs, [val])
-
-        if pred.op:
-            result = any(self._compare(v, pred.op, pred.rhs) for v in lhs_vals)
-        else:
-            result = bool(lhs_vals)  # existence check
+    # Predicate steps that read a flag, for the id/uuid and prop index planners
+    _ID_PREDICATE_AXES: frozenset[str] = frozenset({"attribute"})
+
+    def _compiled(self, path: str) -> _CompiledQuery:
+        return _compiled_query(self._index, path, self)
+
+    def _prop_step(self) -> str | None:
+        """Step name selecting props, or ``None`` when ``prop`` is not read from ``props`` only."""
+        specs = self._name_map.get("prop")
+        if specs and all(spec["json_key"] == "props" for spec in specs):
+            return "prop"
+        return None
+
+    def _compile_axis(self, axis: str, name: str, lazy: bool = False):
+        """Return the selector for one step's axis and name (predicates excluded)."""
+        if axis == "self":
+            return _select_self
+        if axis == "child":
+            return self._child_selector(name)
+        if axis == "descendant":
+            return _descendant_selector(*self._descendant_parts(name), lazy)
+        if axis == "attribute":
+            return _attribute_selector(name)
+        if axis == "wildcard":
+            return _wildcard_selector(self._SKIP_KEYS)
+        if axis == "text":
+            return self._select_text
+        if axis == "name_func":
+            return self._select_model_keys
+        return _select_nothing
+
+    def _child_selector(self, name: str):
+        """Select JSON values that are direct children named *name* in XML terms."""
+        specs = self._name_map.get(name)
+        if not specs:
+            # No index entry — try the key directly (flags, $schema, etc.)
+            return _key_selector(name)
+        getters = tuple((spec["json_key"], _container_extractor(spec["container"], spec.get("key_flag", "")))
+                        for spec in specs)
+        if len(getters) == 1:
+            ((json_key, extract),) = getters
+
+            def select_one(val):
+                if isinstance(val, dict) and json_key in val:
+                    return extract(val[json_key])
+                return ()
+            return select_one
+
+        def select(val):
+            if not isinstance(val, dict):
+                return ()
+            out: list = []
+            for json_key, extract in getters:
+                if json_key in val:
+                    out.extend(extract(val[json_key]))
+            return out
+        return select
+
+    def _descendant_parts(self, name: str) -> tuple:
+        """The child selector a ``//name`` search applies at every depth, and the keys it skips."""
+        return self._child_selector(name), self._SKIP_KEYS | self._pruned_keys(name)
+
+    def _pruned_keys(self, name: str) -> frozenset[str]:
+        """JSON keys a ``//name`` search does not enter (see :meth:`_PathIndex.pruned_keys`)."""
+        return self._index.pruned_keys(name)
+
+    def _target_keys(self, name: str) -> frozenset[str]:
+        """JSON keys the child selector for *name* reads."""
+        specs = self._name_map.get(name)
+        return frozenset(spec["json_key"] for spec in specs) if specs else frozenset({name})
 
-        return not result if pred.negated else result
+    def _index_shapes(self, name: str) -> dict | None:
+        """
+        Return where the child axis finds *name*, as ``{(json_key, in_list): spec rank}``,
+        or ``None`` when a BY_KEY group synthesizes its items (not indexable).
+        """
+        specs = self._name_map.get(name)
+        if not specs:
+            return {(name, True): 0, (name, False): 0}
+        shapes: dict = {}
+        for rank, spec in enumerate(specs):
+            container, json_key = spec["container"], spec["json_key"]
+            if container == "BY_KEY":
+                return None
+            if container in ("ARRAY", "SINGLETON_OR_ARRAY"):
+                shapes[(json_key, True)] = rank
+            if container != "ARRAY":
+                shapes[(json_key, False)] = rank
+        return shapes
+
+    @staticmethod
+    def _select_text(val):
+        """Select the scalar text/value of *val*."""
+        if isinstance(val, (str, int, float, bool)):
+            return (val,)
+        if isinstance(val, dict):
+            # Fields with flags store their text under STRVALUE
+            for key in ("STRVALUE", "value"):
+                if key in val:
+                    return (val[key],)
+        return ()
 
-    def _compare(self, val, op: str, rhs: "str | None") -> bool:
-        if rhs is None:
-            return False
-        s = str(val) if not isinstance(val, str) else val
-        if op == "=":
-            return s == rhs
-        if op == "!=":
-            return s != rhs
-        try:
-            a: float | str = float(s)
-            b: float | str = float(rhs)
-        except (ValueError, TypeError):
-            a, b = s, rhs
-        if op == "<":
-            return a < b
-        if op == ">":
-            return a > b
-        if op == "<=":
-            return a <= b
-        if op == ">=":
-            return a >= b
-        return False
+    @staticmethod
+    def _select_model_keys(val):
+        # name() on a top-level dict: return the root model key
+        if isinstance(val, dict):
+            return [k for k in val if not k.startswith("$") and not k.startswith("_")]
+        return ()
 
     # ------------------------------------------------------------------
     # Factory
@@ -1552,7 +3597,8 @@ class NativePath:
     and checks each prop item.
 
     No instantiation arguments are needed; a module-level singleton
-    :data:`native_path` is provided for convenience.
+    :data:`native_path` is provided for convenience.  Compiled paths are
+    cached process-wide, as for :class:`OSCALPath`.
 
     Examples::
 
@@ -1587,149 +3633,94 @@ class NativePath:
     # Public API
     # ------------------------------------------------------------------
 
-    def query(self, path: str, data) -> list:
+    def query(self, path: str, data, id_index: IdIndex | None = None,
+              prop_index: PropIndex | None = None) -> list:
         """
         Return a list of all values matching *path* in *data*.
 
         *data* may be the full document dict (for absolute paths starting
-        with ``/``) or any sub-dict / value (for relative paths).
+        with ``/``) or any sub-dict / value (for relative paths).  *id_index*
+        and *prop_index* are used as in :meth:`OSCALPath.query`; the prop
+        index answers ``//name[props[name='v']]``.
         """
-        steps = _opath_parse(path)
-        return self._eval_steps(steps, [data])
-
-    def query_one(self, path: str, data, default=None):
-        """Return the first matching value, or *default* when nothing matches."""
-        results = self.query(path, data)
-        return results[0] if results else default
-
-    # ------------------------------------------------------------------
-    # Step evaluation
-    # ------------------------------------------------------------------
+        return _evaluate(self._compiled(path), data, id_index, prop_index)
 
-    def _eval_steps(self, steps: list[_PathStep], ctx: list) -> list:
-        for step in steps:
-            if not ctx:
-                break
-            ctx = self._eval_step(step, ctx)
-        return ctx
+    def iter_query(self, path: str, data, id_index: IdIndex | None = None,
+                   prop_index: PropIndex | None = None) -> Iterator:
+        """Yield the values matching *path* lazily, as :meth:`OSCALPath.iter_query` does."""
+        return _iterate(self._compiled(path), data, id_index, prop_index)
 
-    def _eval_step(self, step: _PathStep, ctx: list) -> list:
-        axis, name, preds = step.axis, step.name, step.predicates
-        out: list = []
+    def query_one(self, path: str, data, default=None, id_index: IdIndex | None = None,
+                  prop_index: PropIndex | None = None):
+        """Return the first matching value, or *default* when nothing matches; stops at the first match."""
+        return next(self.iter_query(path, data, id_index, prop_index), default)
 
-        for val in ctx:
-            if axis == "self":
-                cands = [val]
-            elif axis in ("child", "attribute"):
-                # @ prefix is a synonym for a bare key in JSON
-                cands = list(self._child(val, name))
-            elif axis == "descendant":
-                cands = list(self._descendants(val, name))
-            elif axis == "wildcard":
-                cands = list(self._wildcard(val))
-            elif axis == "text":
-                cands = list(self._text(val))
-            elif axis == "name_func":
-                if isinstance(val, dict):
-                    cands = [k for k in val if not k.startswith("$")]
-                else:
-                    cands = []
-            else:
-                cands = []
-
-            for pred in preds:
-                cands = [c for c in cands if self._eval_pred(pred, c)]
-
-            out.extend(cands)
-
-        return out
+    def query_many(self, paths: dict[str, str], data, id_index: IdIndex | None = None,
+                   prop_index: PropIndex | None = None) -> dict[str, list]:
+        """Evaluate ``{name: path}`` together in one shared walk, as :meth:`OSCALPath.query_many` does."""
+        return _evaluate_many(self, paths, data, id_index, prop_index)
 
     # ------------------------------------------------------------------
-    # Navigation primitives
+    # Compilation
     # ------------------------------------------------------------------
 
-    def _child(self, val, name: str):
-        """
-        Navigate to key *name* in *val*.  When the value is a list, yield
-        each item so the next step applies to items individually.
-        """
-        if not isinstance(val, dict):
-            return
-        if name not in val:
-            return
-        raw = val[name]
-        if isinstance(raw, list):
-            yield from raw
-        else:
-            yield raw
-
-    def _descendants(self, val, name: str):
-        """
-        Recursively find key *name* at any depth, auto-iterating arrays
-        encountered along the way.
-        """
-        yield from self._child(val, name)
-
-        if isinstance(val, dict):
-            for k, v in val.items():
-                if k in self._SKIP_KEYS:
-                    continue
-                if isinstance(v, (dict, list)):
-                    yield from self._descendants(v, name)
-        elif isinstance(val, list):
-            for item in val:
-                if isinstance(item, (dict, list)):
-                    yield from self._descendants(item, name)
-
-    def _wildcard(self, val):
-        """Yield all direct children (values of a dict, or items of a list)."""
-        if isinstance(val, dict):
-            for k, v in val.items():
-                if k not in self._SKIP_KEYS:
-                    yield v
-        elif isinstance(val, list):
-            yield from val
-
-    def _text(self, val):
-        """Yield *val* itself when it is a scalar."""
+    # ``[id='v']`` and ``[@id='v']`` both read the key
+    _ID_PREDICATE_AXES: frozenset[str] = frozenset({"child", "attribute"})
+
+    def _compiled(self, path: str) -> _CompiledQuery:
+        return _compiled_query(type(self), path, self)
+
+    @staticmethod
+    def _prop_step() -> str:
+        return "props"
+
+    @staticmethod
+    def _index_shapes(name: str) -> dict:
+        # Arrays are iterated transparently: the key matches directly or via its items
+        return {(name, True): 0, (name, False): 0}
+
+    def _descendant_parts(self, name: str) -> tuple:
+        return _key_selector(name), self._SKIP_KEYS
+
+    @staticmethod
+    def _pruned_keys(name: str) -> frozenset[str]:
+        # No schema, so no descendant search is pruned
+        return frozenset()
+
+    @staticmethod
+    def _target_keys(name: str) -> frozenset[str]:
+        return frozenset({name})
+
+    def _compile_axis(self, axis: str, name: str, lazy: bool = False):
+        """Return the selector for one step's axis and name (predicates excluded)."""
+        if axis == "self":
+            return _select_self
+        if axis in ("child", "attribute"):
+            # @ prefix is a synonym for a bare key in JSON; arrays are
+            # iterated so the next step applies to items individually
+            return _key_selector(name)
+        if axis == "descendant":
+            return _descendant_selector(*self._descendant_parts(name), lazy)
+        if axis == "wildcard":
+            return _wildcard_selector(self._SKIP_KEYS)
+        if axis == "text":
+            return self._select_text
+        if axis == "name_func":
+            return self._select_keys
+        return _select_nothing
+
+    @staticmethod
+    def _select_text(val):
+        """Select *val* itself when it is a scalar."""
         if isinstance(val, (str, int, float, bool)):
-            yield val
-
-    # ------------------------------------------------------------------
-    # Predicate evaluation
-    # ------------------------------------------------------------------
-
-    def _eval_pred(self, pred: _PathPred, val) -> bool:
-        lhs_vals = self._eval_steps(pred.lhs, [val])
-        if pred.op:
-            result = any(self._compare(v, pred.op, pred.rhs) for v in lhs_vals)
-        else:
-            result = bool(lhs_vals)  # existence check
-        return not result if pred.negated else result
-
-    def _compare(self, val, op: str, rhs: "str | None") -> bool:
-        if rhs is None:
-            return False
-        s = str(val) if not isinstance(val, str) else val
-        if op == "=":
-            return s == rhs
-        if op == "!=":
-            return s != rhs
-        try:
-            a: float | str = float(s)
-            b: float | str = float(rhs)
-        except (ValueError, TypeError):
-            a, b = s, rhs
-        if op == "<":
-            return a < b
-        if op == ">":
-            return a > b
-        if op == "<=":
-            return a <= b
-        if op == ">=":
-            return a >= b
-        return False
+            return (val,)
+        return ()
 
+    @staticmethod
+    def _select_keys(val):
+        if isinstance(val, dict):
+            return [k for k in val if not k.startswith("$")]
+        return ()
 
 #: Module-level singleton — use directly without instantiating.
 native_path = NativePath()
@@ -1886,7 +3877,12 @@ if __name__ == "__main__":
         )
         sys.exit(1)
 
-    result = conv.xml_to_json(content) if src_fmt == "xml" else conv.json_to_xml(content)
+    if src_fmt == "xml":
+        # Stream the conversion so very large XML sources never need a full tree.
+        body = conv.iterparse_to_dict(str(src_path))
+        result = json.dumps(body, indent=2, ensure_ascii=False) if body is not None else None
+    else:
+        result = conv.json_to_xml(content)
 
     if result is None:
         print("ERROR: conversion failed — check logs for details", file=sys.stderr)
@@ -255,6 +255,25 @@ class Workspace:
         """Return True when ``doc`` is write-locked by any actor."""
         return id(doc) in self._locks
 
+    # -- queries ---------------------------------------------------------------
+    def federated_query(self, path: str) -> list[dict]:
+        """Run a path query across every root document and its READY imports.
+
+        See :meth:`OSCAL.federated_query`. A document shared by several roots (the
+        same catalog imported twice) is queried once.
+
+        Args:
+            path (str, required): Path expression using OSCAL XML element names.
+
+        Returns:
+            list[dict]: ``{"element", "object_uuid", "href"}`` for every match.
+        """
+        seen: set = set()
+        hits = []
+        for root in self._documents.values():
+            hits.extend(root.federated_query(path, seen))
+        return hits
+
     # -- persistence ----------------------------------------------------------
     def _collect_documents(self) -> dict:
         """Return {id(obj): obj} for every document reachable from the roots."""
@@ -415,6 +434,7 @@ class Workspace:
                     "failure":       None,
                 })
             obj._import_tree = None
+            obj._imports_changed()
 
         # Register documents and record roots.
         for row in rows:
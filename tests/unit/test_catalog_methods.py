@@ -13,6 +13,7 @@ import tempfile
 import pytest
 
 from oscal import Catalog, Profile
+from oscal.oscal_content import get_props
 from oscal.oscal_controls import _find_part, _find_control, _find_group
 
 _HERE = os.path.dirname(__file__)
@@ -1017,6 +1018,24 @@ class TestRemove:
         assert report["blocked_by"] == ["referential-integrity"]
         assert report["referenced_ids"] == ["x_smt"]
 
+    def test_index_follows_edits(self):
+        """The reference index is patched by mutators, so later checks see new links."""
+        c = Catalog.new("T")
+        c._ref_index()
+        c.create_control("[root]", "b", title="B")
+        c.insert_control("[root]", {"id": "c", "title": "C", "links": [{"href": "#b", "rel": "related"}]})
+        assert c._current_refs() is not None
+        assert c.remove("b")["referenced_ids"] == ["b"]
+        c.remove("c")
+        assert c.remove("b")["removed"] is True
+
+    def test_prose_reference_not_a_link(self):
+        """Only links block a delete; prose mentions are not link references."""
+        c = Catalog.new("T")
+        c.create_control("[root]", "a", title="See [B](#b)")
+        c.create_control("[root]", "b", title="B")
+        assert c.remove("b")["removed"] is True
+
     # --- both locks at once ---
 
     def test_both_locks_reported(self):
@@ -1283,3 +1302,170 @@ class TestMutatorReturnsCopy:
         labels = [p for p in cat_with_group.get_control_by_id("ac-1")["props"]
                   if p["name"] == "label"]
         assert any(p["value"] == "AC-1" for p in labels)
+
+
+# ===========================================================================
+# Catalog node index
+# ===========================================================================
+class TestNodeIndex:
+    """The id index behind the catalog lookups is patched by the catalog's own
+    mutation methods and rebuilt after any other change to the content."""
+
+    @pytest.fixture
+    def cat_tree(self):
+        c = Catalog.new("T")
+        c.create_control_group("[root]", "ac", title="Access Control")
+        c.create_control("ac", "ac-1", title="Policy", statements=["Do it."])
+        c.create_control("ac", "ac-2", title="Account Mgmt")
+        c.create_control("ac-2", "ac-2.1", title="Enh")
+        return c
+
+    def test_mutations_patch_index_in_place(self, cat_tree):
+        index = cat_tree._node_index()
+        cat_tree.insert_control("ac", {"id": "ac-3", "title": "Enforcement",
+                                       "parts": [{"id": "ac-3_smt", "name": "statement"}]})
+        cat_tree.add_part("ac-3_smt", "item", part_id="ac-3_smt.a", prose="a")
+        cat_tree.set_title("ac-1", "Renamed")
+        cat_tree.remove("ac-2", cascade=True)
+        assert cat_tree._node_index() is index
+        assert cat_tree.get_control_by_id("ac-3")["title"] == "Enforcement"
+        assert cat_tree._find_node("ac-3_smt.a", "part") is not None
+        assert cat_tree.get_control_by_id("ac-2.1") is None
+        assert cat_tree._find_parent_and_obj("ac-3")[1] == "controls"
+
+    def test_other_edits_rebuild_index(self, cat_tree):
+        index = cat_tree._node_index()
+        assert cat_tree.put("groups/0/controls/1/id", "ac-9")
+        assert cat_tree._node_index() is not index
+        assert cat_tree.get_control_by_id("ac-2") is None
+        assert cat_tree.get_control_by_id("ac-9")["title"] == "Account Mgmt"
+
+    def test_matches_finders_on_loaded_catalog(self, loaded_cat):
+        root = loaded_cat._catalog_root()
+        for cid in ("ac-1", "ac-2", "si-12", "nope"):
+            assert loaded_cat._find_node(cid, "control") is _find_control(root, cid)
+        assert loaded_cat._find_node("ac-1_smt", "part") is _find_part(root, "ac-1_smt")
+        assert loaded_cat._find_node("ac", "group") is _find_group(root.get("groups", []), "ac")
+
+    def test_duplicate_id_keeps_first_match(self):
+        c = Catalog.new("T")
+        c.create_control("[root]", "a", title="First")
+        c.create_control("[root]", "b", title="B")
+        c.create_control("b", "a", title="Second")   # duplicate id, nested later
+        assert c._node_index().duplicates is True
+        assert c.get_control_by_id("a")["title"] == "First"
+        c.remove("a")
+        assert c.get_control_by_id("a")["title"] == "Second"
+
+
+# ===========================================================================
+# Catalog.bulk() and adopting inserts
+# ===========================================================================
+class TestBulk:
+
+    def test_tree_rebuilt_once_at_exit(self, cat_with_group, monkeypatch):
+        calls = []
+        real = Catalog._build_controls_tree
+
+        def counting(self):
+            if not self._bulk_depth:
+                calls.append(1)
+            return real(self)
+
+        monkeypatch.setattr(Catalog, "_build_controls_tree", counting)
+        with cat_with_group.bulk():
+            for i in range(1, 4):
+                cat_with_group.insert_control("ac", {"id": f"ac-{i}", "title": f"C{i}"})
+            assert cat_with_group.controls_tree[0]["children"] == []   # deferred
+            assert cat_with_group.get_control_by_id("ac-3") is not None  # lookups still live
+        assert len(calls) == 1
+        assert [c["id"] for c in cat_with_group.controls_tree[0]["children"]] == ["ac-1", "ac-2", "ac-3"]
+
+    def test_nested_blocks_rebuild_at_outermost_exit(self, cat_with_group):
+        with cat_with_group.bulk():
+            with cat_with_group.bulk():
+                cat_with_group.insert_control("ac", {"id": "ac-1", "title": "C1"})
+            assert cat_with_group.controls_tree[0]["children"] == []
+        assert cat_with_group.controls_tree[0]["children"][0]["id"] == "ac-1"
+
+    def test_tree_rebuilt_on_error(self, cat_with_group):
+        with pytest.raises(RuntimeError):
+            with cat_with_group.bulk():
+                cat_with_group.insert_control("ac", {"id": "ac-1", "title": "C1"})
+                raise RuntimeError("boom")
+        assert cat_with_group.controls_tree[0]["children"][0]["id"] == "ac-1"
+
+    def test_adopt_inserts_without_copying(self, cat_with_group):
+        ctrl = {"id": "ac-1", "title": "Policy"}
+        assert cat_with_group.insert_control("ac", ctrl, adopt=True) is ctrl
+        assert cat_with_group._catalog_root()["groups"][0]["controls"][0] is ctrl
+
+    def test_adopt_shallow_group_drops_children_in_place(self, empty_cat):
+        grp = {"id": "ac", "title": "AC", "controls": [{"id": "ac-1", "title": "P"}]}
+        assert empty_cat.insert_group("[root]", grp, adopt=True) is grp
+        assert "controls" not in grp
+        assert empty_cat.get_control_by_id("ac-1") is None
+
+    def test_adopt_still_rejects_duplicates(self, cat_with_group):
+        cat_with_group.insert_control("ac", {"id": "ac-1", "title": "P"}, adopt=True)
+        assert cat_with_group.insert_control("ac", {"id": "ac-1", "title": "Q"}, adopt=True) is None
+
+
+# ===========================================================================
+# Incremental controls_tree maintenance
+# ===========================================================================
+class TestIncrementalTree:
+    """Single-node edits patch controls_tree in place instead of rebuilding it."""
+
+    @pytest.fixture
+    def cat_tree(self):
+        c = Catalog.new("T")
+        c.create_control_group("[root]", "ac", title="Access Control", label="AC")
+        c.create_control("ac", "ac-1", title="Policy", label="AC-1")
+        c.create_control("ac", "ac-2", title="Account Mgmt", label="AC-2")
+        return c
+
+    def _no_rebuilds(self, monkeypatch):
+        def fail(self):
+            raise AssertionError("controls_tree was rebuilt")
+        monkeypatch.setattr(Catalog, "_build_controls_tree", fail)
+
+    def test_edits_patch_tree_in_place(self, cat_tree, monkeypatch):
+        tree = cat_tree.controls_tree
+        ac = tree[0]
+        self._no_rebuilds(monkeypatch)
+        cat_tree.create_control("ac-2", "ac-2.1", title="Enh", label="AC-2(1)")
+        cat_tree.insert_control("ac", {"id": "ac-3", "title": "Enforcement"})
+        cat_tree.create_control_group("[root]", "au", title="Audit")
+        cat_tree.set_title("ac-1", "Renamed")
+        cat_tree.set_label("ac-1", "AC-01")
+        cat_tree.add_part("ac-1", "guidance", prose="g")
+        cat_tree.remove("ac-2", cascade=True)
+        assert cat_tree.controls_tree is tree and tree[0] is ac
+        assert [n["id"] for n in tree] == ["ac", "au"]
+        assert [(n["id"], n["title"], n["label"]) for n in ac["children"]] == [
+            ("ac-1", "Renamed", "AC-01"), ("ac-3", "Enforcement", "")]
+
+    def test_new_group_placed_before_controls(self):
+        c = Catalog.new("T")
+        c.create_control_group("[root]", "ac", title="AC")
+        c.create_control_group("ac", "ac-x", title="Sub")
+        c.create_control_group("[root]", "au", title="AU")
+        c.create_control_group("ac", "ac-y", title="Sub 2")
+        assert [n["id"] for n in c.controls_tree] == ["ac", "au"]
+        assert [n["id"] for n in c.controls_tree[0]["children"]] == ["ac-x", "ac-y"]
+
+    def test_other_edits_fall_back_to_rebuild(self, cat_tree):
+        assert cat_tree.put("groups/0/controls/1/title", "Changed elsewhere")
+        cat_tree.set_title("ac-1", "Renamed")
+        titles = [n["title"] for n in cat_tree.controls_tree[0]["children"]]
+        assert titles == ["Renamed", "Changed elsewhere"]
+
+    def test_unlabel_with_prop_index(self, cat_tree):
+        cat_tree.enable_prop_index()
+        cat_tree.find_props("label")
+        assert cat_tree.put("groups/0/title", "AC")   # tree must be rebuilt on next edit
+        cat_tree.set_label("ac-1", "")
+        assert cat_tree.controls_tree[0]["children"][0]["label"] == ""
+        live = cat_tree._find_node("ac-1", "control")
+        assert get_props(live, name="label", index=cat_tree._document_prop_index()) == []
@@ -329,3 +329,48 @@ class TestChoiceCardinality:
         assert c.validation_status["choice"] is False
         errs = [e for e in c.validation_errors if e["error-type"] == "choice"]
         assert any(set(e["field"]) == {"groups", "controls"} for e in errs)
+
+
+# ===========================================================================
+# Compiled validation plans — built once per (version, model), reused by validate()
+# ===========================================================================
+class TestCompiledValidationPlan:
+
+    def test_plan_is_cached_per_version_and_model(self):
+        c = Catalog.new("Plan")
+        first = c._validation_plan()
+        second = Catalog.new("Plan 2")._validation_plan()
+        assert first is second
+        assert first.index is c._support.get_metaschema_index(c.oscal_version, "catalog")
+
+    def test_plan_rebuilt_when_index_object_changes(self):
+        from oscal.oscal_content import get_validation_plan
+        plan = get_validation_plan("v0.0.0-test", "catalog", {"nodes": {}})
+        assert get_validation_plan("v0.0.0-test", "catalog", {"nodes": {}}) is not plan
+
+    def test_node_plans_compiled_once(self):
+        c = Catalog.new("Plan")
+        c.create_control("[root]", "ac-1", title="A")
+        c.validate()
+        plan = c._validation_plan()
+        root = plan.index["nodes"]
+        assert plan.node_plan(root) is plan.node_plan(root)
+
+    def test_allowed_values_error_matches_constraint(self):
+        p = Profile.new("Plan")
+        p.set_merge(flat=True)
+        p._dict["profile"]["merge"]["combine"] = {"method": "not-a-method"}
+        p.validate()
+        errs = [e for e in p.validation_errors if e["error-type"] == "allowed-values"]
+        assert errs and errs[0]["field"] == "@method"
+        enums = [v["enum"] for v in errs[0]["expected"]["one-of"]]
+        assert enums == sorted(enums) and "merge" in enums
+
+    def test_datatype_error_reports_pattern(self):
+        c = Catalog.new("Plan")
+        c._dict["catalog"]["uuid"] = "not-a-uuid"
+        c.validate()
+        errs = [e for e in c.validation_errors if e["error-type"] == "invalid-type"]
+        assert errs and errs[0]["field"] == "@uuid"
+        assert errs[0]["expected"]["type"] == "uuid"
+        assert errs[0]["expected"]["pattern"]
@@ -7,6 +7,7 @@ Unit tests for OSCAL content write methods (OSCAL base class and module function
     - append_prop() / append_props()      (module functions)
     - append_link() / append_links()      (module functions)
     - append_resource()                   (module function)
+    - get_props()                         (module function, with and without a PropIndex)
 """
 import pytest
 
@@ -20,6 +21,7 @@ from oscal.oscal_content import (
     append_resource,
     get_props,
 )
+from oscal.oscal_converter import PropIndex
 
 
 # ===========================================================================
@@ -611,6 +613,24 @@ class TestGetProps:
         result = get_props(parent, name="label", class_="c")
         assert [p["value"] for p in result] == ["plain", "grouped"]
 
+    def test_index_matches_scan(self):
+        """With a PropIndex, name mode returns the same props in the same order."""
+        parent = {"props": [
+            {"name": "label", "value": "both", "class": "c", "group": "g"},
+            {"name": "label", "value": "other-ns", "ns": FEDRAMP_NS},
+            {"name": "label", "value": "bare"},
+            {"name": "sort-id", "value": "s"},
+        ]}
+        index = PropIndex({"catalog": {"controls": [parent]}})
+        for kwargs in ({}, {"class_": "c"}, {"ns": FEDRAMP_NS}, {"group": "g"}):
+            assert get_props(parent, name="label", index=index, **kwargs) == \
+                get_props(parent, name="label", **kwargs)
+
+    def test_index_ignored_for_object_outside_document(self):
+        parent = {"props": [{"name": "label", "value": "copy"}]}
+        index = PropIndex({"catalog": {"controls": [dict(parent)]}})
+        assert get_props(parent, name="label", index=index) == [{"name": "label", "value": "copy"}]
+
     # -- uuid mode ---------------------------------------------------------
     def test_match_by_uuid(self):
         parent = {"props": [
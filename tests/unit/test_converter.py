@@ -0,0 +1,302 @@
+"""
+Unit tests for the metaschema-driven OSCALConverter entry points.
+
+Covers:
+  - OSCALConverter.xml_to_dict() — direct XML (Element / tree / bytes / str) to dict
+  - OSCALConverter.iterparse_to_dict() — streaming XML to dict, identical output
+  - OSCALConverter.iter_xml() / write_xml() — streaming dict to XML, identical output
+  - Compiled conversion plans shared per (version, model)
+"""
+import io
+import json
+import os
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from oscal import OSCAL
+from oscal.oscal_converter import OSCALConverter, _CHILD, _ConvertedElement, _cast_int
+
+_HERE = os.path.dirname(__file__)
+_DATA = os.path.join(_HERE, "..", "test-data")
+_XML_PROFILE = os.path.join(_DATA, "xml", "FedRAMP_rev5_LOW-baseline_profile.xml")
+_XML_CATALOG = os.path.join(_DATA, "xml", "FedRAMP_rev5_LOW-baseline-resolved-profile_catalog.xml")
+_XML_DIAMOND = os.path.join(_DATA, "xml", "imports", "diamond_top.xml")
+
+
+_METADATA = (
+    b"<metadata><title>T</title><last-modified>2024-01-01T00:00:00Z</last-modified>"
+    b"<version>1</version><oscal-version>1.1.3</oscal-version></metadata>"
+)
+
+
+def _observation(n: int) -> bytes:
+    return (
+        f'<observation uuid="00000000-0000-4000-8000-00000000000{n}"><title>Obs {n}</title>'
+        f'<description><p>Saw <em>{n}</em>.</p></description><prop name="tool" value="scan-{n}"/>'
+        f"<method>EXAMINE</method><method>TEST</method>"
+        f"<collected>2024-01-0{n}T00:00:00Z</collected></observation>"
+    ).encode()
+
+
+def _finding(n: int) -> bytes:
+    return (
+        f'<finding uuid="10000000-0000-4000-8000-00000000000{n}"><title>Finding {n}</title>'
+        f"<description><p>D</p></description>"
+        f'<target type="objective-id" target-id="ac-{n}_obj"><status state="not-satisfied"/></target>'
+        f'<related-observation observation-uuid="00000000-0000-4000-8000-00000000000{n}"/></finding>'
+    ).encode()
+
+
+_XML_ASSESSMENT_RESULTS = (
+    b'<assessment-results xmlns="http://csrc.nist.gov/ns/oscal/1.0" uuid="3e247a66-8b24-4a28-b244-8b6031cf3594">'
+    + _METADATA
+    + b'<import-ap href="#"/><result uuid="72fa7eeb-699e-445a-a1b5-9d0f7345b50b"><title>R</title>'
+    b"<description><p>D</p></description><start>2024-01-01T00:00:00Z</start>"
+    b"<reviewed-controls><control-selection><include-all/></control-selection></reviewed-controls>"
+    + _observation(1) + _observation(2) + _finding(1) + _finding(2)
+    + b"</result></assessment-results>"
+)
+
+_XML_POAM = (
+    b'<plan-of-action-and-milestones xmlns="http://csrc.nist.gov/ns/oscal/1.0"'
+    b' uuid="06c3b989-3379-4fa5-ae2a-6f3a63e8d228">'
+    + _METADATA
+    + b'<import-ssp href="#"/>'
+    + _observation(1) + _observation(2) + _finding(1)
+    + b'<poam-item uuid="6f5fff73-cac6-4da0-a0d9-0f931a5efafa"><title>Item</title><description><p>Fix</p></description>'
+    b'<related-finding finding-uuid="10000000-0000-4000-8000-000000000001"/>'
+    b'<related-observation observation-uuid="00000000-0000-4000-8000-000000000002"/></poam-item>'
+    b"</plan-of-action-and-milestones>"
+)
+
+
+def _read(path: str) -> str:
+    with open(path, encoding="utf-8") as fh:
+        return fh.read()
+
+
+@pytest.fixture(scope="module")
+def profile_converter():
+    conv = OSCALConverter.from_support("profile", "v1.1.3")
+    assert conv is not None
+    return conv
+
+
+@pytest.fixture(scope="module")
+def catalog_converter():
+    conv = OSCALConverter.from_support("catalog", "v1.1.3")
+    assert conv is not None
+    return conv
+
+
+# ===========================================================================
+# xml_to_dict()
+# ===========================================================================
+class TestXmlToDict:
+
+    def test_matches_xml_to_json(self, profile_converter):
+        content = _read(_XML_PROFILE)
+        assert profile_converter.xml_to_dict(content) == json.loads(profile_converter.xml_to_json(content))
+
+    def test_accepts_parsed_element_and_tree(self, profile_converter):
+        content = _read(_XML_PROFILE)
+        expected = profile_converter.xml_to_dict(content)
+        root = ET.fromstring(content.encode("utf-8"))
+        assert profile_converter.xml_to_dict(root) == expected
+        assert profile_converter.xml_to_dict(ET.ElementTree(root)) == expected
+
+    def test_accepts_bytes(self, profile_converter):
+        content = _read(_XML_PROFILE)
+        assert profile_converter.xml_to_dict(content.encode("utf-8")) == profile_converter.xml_to_dict(content)
+
+    def test_root_key_is_model(self, profile_converter):
+        body = profile_converter.xml_to_dict(_read(_XML_PROFILE))
+        assert [k for k in body if k != "$schema"] == ["profile"]
+        assert body["profile"]["uuid"]
+
+    def test_malformed_returns_none(self, profile_converter):
+        assert profile_converter.xml_to_dict(b"<profile><metadata>") is None
+
+    def test_loaded_xml_dict_matches_converter(self, profile_converter):
+        obj = OSCAL.load(_XML_PROFILE)
+        conv = OSCALConverter.from_support(obj.model, obj.oscal_version)
+        assert obj._dict == json.loads(conv.xml_to_json(_read(_XML_PROFILE)))
+
+
+# ===========================================================================
+# iterparse_to_dict()
+# ===========================================================================
+class TestIterparseToDict:
+
+    def test_catalog_matches_tree_conversion(self, catalog_converter):
+        """Every group (outermost repeated assembly) is streamed; output is unchanged."""
+        expected = catalog_converter.xml_to_dict(ET.parse(_XML_CATALOG))
+        assert catalog_converter.iterparse_to_dict(_XML_CATALOG) == expected
+
+    def test_profile_imports_match_tree_conversion(self, profile_converter):
+        for path in (_XML_PROFILE, _XML_DIAMOND):
+            assert profile_converter.iterparse_to_dict(path) == profile_converter.xml_to_dict(ET.parse(path))
+
+    def test_accepts_file_object_and_bytes(self, profile_converter):
+        with open(_XML_DIAMOND, "rb") as fh:
+            data = fh.read()
+        expected = profile_converter.xml_to_dict(data)
+        assert profile_converter.iterparse_to_dict(io.BytesIO(data)) == expected
+        assert profile_converter.iterparse_to_dict(data) == expected
+
+    def test_by_key_and_markup_preserved(self, catalog_converter):
+        xml = (
+            b'<catalog xmlns="http://csrc.nist.gov/ns/oscal/1.0" uuid="74c8ba1e-5cd4-4ad1-bbfd-d888e2f6c724">'
+            b"<metadata><title>T</title><last-modified>2024-01-01T00:00:00Z</last-modified>"
+            b"<version>1</version><oscal-version>1.1.3</oscal-version></metadata>"
+            b'<group id="g"><title>G</title>'
+            b'<control id="c-1"><title>C <em>one</em></title>'
+            b'<part id="c-1_smt" name="statement"><p>Do <strong>this</strong>.</p></part></control>'
+            b"</group></catalog>"
+        )
+        result = catalog_converter.iterparse_to_dict(xml)
+        assert result == catalog_converter.xml_to_dict(xml)
+        assert result["catalog"]["groups"][0]["controls"][0]["title"] == "C *one*"
+
+    def test_assessment_results_match_tree_conversion(self):
+        converter = OSCALConverter.from_support("assessment-results", "v1.1.3")
+        result = converter.iterparse_to_dict(_XML_ASSESSMENT_RESULTS)
+        assert result == converter.xml_to_dict(_XML_ASSESSMENT_RESULTS)
+        (ar_result,) = result["assessment-results"]["results"]
+        assert [o["title"] for o in ar_result["observations"]] == ["Obs 1", "Obs 2"]
+        assert ar_result["observations"][1]["methods"] == ["EXAMINE", "TEST"]
+        assert ar_result["observations"][1]["description"] == "Saw *2*."
+        assert [f["target"]["target-id"] for f in ar_result["findings"]] == ["ac-1_obj", "ac-2_obj"]
+        assert ar_result["findings"][0]["related-observations"] == [
+            {"observation-uuid": "00000000-0000-4000-8000-000000000001"}]
+
+    def test_poam_matches_tree_conversion(self):
+        converter = OSCALConverter.from_support("plan-of-action-and-milestones", "v1.1.3")
+        result = converter.iterparse_to_dict(_XML_POAM)
+        assert result == converter.xml_to_dict(_XML_POAM)
+        poam = result["plan-of-action-and-milestones"]
+        assert [o["props"][0]["value"] for o in poam["observations"]] == ["scan-1", "scan-2"]
+        assert poam["findings"][0]["target"]["status"] == {"state": "not-satisfied"}
+        (item,) = poam["poam-items"]
+        assert item["related-findings"] == [{"finding-uuid": "10000000-0000-4000-8000-000000000001"}]
+
+    def test_nested_assemblies_are_streamed(self, monkeypatch):
+        """Observations and findings inside one result are converted before the result closes."""
+        converter = OSCALConverter.from_support("assessment-results", "v1.1.3")
+        converted = []
+        elem_to_dict = converter._elem_to_dict
+
+        def spy(element, node):
+            if isinstance(element, _ConvertedElement):
+                converted.append(element.tag.rpartition("}")[2])
+            return elem_to_dict(element, node)
+
+        monkeypatch.setattr(converter, "_elem_to_dict", spy)
+        converter.iterparse_to_dict(_XML_ASSESSMENT_RESULTS)
+        assert converted.count("observation") == 2
+        assert converted.count("finding") == 2
+        assert converted.index("observation") < converted.index("result")
+
+    def test_malformed_returns_none(self, profile_converter):
+        assert profile_converter.iterparse_to_dict(b"<profile><metadata>") is None
+
+
+# ===========================================================================
+# iter_xml() / write_xml()
+# ===========================================================================
+class TestIterXml:
+
+    def test_matches_json_to_xml(self, catalog_converter):
+        doc = catalog_converter.xml_to_dict(ET.parse(_XML_CATALOG))
+        expected = catalog_converter.json_to_xml(json.dumps(doc))
+        assert "".join(catalog_converter.iter_xml(doc, xml_declaration=True)) == expected
+
+    def test_chunks_are_bounded(self, catalog_converter):
+        doc = catalog_converter.xml_to_dict(ET.parse(_XML_CATALOG))
+        chunks = list(catalog_converter.iter_xml(doc))
+        assert len(chunks) > 1
+        assert all(len(c) < 2 * 65536 for c in chunks)
+
+    def test_write_xml_to_file_handle(self, profile_converter):
+        doc = profile_converter.xml_to_dict(_read(_XML_DIAMOND))
+        buf = io.StringIO()
+        profile_converter.write_xml(doc, buf)
+        assert buf.getvalue() == "".join(profile_converter.iter_xml(doc))
+        assert profile_converter.xml_to_dict(buf.getvalue()) == doc
+
+    def test_compact_output(self, profile_converter):
+        doc = profile_converter.xml_to_dict(_read(_XML_DIAMOND))
+        compact = "".join(profile_converter.iter_xml(doc, pretty_print=False))
+        assert "\n" not in compact
+        assert ET.fromstring(compact).tag.endswith("profile")
+
+    def test_escaping(self, catalog_converter):
+        doc = {"catalog": {
+            "uuid": "74c8ba1e-5cd4-4ad1-bbfd-d888e2f6c724",
+            "metadata": {"title": "A & B", "last-modified": "2024-01-01T00:00:00Z",
+                         "version": "1", "oscal-version": "1.1.3",
+                         "props": [{"name": "x", "value": 'say "<hi>"'}]},
+        }}
+        out = "".join(catalog_converter.iter_xml(doc))
+        assert out == catalog_converter.json_to_xml(json.dumps(doc)).split("\n", 1)[1].rstrip("\n")
+        assert 'value="say &quot;&lt;hi&gt;&quot;"' in out
+
+    def test_rejects_multiple_roots(self, catalog_converter):
+        with pytest.raises(ValueError):
+            list(catalog_converter.iter_xml({"a": {}, "b": {}}))
+
+
+# A minimal model: integer flag, choice of two fields, and a recursive child.
+_PLAN_INDEX = {
+    "oscal_model": "thing",
+    "oscal_version": "v0.0.0-plan-test",
+    "oscal_namespace": "urn:test",
+    "nodes": {
+        "name": "thing", "use-name": "thing", "structure-type": "assembly",
+        "children": [
+            {"name": "size", "use-name": "size", "structure-type": "flag", "datatype": "integer"},
+            {"structure-type": "choice", "children": [
+                {"name": "a", "use-name": "a", "structure-type": "field", "datatype": "boolean"},
+                {"name": "b", "use-name": "b", "structure-type": "field", "datatype": "string"},
+            ]},
+            {"name": "thing", "structure-type": "recursive", "max-occurs": "unbounded"},
+        ],
+    },
+}
+
+
+class TestConversionPlans:
+
+    def test_converters_share_plans_per_model(self):
+        first = OSCALConverter.from_support("catalog", "v1.1.3")
+        second = OSCALConverter.from_support("catalog", "v1.1.3")
+        assert first._plans is second._plans
+
+    def test_plans_compiled_once(self):
+        conv = OSCALConverter(_PLAN_INDEX)
+        root = conv.root_node
+        plan = conv._plans.plan(root)
+        assert conv._plans.plan(root) is plan
+        stub = root["children"][2]
+        assert conv._plans.plan(stub) is plan
+        assert plan.flags == (("size", _cast_int),)
+        assert [spec.use_name for kind, spec in plan.children if kind is _CHILD] == ["size", "a", "b", "thing"]
+
+    def test_rebuilt_when_index_changes(self):
+        conv = OSCALConverter(_PLAN_INDEX)
+        changed = OSCALConverter(json.loads(json.dumps(_PLAN_INDEX)))
+        assert changed._plans is not conv._plans
+
+    def test_round_trip_with_casts_and_recursion(self):
+        conv = OSCALConverter(_PLAN_INDEX)
+        xml = (
+            '<thing xmlns="urn:test" size="3"><a>true</a>'
+            '<thing size="x"><b>text</b></thing><thing size="4"/></thing>'
+        )
+        doc = conv.xml_to_dict(xml)
+        assert doc["thing"] == {
+            "size": 3, "a": True, "thing": [{"size": "x", "b": "text"}, {"size": 4}],
+        }
+        back = ET.fromstring(conv.json_to_xml(json.dumps(doc)))
+        assert conv.xml_to_dict(back) == doc
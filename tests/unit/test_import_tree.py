@@ -9,6 +9,7 @@ Covers:
   - Multi-level nesting: profile → profile → catalog
   - Failed import nodes: status=INVALID, imports=[], failure populated
   - failed_imports property: returns only entries with failure set
+  - get_oscal_object: import-object directory, invalidated by import changes
 """
 
 import os
@@ -379,3 +380,33 @@ class TestGetOscalObject:
 
     def test_unknown_uuid_returns_none(self, profile_direct):
         assert profile_direct.get_oscal_object("00000000-0000-4000-a000-000000000000") is None
+
+    def test_directory_built_when_imports_resolve(self, profile_direct):
+        objects, by_uuid = profile_direct._import_objects
+        assert objects == [profile_direct, profile_direct.import_list[0]["object"]]
+        assert set(by_uuid) == {o.uuid for o in objects}
+
+    def test_remove_import_drops_object(self, profile_direct):
+        imported = profile_direct.import_list[0]["object"]
+        assert profile_direct.remove_import(profile_direct.import_list[0]["href_original"])
+        assert profile_direct.get_oscal_object(imported.uuid) is None
+
+    def test_retry_import_adds_object(self, profile_missing):
+        assert profile_missing._import_directory()[0] == [profile_missing]
+        assert profile_missing.retry_import("/nonexistent/totally_missing_catalog.xml", _CATALOG)
+        assert profile_missing._import_directory()[0] == [
+            profile_missing, profile_missing.import_list[0]["object"]]
+
+    def test_nested_change_invalidates_ancestors(self, tmp_path):
+        """A change below the top document (here a re-assigned root uuid) is seen from the top."""
+        (tmp_path / "catalog.xml").write_text(_catalog_xml())
+        (tmp_path / "profile2.xml").write_text(_profile_xml("catalog.xml", uuid_suffix="02"))
+        (tmp_path / "profile1.xml").write_text(_profile_xml("profile2.xml", uuid_suffix="01"))
+        top = OSCAL.load(str(tmp_path / "profile1.xml"))
+        top.resolve_imports()
+        leaf = top.import_list[0]["object"].import_list[0]["object"]
+        old_uuid = leaf.uuid
+        assert top.get_oscal_object(old_uuid) is leaf
+        leaf._reassign_uuid("aabbccdd-0000-4000-a000-0000000000ff")
+        assert top.get_oscal_object(old_uuid) is None
+        assert top.get_oscal_object("aabbccdd-0000-4000-a000-0000000000ff") is leaf
@@ -1,6 +1,6 @@
 """
-Tests for the import-tree ID resolver (OSCAL.find_in_import_tree / reachable_ids) and
-for out-of-scope cross-reference rewriting during profile resolution.
+Tests for the import-tree ID resolver (OSCAL.find_in_import_tree / reachable_ids), for
+federated queries across the import tree (OSCAL.federated_query), and for out-of-scope cross-reference rewriting during profile resolution.
 """
 import json
 import os
@@ -89,6 +89,31 @@ class TestReachableIds:
                 "bbbbbbbb-2222-4222-8222-222222222222"} <= ids
 
 
+class TestFederatedQuery:
+
+    def test_tags_results_with_owning_document(self, profile_over_catalog):
+        hits = profile_over_catalog.federated_query("//control[@id='ac-1']/title")
+        cat = profile_over_catalog.import_list[0]["object"]
+        assert [(h["element"], h["object_uuid"]) for h in hits] == [("Policy", cat.uuid)]
+        assert hits[0]["href"].endswith("cat.json")
+
+    def test_spans_root_and_imports_in_walk_order(self, profile_over_catalog):
+        hits = profile_over_catalog.federated_query("/*/metadata/title")
+        assert [h["element"] for h in hits] == ["P", "Src"]
+        assert hits[0]["object_uuid"] == profile_over_catalog.uuid
+
+    def test_results_are_copies(self, profile_over_catalog):
+        hit = profile_over_catalog.federated_query("//role")[0]
+        hit["element"]["title"] = "MUTATED"
+        assert profile_over_catalog.federated_query("//role")[0]["element"]["title"] == "System Owner"
+
+    def test_shared_import_queried_once(self, profile_over_catalog):
+        cat = profile_over_catalog.import_list[0]["object"]
+        profile_over_catalog.import_list.append(dict(profile_over_catalog.import_list[0]))
+        assert profile_over_catalog._documents_in_scope() == [profile_over_catalog, cat]
+        assert len(profile_over_catalog.federated_query("//param")) == 1
+
+
 # ===========================================================================
 # find_in_import_tree — FedRAMP (real chain: baseline -> tailoring profile -> 800-53)
 # ===========================================================================
@@ -1,8 +1,12 @@
 """
 Unit tests for oscal.oscal_converter markup helpers
 """
+import threading
+from xml.etree.ElementTree import Element
+
 import pytest
 
+from oscal import oscal_converter
 from oscal.oscal_converter import (
     convert_markup_line,
     convert_markup_multiline,
@@ -175,3 +179,92 @@ class TestOscalMarkdownToHtml:
         result = oscal_markdown_to_html("# Heading", multiline=True)
         assert result.startswith("<h1>")
         assert "<p>" not in result
+
+
+class TestMarkdownEngineReuse:
+    """The Markdown engine is cached per thread and markup-free text skips it."""
+
+    def test_engine_reused_within_thread(self):
+        oscal_markdown_to_html("**a**")
+        engine = oscal_converter._markdown_engine()
+        oscal_markdown_to_html("*b*", multiline=True)
+        assert oscal_converter._markdown_engine() is engine
+
+    def test_engine_per_thread(self):
+        engines = []
+        thread = threading.Thread(target=lambda: engines.append(oscal_converter._markdown_engine()))
+        thread.start()
+        thread.join()
+        assert engines[0] is not oscal_converter._markdown_engine()
+
+    def test_state_reset_between_conversions(self):
+        """Reference-style link definitions must not leak into the next conversion."""
+        oscal_markdown_to_html("[x][ref]\n\n[ref]: http://example.com", multiline=True)
+        assert "href" not in oscal_markdown_to_html("[x][ref]", multiline=True)
+
+    @pytest.mark.parametrize("text", [
+        "Access Control Policy and Procedures",
+        "Account Management | Automated System Account Management",
+        "organization-defined frequency: annually",
+        "AT&T and Q&A",
+    ])
+    def test_plain_text_fast_path_matches_markdown(self, text, monkeypatch):
+        fast = (oscal_markdown_to_html(text), oscal_markdown_to_html(text, multiline=True))
+        monkeypatch.setattr(oscal_converter, "_plain_markup_html", lambda *_: None)
+        assert fast == (oscal_markdown_to_html(text), oscal_markdown_to_html(text, multiline=True))
+
+    @pytest.mark.parametrize("text", ["**bold**", "1. item", "- item", "a  b", "&amp;", "x_y_z", "{{ insert: param, p }}"])
+    def test_markup_bypasses_fast_path(self, text):
+        assert oscal_converter._plain_markup_html(text, False) is None
+
+    def test_fast_path_escapes_ampersand(self):
+        assert oscal_markdown_to_html("Q&A", multiline=True) == "<p>Q&amp;A</p>"
+
+
+class TestMarkupMemo:
+    """Markup conversions are memoized per (text, datatype) in a bounded LRU."""
+
+    @pytest.fixture(autouse=True)
+    def _fresh_cache(self):
+        oscal_converter.clear_markup_cache()
+        yield
+        oscal_converter.clear_markup_cache()
+
+    def test_repeat_conversion_hits(self):
+        first = oscal_markdown_to_html("Review **annually**.", multiline=True)
+        assert oscal_markdown_to_html("Review **annually**.", multiline=True) == first
+        info = oscal_converter.markup_cache_info()["markdown_to_html"]
+        assert (info.hits, info.misses, info.entries) == (1, 1, 1)
+
+    def test_datatype_is_part_of_key(self):
+        line = oscal_markdown_to_html("**x**")
+        multi = oscal_markdown_to_html("**x**", multiline=True)
+        assert line != multi
+        assert oscal_converter.markup_cache_info()["markdown_to_html"].hits == 0
+
+    def test_html_to_markdown_and_text_only_elements(self):
+        title = Element("title")
+        title.text = "Access Control"
+        oscal_converter._markup_to_md(title, "markup-line")
+        assert oscal_converter.oscal_html_to_markdown("Access Control", multiline=False) == "Access Control"
+        info = oscal_converter.markup_cache_info()["html_to_markdown"]
+        assert (info.hits, info.misses) == (1, 1)
+
+    def test_bounded_by_entries_and_size(self):
+        memo = oscal_converter._MarkupMemo(max_entries=2, max_chars=20)
+        memo.put("a", "markup-line", "A")
+        memo.put("b", "markup-line", "B")
+        memo.get("a", "markup-line")
+        memo.put("c", "markup-line", "C")
+        assert memo.get("b", "markup-line") is None
+        assert memo.get("a", "markup-line") == "A"
+        memo.put("long text", "markup-line", "long result")
+        assert memo.info().chars <= 20
+        memo.put("x" * 30, "markup-line", "too big")
+        assert memo.get("x" * 30, "markup-line") is None
+
+    def test_clear_resets_counters(self):
+        oscal_markdown_to_html("*a*")
+        oscal_converter.clear_markup_cache()
+        info = oscal_converter.markup_cache_info()["markdown_to_html"]
+        assert (info.hits, info.misses, info.entries, info.chars) == (0, 0, 0, 0)
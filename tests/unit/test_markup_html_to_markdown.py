@@ -1,5 +1,14 @@
 """Regression tests for HTML -> markdown conversion in oscal_markup."""
-from oscal.oscal_converter import oscal_html_to_markdown
+import xml.etree.ElementTree as ET
+
+import pytest
+
+from oscal.oscal_converter import (
+    _html_to_markdown_passes,
+    _markup_to_md,
+    _tokenize_markup,
+    oscal_html_to_markdown,
+)
 
 
 def test_insert_self_closing_standard_order():
@@ -51,3 +60,53 @@ def test_paragraphs_with_inline_markup_keep_break():
 def test_plain_paragraphs_keep_break():
     html = "<p>First.</p><p>Second.</p>"
     assert oscal_html_to_markdown(html, multiline=True) == "First.\n\nSecond."
+
+
+# ---------------------------------------------------------------------------
+# The single-pass renderer must match the sequential rewrite passes, including
+# how nesting decides which tags convert and which are stripped.
+# ---------------------------------------------------------------------------
+_SINGLE_PASS_CASES = [
+    "<p>Text with <strong>bold</strong>, <em>em</em> and <code>x</code>.</p>",
+    "<p><strong><em>inner only</em></strong> and <em><strong>both</strong></em></p>",
+    '<p>See <a href="https://x.org">link</a> and <a href="u" title="t">titled</a>.</p>',
+    '<p><a href="u"><em>nested</em></a> <strong><a href="u">ok</a></strong></p>',
+    "<h1>Title</h1><h2><em>not converted</em></h2><h3>Sub</h3>",
+    "<ul><li>single</li></ul><ol><li>one</li><li>two</li></ol>",
+    "<blockquote>quoted</blockquote><pre><code>code\nblock</code></pre><pre>raw</pre>",
+    '<p>Set <insert type="param" id-ref="p1"/> to <q>on</q>.<br>Next &amp; last</p>',
+    '<img alt="a" src="s.png" title="t" /> <img alt="b" src="s.png"/> <img src="s.png">',
+    "<p class=\"c\">attrs stay unconverted</p><P>upper</P><x-y>custom</x-y>",
+]
+
+
+@pytest.mark.parametrize("html", _SINGLE_PASS_CASES)
+@pytest.mark.parametrize("multiline", [True, False])
+def test_single_pass_matches_rewrite_passes(html, multiline):
+    assert _tokenize_markup(html, multiline) is not None
+    assert oscal_html_to_markdown(html, multiline) == _html_to_markdown_passes(html, multiline)
+
+
+@pytest.mark.parametrize("html", [
+    "a < b <em>c</em>",
+    "<p>unclosed <em>tag</p>",
+    "<q>outer <q>inner</q> tail</q>",
+    "<table><tr><th>H</th></tr><tr><td>v</td></tr></table>",
+])
+def test_unmodelled_fragments_use_rewrite_passes(html):
+    assert _tokenize_markup(html, True) is None
+    assert oscal_html_to_markdown(html, True) == _html_to_markdown_passes(html, True)
+
+
+def test_markup_element_walk_matches_serialized_html():
+    ns = "http://csrc.nist.gov/ns/oscal/1.0"
+    elem = ET.fromstring(
+        f'<part xmlns="{ns}">\n  <p>Use &amp; <em>keep</em> <a href="u?a=1&amp;b=2">x</a>'
+        '<insert type="param" id-ref="p1"/></p>\n  <ul><li>one</li></ul>\n</part>'
+    )
+    raw = "".join(
+        ET.tostring(child, encoding="unicode", method="html") for child in elem
+    ).replace(f' xmlns="{ns}"', "").replace("ns0:", "").replace(f' xmlns:ns0="{ns}"', "")
+    expected = _html_to_markdown_passes(raw.strip(), True)
+    assert _markup_to_md(elem, "markup-multiline") == expected
+    assert expected.startswith("Use &amp; *keep* [x](u?a=1&amp;b=2){{ insert: param, p1 }}")
@@ -413,6 +413,17 @@ class TestSave:
         finally:
             os.unlink(path)
 
+    def test_save_xml_matches_dumps(self):
+        """dump() streams XML straight to the file; the bytes equal dumps('xml')."""
+        obj = self._load_profile()
+        with tempfile.NamedTemporaryFile(suffix=".xml", delete=False) as fh:
+            path = fh.name
+        try:
+            assert obj.dump(path, format="xml") is True
+            assert _read(path) == obj.dumps("xml")
+        finally:
+            os.unlink(path)
+
     def test_save_pretty_print_json(self):
         """pretty_print=True produces indented JSON output."""
         obj = self._make_catalog()
@@ -496,3 +507,53 @@ class TestSave:
             assert reloaded.model == "profile"
         finally:
             os.unlink(path)
+
+
+# ===========================================================================
+# Content version and cached serializations
+# ===========================================================================
+class TestContentVersion:
+    """Serializations are cached per content version and rebuilt after mutations."""
+
+    def test_dumps_cached_until_mutation(self, monkeypatch):
+        obj = Catalog.new("Version Test Catalog", version="1.0")
+        first = obj.dumps("xml")
+        calls = []
+        monkeypatch.setattr(obj, "_build_tree", lambda: calls.append(1) or False)
+        assert obj.dumps("xml") is first
+        assert obj.xml is first
+        assert calls == []
+
+    def test_put_bumps_version_and_rebuilds_xml(self):
+        obj = Catalog.new("Version Test Catalog", version="1.0")
+        before = obj.dumps("xml")
+        json_before = obj.dumps("json", pretty_print=True)
+        version = obj.content_version
+        assert obj.put("metadata/title", "Renamed Catalog")
+        assert obj.content_version > version
+        assert "Renamed Catalog" in obj.dumps("xml")
+        assert "Renamed Catalog" not in before
+        assert "Renamed Catalog" in obj.dumps("json", pretty_print=True)
+        assert json_before != obj.dumps("json", pretty_print=True)
+
+    def test_decorated_mutator_bumps_version(self):
+        obj = Catalog.new("Version Test Catalog", version="1.0")
+        obj.dumps("xml")
+        version = obj.content_version
+        assert obj.insert_group("", {"id": "ac", "title": "Access Control"}) is not None
+        assert obj.content_version > version
+        assert 'id="ac"' in obj.dumps("xml")
+
+    def test_failed_put_keeps_version(self):
+        obj = Catalog.new("Version Test Catalog", version="1.0")
+        version = obj.content_version
+        assert not obj.put("metadata/parties/5/name", "x")
+        assert obj.content_version == version
+
+    def test_pretty_print_cached_separately(self):
+        obj = OSCAL.load(_JSON_PROFILE)
+        compact = obj.dumps("json")
+        pretty = obj.dumps("json", pretty_print=True)
+        assert compact != pretty
+        assert obj.dumps("json") is compact
+        assert obj.dumps("json", pretty_print=True) is pretty
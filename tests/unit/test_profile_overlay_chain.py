@@ -90,6 +90,15 @@ class TestOverlayChain:
         assert "{{ insert: param, ac-1_prm_1 }}" in ac1["parts"][0]["prose"]
         assert prof.catalog is None      # JIT fetch did not force a full resolve
 
+    def test_unresolved_lookups_follow_tree_rebuilds(self):
+        prof = OSCAL.load(os.path.join(_DIR, "combined-profile.json"))
+        assert prof.get_control_by_id("ac-2.1")["id"] == "ac-2.1"
+        assert prof.get_group_by_id("ac")["id"] == "ac"
+        assert prof.get_control_by_id("nope") is None
+        prof.controls_tree = []          # as if a rebuild produced an empty scope
+        assert prof.get_control_by_id("ac-2.1") is None
+        assert prof.get_group_by_id("ac") is None
+
     def test_resolves_to_valid_catalog(self, combined):
         combined.resolve()
         assert combined.catalog is not None and combined.catalog.is_valid
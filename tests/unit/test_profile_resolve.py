@@ -6,7 +6,11 @@ Unit tests for the tree-driven Profile resolution model (Phases C & D):
   - read-only getters materialize from source when unresolved, from .catalog when resolved,
     and agree (parity);
   - combine/duplicates rename node ids in the tree, full internal ids at resolve;
-  - metadata & back-matter carry-forward; manual duplicate resolution.
+  - metadata & back-matter carry-forward; manual duplicate resolution;
+  - a threaded materialize phase gives the same catalog as in-line resolution;
+  - the persistent resolution cache (hit without materializing, misses on new inputs);
+  - directive edits re-materialize only the affected controls of a resolved catalog;
+  - unresolved reads are memoized per (control, depth) and invalidated by edits.
 
 Source catalogs are written to real files and imported — nothing is mocked.
 """
@@ -15,8 +19,11 @@ import os
 
 import pytest
 
-from oscal import Profile, Catalog
+import oscal.oscal_controls as oc
+from oscal import OSCAL, Profile, Catalog
+from oscal.oscal_cache import CacheDirective, LocalCache
 from oscal.oscal_controls import ResolutionStatus
+from oscal.oscal_registry import get_registry
 
 
 # ===========================================================================
@@ -180,6 +187,49 @@ class TestUnresolvedReads:
         assert prof.get_control_by_id("ac-1")["title"] != "MUT"
 
 
+class TestUnresolvedReadMemo:
+
+    @pytest.fixture
+    def calls(self, monkeypatch):
+        seen = []
+        real = Profile._materialize_control_node
+
+        def spy(self, node, *args, **kwargs):
+            seen.append(node.get("id"))
+            return real(self, node, *args, **kwargs)
+        monkeypatch.setattr(Profile, "_materialize_control_node", spy)
+        return seen
+
+    def test_repeat_reads_materialize_once(self, prof, calls):
+        first = prof.get_control_by_id("ac-1")
+        second = prof.get_control_by_id("ac-1")
+        assert calls == ["ac-1", "ac-1.1"]      # the control and its nested enhancement
+        assert first == second and first is not second
+
+    def test_depth_is_part_of_the_key(self, prof, calls):
+        prof.get_control_by_id("ac-1")
+        assert "controls" not in prof.get_control_by_id("ac-1", depth=0)
+        assert calls.count("ac-1") == 2
+
+    def test_nested_copy_detached_from_memo(self, prof):
+        prof.get_control_by_id("ac-1")["params"][0]["label"] = "MUT"
+        prof.get_group_by_id("ac")["controls"][0]["title"] = "MUT"
+        assert prof.get_control_by_id("ac-1")["params"][0]["label"] == "personnel"
+        assert prof.get_group_by_id("ac")["controls"][0]["title"] != "MUT"
+
+    def test_directive_edit_clears_memo(self, prof):
+        prof.get_control_by_id("ac-1")
+        prof.put("modify", {"set-parameters": [{"param-id": "ac-1_prm_1", "values": ["x"]}]})
+        assert prof.get_control_by_id("ac-1")["params"][0]["values"] == ["x"]
+
+    def test_source_edit_clears_memo(self, prof):
+        prof.get_control_by_id("ac-2")
+        source = prof.import_list[0]["object"]
+        source._dict["catalog"]["groups"][0]["controls"][1]["title"] = "Renamed"
+        source._content_changed()
+        assert prof.get_control_by_id("ac-2")["title"] == "Renamed"
+
+
 # ===========================================================================
 # Resolved catalog structure & metadata
 # ===========================================================================
@@ -315,6 +365,43 @@ class TestDuplicates:
         assert p.duplicates["controls"]["ac-1"][0].get("dropped") is True
 
 
+# ===========================================================================
+# Parallel materialize phase (resolve(workers=N))
+# ===========================================================================
+class TestParallelMaterialize:
+
+    @pytest.fixture
+    def dup_prof(self, tmp_path):
+        a = _write(tmp_path, "a.json", _source_catalog())
+        b = _write(tmp_path, "b.json", _source_catalog(uuid="22222222-2222-4222-8222-222222222222"))
+        p = Profile.new("Dup")
+        p.add_import(a, include_all=True)
+        p.add_import(b, include_all=True)
+        p.set_merge(as_is=True, combine="keep")
+        return p
+
+    def _snapshot(self, p):
+        doc = json.loads(p.catalog.dumps(format="json"))
+        doc["catalog"].pop("uuid")
+        doc["catalog"]["metadata"].pop("last-modified")
+        return doc, p.catalog.controls_tree
+
+    def test_workers_match_inline(self, dup_prof):
+        dup_prof.resolve()
+        inline = self._snapshot(dup_prof)
+        assert dup_prof.resolve(workers=4) == ResolutionStatus.RESOLVED
+        assert self._snapshot(dup_prof) == inline
+
+    def test_sources_warmed_before_fan_out(self, dup_prof, monkeypatch):
+        warmed = []
+        original = Catalog._warm_read_caches
+        monkeypatch.setattr(Catalog, "_warm_read_caches",
+                            lambda self: warmed.append(self) or original(self))
+        dup_prof.resolve(workers=2)
+        sources = [e["object"] for e in dup_prof.import_list]
+        assert all(any(w is src for w in warmed) for src in sources)
+
+
 # ===========================================================================
 # modes & blocking
 # ===========================================================================
@@ -718,3 +805,160 @@ class TestResolutionInvalidation:
         p.resolve_duplicate("ac-1")                       # edits .catalog in place
         assert p.resolution_status == ResolutionStatus.RESOLVED
         assert p.catalog is not None
+
+
+# ===========================================================================
+# Directive edits update a resolved catalog in place (INCREMENTAL)
+# ===========================================================================
+class TestIncrementalResolution:
+
+    _SET_PARAM = {"param-id": "ac-1_prm_1", "values": ["security officers"]}
+
+    @staticmethod
+    def _spy(monkeypatch):
+        calls = []
+        real = Profile._materialize_control_node
+
+        def spy(self, node, *args, **kwargs):
+            calls.append(node.get("id"))
+            return real(self, node, *args, **kwargs)
+        monkeypatch.setattr(Profile, "_materialize_control_node", spy)
+        return calls
+
+    @staticmethod
+    def _fully_resolved(src_path, modify):
+        p = _baseline(src_path)
+        p.put("modify", modify)
+        p.resolve()
+        return p
+
+    def test_set_parameter_edit_is_incremental(self, resolved, src_path):
+        resolved.put("modify", {"set-parameters": [self._SET_PARAM]})
+        assert resolved.resolution_status == ResolutionStatus.INCREMENTAL
+        assert resolved.resolution_state == "incremental"
+        param = resolved.catalog.get_parameter_by_id("ac-1_prm_1")
+        assert param["values"] == ["security officers"]
+        full = self._fully_resolved(src_path, {"set-parameters": [self._SET_PARAM]})
+        assert resolved.get_control_list() == full.get_control_list()
+
+    def test_only_affected_controls_rematerialized(self, resolved, monkeypatch):
+        calls = self._spy(monkeypatch)
+        resolved.put("modify", {"alters": [{"control-id": "au-1", "adds": [
+            {"position": "ending", "props": [{"name": "status", "value": "tailored"}]}]}]})
+        assert calls == ["au-1"]
+        assert resolved.catalog.get_control_by_id("au-1")["props"] == [
+            {"name": "status", "value": "tailored"}]
+
+    def test_alter_reaches_enhancements_and_keeps_them_nested(self, resolved, src_path,
+                                                              monkeypatch):
+        modify = {"alters": [{"control-id": "ac-1", "removes": [{"by-name": "statement"}]}]}
+        calls = self._spy(monkeypatch)
+        resolved.put("modify", modify)
+        assert calls == ["ac-1", "ac-1.1"]
+        ac1 = resolved.catalog.get_control_by_id("ac-1")
+        assert "parts" not in ac1
+        assert [c["id"] for c in ac1["controls"]] == ["ac-1.1"]
+        full = self._fully_resolved(src_path, modify)
+        assert resolved.catalog._dict["catalog"]["groups"] == full.catalog._dict["catalog"]["groups"]
+
+    def test_directive_without_effect_keeps_resolved(self, resolved, monkeypatch):
+        calls = self._spy(monkeypatch)
+        resolved.put("modify", {"set-parameters": [{"param-id": "no-such", "values": ["x"]}]})
+        assert calls == []
+        assert resolved.resolution_status == ResolutionStatus.RESOLVED
+        assert resolved.catalog is not None
+
+    def test_successive_edits_accumulate(self, resolved):
+        resolved.put("modify", {"set-parameters": [self._SET_PARAM]})
+        resolved.put("modify/set-parameters/0/values", ["auditors"])
+        assert resolved.catalog.get_parameter_by_id("ac-1_prm_1")["values"] == ["auditors"]
+
+    def test_reordering_alters_invalidates(self, resolved):
+        alters = [{"control-id": cid, "adds": [{"position": "ending",
+                                                "props": [{"name": "n", "value": cid}]}]}
+                  for cid in ("ac-1", "au-1")]
+        resolved.put("modify", {"alters": alters})
+        resolved.put("modify/alters", list(reversed(alters)))
+        assert resolved.resolution_status == ResolutionStatus.UNRESOLVED
+        assert resolved.catalog is None
+
+    def test_without_dependency_record_invalidates(self, resolved):
+        # Without a dependency record (a catalog loaded from the cache) there is
+        # nothing to update from.
+        resolved._resolution_deps = None
+        resolved.put("modify", {"set-parameters": [self._SET_PARAM]})
+        assert resolved.resolution_status == ResolutionStatus.UNRESOLVED
+
+
+# ===========================================================================
+# Persistent resolution cache (resolve(cache_directive=...))
+# ===========================================================================
+class TestResolutionCache:
+
+    @pytest.fixture
+    def cache(self, tmp_path, monkeypatch):
+        test_cache = LocalCache(db_path=str(tmp_path / "local_cache.db"))
+        monkeypatch.setattr(oc, "get_local_cache", lambda: test_cache)
+        return test_cache
+
+    @pytest.fixture
+    def prof_file(self, prof, tmp_path):
+        path = tmp_path / "profile.json"
+        path.write_text(prof.dumps(format="json"))
+        return str(path)
+
+    def _no_materialize(self, monkeypatch):
+        def fail(*args, **kwargs):
+            raise AssertionError("resolve materialized content on a cache hit")
+        monkeypatch.setattr(Profile, "_materialize_control_node", fail)
+
+    def test_hit_rehydrates_without_materializing(self, cache, prof_file, monkeypatch):
+        first = OSCAL.load(prof_file)
+        assert first.resolve(cache_directive=CacheDirective.forever()) == ResolutionStatus.RESOLVED
+        self._no_materialize(monkeypatch)
+        second = OSCAL.load(prof_file)
+        assert second.resolve(cache_directive=CacheDirective.forever()) == ResolutionStatus.RESOLVED
+        assert isinstance(second.catalog, Catalog)
+        assert second.catalog._dict == first.catalog._dict
+        assert second.catalog.controls_tree == first.catalog.controls_tree
+
+    def test_no_directive_stores_nothing(self, cache, prof):
+        prof.resolve()
+        rows = cache._ensure_db().query("SELECT count(*) AS n FROM filecache")
+        assert rows[0]["n"] == 0
+
+    def test_profile_edit_misses(self, cache, prof_file):
+        OSCAL.load(prof_file).resolve(cache_directive=CacheDirective.forever())
+        edited = OSCAL.load(prof_file)
+        edited.set_metadata({"title": "Edited"})
+        edited.resolve(cache_directive=CacheDirective.forever())
+        assert edited.catalog._dict["catalog"]["metadata"]["title"] == "Edited"
+
+    def test_new_source_revision_misses(self, cache, prof_file, src_path):
+        OSCAL.load(prof_file).resolve(cache_directive=CacheDirective.forever())
+        doc = _source_catalog(last_modified="2026-02-01T00:00:00Z")
+        doc["catalog"]["groups"][0]["controls"][1]["title"] = "Revised"
+        _write(os.path.dirname(src_path), os.path.basename(src_path), doc)
+        get_registry().clear()                  # as in a new process: reload the source
+        again = OSCAL.load(prof_file)
+        again.resolve(cache_directive=CacheDirective.forever())
+        assert again.catalog.get_control_by_id("ac-2")["title"] == "Revised"
+
+    def test_source_edit_without_new_revision_misses(self, cache, prof_file, src_path):
+        OSCAL.load(prof_file).resolve(cache_directive=CacheDirective.forever())
+        doc = _source_catalog()                 # same uuid and last-modified
+        doc["catalog"]["groups"][0]["controls"][1]["title"] = "Edited in place"
+        _write(os.path.dirname(src_path), os.path.basename(src_path), doc)
+        get_registry().clear()
+        again = OSCAL.load(prof_file)
+        again.resolve(cache_directive=CacheDirective.forever())
+        assert again.catalog.get_control_by_id("ac-2")["title"] == "Edited in place"
+
+    def test_refresh_resolves_anew(self, cache, prof_file, monkeypatch):
+        OSCAL.load(prof_file).resolve(cache_directive=CacheDirective.forever())
+        calls = []
+        original = Profile._materialize_control_node
+        monkeypatch.setattr(Profile, "_materialize_control_node",
+                            lambda self, *a, **k: calls.append(1) or original(self, *a, **k))
+        OSCAL.load(prof_file).resolve(cache_directive=CacheDirective.refresh_now())
+        assert calls
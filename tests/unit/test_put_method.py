@@ -11,6 +11,7 @@ Covers:
     - guards: read-only and _dict is None both return False without mutating
     - dirty-state bookkeeping: is_unsaved set only on success
     - validate / check_refs opt-in hooks are invoked
+    - Catalog check_refs: replacing writes that would leave references dangling
     - _ensure_list / _as_index helpers
 """
 import pytest
@@ -218,6 +219,48 @@ class TestPutHooks:
         assert cat.put("metadata/title", "blocked", check_refs=True) is False
 
 
+# ===========================================================================
+# Catalog referential-integrity check (check_refs=True)
+# ===========================================================================
+class TestPutCheckRefs:
+
+    @pytest.fixture
+    def linked(self):
+        """'a' links to 'b'; 'b' has a statement whose prose inserts param 'b_prm'."""
+        c = Catalog.new("T")
+        c.create_control("[root]", "a", title="A")
+        c.insert_control("[root]", {
+            "id": "b", "title": "B",
+            "params": [{"id": "b_prm"}],
+            "parts": [{"id": "b_smt", "name": "statement", "prose": "{{ insert: param, b_prm }}"}],
+        })
+        _catalog(c)["controls"][0]["links"] = [{"href": "#b", "rel": "related"}]
+        return c
+
+    def test_renaming_referenced_id_blocked(self, linked):
+        assert linked.put("controls/1/id", "b2", check_refs=True) is False
+        assert _catalog(linked)["controls"][1]["id"] == "b"
+
+    def test_renaming_allowed_without_check(self, linked):
+        assert linked.put("controls/1/id", "b2") is True
+
+    def test_dropping_inserted_param_blocked(self, linked):
+        assert linked.put("controls/1/params", [], check_refs=True) is False
+
+    def test_references_inside_replaced_value_ignored(self, linked):
+        """Replacing the whole control drops its param together with the prose citing it."""
+        assert linked.put("controls/1", {"id": "b", "title": "B"}, check_refs=True) is True
+
+    def test_repointing_the_reference_itself_allowed(self, linked):
+        assert linked.put("controls/0/links/0/href", "#a", check_refs=True) is True
+
+    def test_unreferenced_id_may_change(self, linked):
+        assert linked.put("controls/0/id", "a2", check_refs=True) is True
+
+    def test_new_path_passes(self, linked):
+        assert linked.put("metadata/version", "2", check_refs=True) is True
+
+
 # ===========================================================================
 # Helpers: _ensure_list / _as_index
 # ===========================================================================
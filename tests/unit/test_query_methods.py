@@ -3,12 +3,19 @@ Unit tests for OSCAL dict-based query methods:
     - OSCAL.query()       — XML-element-name path syntax via OSCALPath/metaschema index
     - OSCAL.query_one()   — convenience wrapper returning the first match
     - OSCAL.json_query()  — JSON-key-name path syntax via NativePath
+    - OSCAL.iter_query() / iter_json_query() — lazy, early-terminating variants
+    - OSCAL.query_many() / json_query_many() — several paths in one traversal
+    - OSCAL.enable_prop_index() / find_props() — prop index and prop-predicate queries
 """
+import itertools
 import os
 
 import pytest
 
 from oscal import OSCAL, Catalog
+from oscal.oscal_converter import (
+    IdIndex, OSCALPath, PropIndex, _QueryCache, clear_query_cache, native_path, query_cache_info,
+)
 
 _HERE = os.path.dirname(__file__)
 _DATA = os.path.join(_HERE, "..", "test-data")
@@ -158,3 +165,353 @@ class TestQueryReturnsCopies:
     def test_json_query_one_default_returned_as_is(self, catalog):
         sentinel = object()
         assert catalog.json_query_one("//nonexistent-xyz", default=sentinel) is sentinel
+
+
+# ===========================================================================
+# Compiled-query cache shared by OSCALPath / NativePath
+# ===========================================================================
+class TestCompiledQueryCache:
+
+    def test_repeated_query_hits_cache(self, catalog):
+        """A repeated path is compiled once and then served from the cache."""
+        clear_query_cache()
+        first = catalog.query("//control[@id='ac-1']")
+        assert query_cache_info().misses == 1
+        assert catalog.query("//control[@id='ac-1']") == first
+        info = query_cache_info()
+        assert info.hits == 1 and info.entries == 1
+
+    def test_engines_share_index_and_queries(self, catalog):
+        """OSCALPath instances over the same model index share compiled queries."""
+        engine = catalog._path_engine
+        other = OSCALPath.from_support(catalog.model, catalog.oscal_version)
+        assert other._name_map is engine._name_map
+        clear_query_cache()
+        assert engine.query("/*/metadata/title", catalog._dict) == \
+            other.query("/*/metadata/title", catalog._dict)
+        assert query_cache_info().hits == 1
+
+    def test_native_queries_cached(self, catalog):
+        clear_query_cache()
+        catalog.json_query("//controls[id='ac-1']")
+        catalog.json_query("//controls[id='ac-1']")
+        assert query_cache_info().hits == 1
+
+    def test_clear_resets_counters(self):
+        native_path.query("a/b", {"a": {"b": 1}})
+        clear_query_cache()
+        assert query_cache_info() == (0, 0, 0, query_cache_info().max_entries)
+
+    def test_cache_is_bounded(self):
+        cache = _QueryCache(2)
+        for path in ("a", "b", "c"):
+            cache.put((None, path), ())
+        assert cache.get((None, "a")) is None
+        assert cache.get((None, "c")) == ()
+        assert cache.info().entries == 2
+
+    @pytest.mark.parametrize("path,expected", [
+        ("items[n>'9']/n", ["10", "x"]),
+        ("items[n<'9']/n", ["2"]),
+        ("items[n>='abc']/n", ["x"]),
+        ("items[not(n='2')]/n", ["10", "x"]),
+        ("items[n!='x'][n]/n", ["10", "2"]),
+    ])
+    def test_compiled_comparisons(self, path, expected):
+        """Ordering predicates compare numerically when both sides are numbers, else as strings."""
+        doc = {"items": [{"n": "10"}, {"n": "2"}, {"n": "x"}]}
+        assert native_path.query(path, doc) == expected
+
+
+# ===========================================================================
+# id/uuid index for leading //name[@id='v'] steps
+# ===========================================================================
+class TestIdIndex:
+
+    def test_index_lookup_matches_walk(self, catalog):
+        """An id lookup through the index returns the same live node as the walk."""
+        data = catalog._dict
+        index = IdIndex(data)
+        engine = catalog._path_engine
+        walked = engine.query("//control[@id='ac-2']", data)
+        indexed = engine.query("//control[@id='ac-2']", data, index)
+        assert len(walked) == 1 and indexed[0] is walked[0]
+        assert engine.query("//control[@id='ac-2']/title", data, index) == \
+            engine.query("//control[@id='ac-2']/title", data)
+
+    def test_query_is_planned(self, catalog):
+        assert catalog._path_engine._compiled("//control[@id='ac-2']").lookup is not None
+        assert catalog._path_engine._compiled("//control[@class='x']").lookup is None
+        assert native_path._compiled("//controls[id='ac-2']").lookup is not None
+
+    def test_entry_fields(self, catalog):
+        (entry,) = IdIndex(catalog._dict).lookup("id", "ac-2")
+        assert entry.key == "controls"
+        assert entry.parent[entry.path[-1]] is entry.node
+        assert entry.path[0] == "catalog"
+
+    def test_document_order_with_duplicate_ids(self):
+        doc = {"controls": [{"id": "a", "n": 1, "controls": [{"id": "a", "n": 3}]},
+                            {"id": "a", "n": 2}]}
+        index = IdIndex(doc)
+        assert native_path.query("//controls[id='a']/n", doc, index) == [1, 2, 3]
+        assert native_path.query("//controls[id='a'][n>'1']/n", doc, index) == [2, 3]
+
+    def test_index_ignored_for_other_roots(self):
+        doc = {"controls": [{"id": "a"}]}
+        index = IdIndex({"controls": [{"id": "b"}]})
+        assert native_path.query("//controls[id='a']", doc, index) == [{"id": "a"}]
+
+    def test_built_lazily_and_reset_on_mutation(self, new_catalog):
+        new_catalog.create_control_group("[root]", "ac", title="Access Control")
+        index = new_catalog._document_id_index()
+        assert index._entries is None
+        assert len(new_catalog.query("//group[@id='ac']")) == 1
+        assert index._entries is not None
+        assert new_catalog.query("//control[@id='ac-1']") == []
+        new_catalog.create_control("ac", "ac-1", title="Policy")
+        assert new_catalog._document_id_index() is index          # patched, not rebuilt
+        assert new_catalog.query_one("//control[@id='ac-1']/title") == "Policy"
+        new_catalog._content_changed()
+        assert new_catalog._document_id_index() is not index
+
+    def test_patched_by_put_and_catalog_mutators(self):
+        cat = OSCAL.load(_JSON_CATALOG)
+        index = cat._document_id_index()
+        group_id = cat._dict["catalog"]["groups"][0]["id"]
+        assert cat.query("//control[@id='zz-1']") == []
+        assert cat.insert_control(group_id, {"id": "zz-1", "title": "New"})
+        assert cat.put("groups/0/controls/0/id", "zz-2")
+        assert cat.add_part("zz-1", "statement", part_id="zz-1_smt", prose="Text.")
+        assert cat._document_id_index() is index
+        assert cat.query_one("//control[@id='zz-1']/title") == "New"
+        (renamed,) = cat._query("//control[@id='zz-2']")
+        assert renamed is cat._dict["catalog"]["groups"][0]["controls"][0]
+        (entry,) = index.lookup("id", "zz-1_smt")
+        assert entry.path == IdIndex(cat._dict).lookup("id", "zz-1_smt")[0].path
+        assert entry.path[-2:] == ("parts", 0)
+        assert cat.remove("zz-1", cascade=True).get("blocked_by") is None
+        assert cat._document_id_index() is index
+        assert cat.query("//control[@id='zz-1']") == [] == cat.query("//part[@id='zz-1_smt']")
+        for node_id in ("zz-2", "ac-3", "ac-2_smt.a"):
+            fresh = IdIndex(cat._dict).lookup("id", node_id)
+            assert [e.path for e in index.lookup("id", node_id)] == [e.path for e in fresh]
+
+
+# ===========================================================================
+# Schema-aware pruning of descendant searches
+# ===========================================================================
+class TestDescendantPruning:
+
+    def test_control_search_skips_metadata_and_back_matter(self, catalog):
+        pruned = catalog._path_engine._index.pruned_keys("control")
+        assert {"metadata", "back-matter"} <= pruned
+        assert "controls" not in pruned and "groups" not in pruned
+
+    def test_param_search_skips_metadata_and_back_matter(self, catalog):
+        assert {"metadata", "back-matter"} <= catalog._path_engine._index.pruned_keys("param")
+
+    def test_unknown_name_is_not_pruned(self, catalog):
+        assert catalog._path_engine._index.pruned_keys("no-such-element") == frozenset()
+
+    def test_pruned_branch_is_not_searched(self, catalog):
+        """Content the schema does not allow under a key is not visited."""
+        doc = {"catalog": {"back-matter": {"controls": [{"id": "stray"}]},
+                           "controls": [{"id": "ac-1"}]}}
+        assert [c["id"] for c in catalog._path_engine.query("//control", doc)] == ["ac-1"]
+
+    def test_pruned_results_match_full_walk(self, catalog):
+        engine = catalog._path_engine
+        for name in ("control", "param", "part", "prop", "link"):
+            walked = native_path.query(f"//{engine._name_map[name][0]['json_key']}", catalog._dict)
+            assert engine.query(f"//{name}", catalog._dict) == walked
+
+    def test_id_lookup_skips_pruned_branch(self, catalog):
+        """The id-index rewrite drops matches the pruned walk would not reach."""
+        doc = {"catalog": {"back-matter": {"controls": [{"id": "ac-1"}]},
+                           "controls": [{"id": "ac-1", "title": "Kept"}]}}
+        engine = catalog._path_engine
+        indexed = engine.query("//control[@id='ac-1']", doc, IdIndex(doc))
+        assert indexed == engine.query("//control[@id='ac-1']", doc)
+        assert [c.get("title") for c in indexed] == ["Kept"]
+
+
+# ===========================================================================
+# Lazy iteration: iter_query() / iter_json_query()
+# ===========================================================================
+class TestIterQuery:
+
+    def test_iter_query_matches_query(self, catalog):
+        it = catalog.iter_query("//control[prop]")
+        assert not isinstance(it, list)
+        assert list(it) == catalog.query("//control[prop]")
+
+    def test_iter_json_query_matches_json_query(self, catalog):
+        assert list(catalog.iter_json_query("//parts[name='statement']")) == \
+            catalog.json_query("//parts[name='statement']")
+
+    def test_pagination_with_islice(self, catalog):
+        page = list(itertools.islice(catalog.iter_query("//prop/@name"), 5, 10))
+        assert page == catalog.query("//prop/@name")[5:10]
+
+    def test_results_are_copies(self, catalog):
+        first = next(catalog.iter_query("//group"))
+        first["title"] = "MUTATED"
+        assert catalog.query_one("//group")["title"] != "MUTATED"
+
+    def test_no_dict_yields_nothing(self):
+        assert list(OSCAL.loads("").iter_json_query("//controls")) == []
+
+    def test_stops_after_first_match(self):
+        """The engines produce matches on demand; later branches are never visited."""
+        visited = []
+
+        class Probe(dict):
+            def items(self):
+                visited.append(self["id"])
+                return super().items()
+
+        doc = {"controls": [Probe(id="a", controls=[Probe(id="a1")]), Probe(id="b")]}
+        assert native_path.query_one("//controls", doc)["id"] == "a"
+        assert visited == []
+        assert [c["id"] for c in native_path.iter_query("//controls", doc)] == ["a", "b", "a1"]
+
+    def test_lazy_order_matches_eager(self):
+        doc = {"controls": [{"id": "a", "controls": [{"id": "a1"}], "parts": [{"id": "p"}]},
+                            {"id": "b", "parts": [{"id": "q", "parts": [{"id": "r"}]}]}]}
+        for path in ("//controls//parts/id", "//parts", "controls/parts[parts]/id", "//*/id"):
+            assert list(native_path.iter_query(path, doc)) == native_path.query(path, doc)
+
+
+# ===========================================================================
+# Multi-query evaluation: query_many() / json_query_many()
+# ===========================================================================
+class TestQueryMany:
+
+    _PATHS = {
+        "controls": "//control",
+        "labels": "//prop[@name='label']/@value",
+        "by_id": "//control[@id='ac-2']/title",
+        "title": "/catalog/metadata/title",
+        "statements": "//part[@name='statement']",
+        "params": "//param/@id",
+    }
+
+    def test_matches_individual_queries(self, catalog):
+        many = catalog.query_many(self._PATHS)
+        assert list(many) == list(self._PATHS)
+        for name, path in self._PATHS.items():
+            assert many[name] == catalog.query(path), name
+
+    def test_json_query_many_matches_json_query(self, catalog):
+        paths = {"c": "//controls", "p": "//parts[name='statement']/id", "g": "/*/groups/id"}
+        many = catalog.json_query_many(paths)
+        assert {name: catalog.json_query(path) for name, path in paths.items()} == many
+
+    def test_repeated_paths_get_separate_lists(self, catalog):
+        many = catalog.query_many({"a": "//group/@id", "b": "//group/@id"})
+        assert many["a"] == many["b"] and many["a"] is not many["b"]
+
+    def test_results_are_copies(self, catalog):
+        many = catalog.query_many({"g": "//group"})
+        many["g"][0]["title"] = "MUTATED"
+        assert catalog.query_one("//group")["title"] != "MUTATED"
+
+    def test_no_dict_returns_empty_lists(self):
+        assert OSCAL.loads("").json_query_many({"a": "//controls"}) == {"a": []}
+
+    def test_shared_walk_respects_each_query(self):
+        """Each descendant step collects only where its own walk would, in its own order."""
+        doc = {"controls": [{"id": "a", "parts": [{"id": "p", "parts": [{"id": "q"}]}]},
+                            {"id": "b", "controls": [{"id": "b1"}]}],
+               "$schema": {"controls": [{"id": "skipped"}]}}
+        paths = {"c": "//controls/id", "p": "//parts/id", "all": "//id", "first": "//controls[1]/id"}
+        many = native_path.query_many(paths, doc)
+        assert many == {name: native_path.query(path, doc) for name, path in paths.items()}
+        assert "skipped" not in many["all"]
+
+
+# ===========================================================================
+# Prop index: PropIndex / enable_prop_index() / find_props()
+# ===========================================================================
+class TestPropIndex:
+
+    @pytest.fixture
+    def indexed(self):
+        cat = OSCAL.load(_JSON_CATALOG)
+        cat.enable_prop_index()
+        return cat
+
+    @pytest.mark.parametrize("path", [
+        "//control[prop[@name='implementation-level'][@value='organization']]/@id",
+        "//control[prop/@name='label']/title",
+        "//part[prop[@name='response-point']]",
+        "//control[prop[@name='label']][link]/@id",
+        "//group[prop[@name='nope']]",
+    ])
+    def test_planned_queries_match_walk(self, indexed, path):
+        engine = indexed._path_engine
+        assert engine._compiled(path).prop_lookup is not None
+        walked = engine.query(path, indexed._dict)
+        assert indexed._query(path) == walked
+        assert [id(v) for v in indexed._query(path)] == [id(v) for v in walked]
+
+    def test_native_planned_query_matches_walk(self):
+        doc = {"catalog": {"controls": [
+            {"id": "a", "props": [{"name": "status", "value": "withdrawn"}],
+             "controls": [{"id": "a1", "props": [{"name": "status", "value": "x"}]}]},
+            {"id": "b", "props": [{"name": "label", "value": "B"}]}]}}
+        index = PropIndex(doc)
+        for path in ("//controls[props[name='status']]/id", "//controls[props/@name='label']/id"):
+            assert native_path.query(path, doc, prop_index=index) == native_path.query(path, doc)
+        assert native_path.query("//controls[props[name='status']]/id", doc, prop_index=index) == ["a", "a1"]
+
+    def test_find_props(self, indexed):
+        found = indexed.find_props("label")
+        assert len(found) == len(indexed.query("//prop[@name='label']"))
+        owner, prop = found[0]
+        assert prop in owner["props"] and prop["name"] == "label"
+        assert indexed.find_props("label", class_="no-such-class") == []
+        plain = OSCAL.load(_JSON_CATALOG)
+        assert plain.find_props("label") == found       # walks without an index
+
+    def test_put_patches_index(self, indexed):
+        index = indexed._document_prop_index()
+        before = len(indexed.find_props("status"))
+        assert indexed.put("groups/0/controls/0/props", {"name": "status", "value": "new"}, mode="insert")
+        assert indexed._prop_index is index             # patched, not rebuilt
+        assert len(indexed.find_props("status")) == before + 1
+        ctrl_id = indexed._dict["catalog"]["groups"][0]["controls"][0]["id"]
+        assert ctrl_id in indexed.query("//control[prop[@name='status'][@value='new']]/@id")
+
+    def test_put_replacing_prop_name(self, indexed):
+        assert indexed.put("groups/0/controls/0/props/0/name", "renamed")
+        assert [p["name"] for _, p in indexed.find_props("renamed")] == ["renamed"]
+        fresh = PropIndex(indexed._dict)
+        assert len(fresh.lookup("label")) == len(indexed.find_props("label"))
+
+    def test_catalog_mutators_patch_index(self, indexed):
+        index = indexed._document_prop_index()
+        group_id = indexed._dict["catalog"]["groups"][0]["id"]
+        assert indexed.insert_control(group_id, {
+            "id": "zz-1", "title": "New", "props": [{"name": "status", "value": "new"}]}, validate=False)
+        assert indexed.set_label("zz-1", "ZZ-1")
+        ctrl_id = indexed._dict["catalog"]["groups"][0]["controls"][0]["id"]
+        assert indexed.set_label(ctrl_id, "")
+        assert indexed._prop_index is index             # patched, not rebuilt
+        assert indexed.query("//control[prop[@name='status'][@value='new']]/@id") == ["zz-1"]
+        assert "ZZ-1" in [p["value"] for _, p in indexed.find_props("label")]
+        fresh = PropIndex(indexed._dict)
+        for name in ("label", "status"):
+            assert [(id(e.owner), id(e.prop)) for e in index.lookup(name)] == \
+                [(id(e.owner), id(e.prop)) for e in fresh.lookup(name)]
+
+    def test_other_mutations_rebuild(self, indexed):
+        index = indexed._document_prop_index()
+        indexed._content_changed()
+        assert indexed._prop_index is not index
+        assert len(indexed.find_props("label")) == len(PropIndex(indexed._dict).lookup("label"))
+
+    def test_disable(self, indexed):
+        indexed.disable_prop_index()
+        assert indexed._document_prop_index() is None
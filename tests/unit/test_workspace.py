@@ -9,6 +9,7 @@ Covers:
         - document tracking, close / close_all
         - new() creates and tracks a document
         - project metadata (title, remarks, extensible attributes)
+        - federated_query spans roots and imports, each document once
     Save / load:
         - round-trips project metadata
         - round-trips documents (roots + imports) with content and state
@@ -57,6 +58,18 @@ class TestInjectionAndSharing:
         assert wsA.open(_PROFILE) is not wsB.open(_PROFILE)
 
 
+class TestFederatedQuery:
+
+    def test_spans_roots_and_imports_once(self):
+        ws = Workspace()
+        left = ws.open(os.path.join(_IMPORTS, "diamond_left.xml"))
+        right = ws.open(os.path.join(_IMPORTS, "diamond_right.xml"))
+        cat = left.import_list[0]["object"]
+        assert right.import_list[0]["object"] is cat        # shared import
+        hits = ws.federated_query("/*/metadata/title")
+        assert [h["object_uuid"] for h in hits] == [left.uuid, cat.uuid, right.uuid]
+
+
 class TestTracking:
 
     def test_documents_lists_open_roots(self):